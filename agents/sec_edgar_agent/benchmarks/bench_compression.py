@@ -0,0 +1,104 @@
+"""
+Benchmark the CPU-vs-bytes tradeoff of response compression for typical tool payloads.
+
+Payloads are synthetic but shaped like the largest tool responses: a multi-year
+``get_financials`` statement, a ``get_filing_content`` text body and an
+``analyze_form4_transactions`` list. Each is compressed whole and as an SSE stream
+flushed every event, the way ``CompressionMiddleware`` sends it.
+
+Run from agents/sec_edgar_agent:
+    python -m benchmarks.bench_compression [--repeat 5]
+"""
+
+import argparse
+import json
+import random
+import timeit
+
+from sec_edgar_mcp.utils.compression import _StreamCompressor, compress_bytes, zstandard
+
+LEVELS = [("gzip", 1), ("gzip", 6), ("gzip", 9), ("zstd", 1), ("zstd", 3), ("zstd", 9), ("zstd", 19)]
+
+
+def financials_payload(rng):
+    periods = [f"{year}-12-31" for year in range(2015, 2025)]
+    concepts = [f"us-gaap_Concept{i}AndRelatedItems" for i in range(400)]
+    statement = {
+        concept: {period: round(rng.uniform(-5e9, 5e9), 2) for period in periods} for concept in concepts
+    }
+    return json.dumps({"success": True, "cik": "0000320193", "statements": {"income": statement}}).encode()
+
+
+def filing_content_payload(rng):
+    words = (
+        "revenue net sales operating income fiscal quarter risk factors liquidity capital resources "
+        "customers products services segment results compared increase decrease primarily due to"
+    ).split()
+    paragraphs = [" ".join(rng.choice(words) for _ in range(120)) for _ in range(400)]
+    return json.dumps({"success": True, "content": "\n\n".join(paragraphs)}).encode()
+
+
+def form4_payload(rng):
+    transactions = [
+        {
+            "transaction_date": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "security_title": "Common Stock",
+            "transaction_type": rng.choice(["S", "P", "M", "F", "A"]),
+            "shares": rng.randint(100, 100000),
+            "price_per_share": round(rng.uniform(50, 250), 2),
+            "owner_name": rng.choice(["COOK TIMOTHY D", "MAESTRI LUCA", "WILLIAMS JEFFREY E", "ADAMS KATHERINE L"]),
+            "accession_number": f"0000320193-24-{rng.randint(0, 999999):06d}",
+        }
+        for _ in range(1500)
+    ]
+    return json.dumps({"success": True, "transactions": transactions}).encode()
+
+
+def sse_events(payload, event_size=16384):
+    """Split a payload into SSE-framed events, as a streamed tool response would be."""
+    return [b"event: message\ndata: " + payload[i : i + event_size] + b"\n\n" for i in range(0, len(payload), event_size)]
+
+
+def compress_stream(events, encoding, level):
+    compressor = _StreamCompressor(encoding, gzip_level=level, zstd_level=level)
+    return sum(len(compressor.compress(event, flush=True)) for event in events) + len(compressor.finish())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    payloads = {
+        "get_financials": financials_payload(rng),
+        "get_filing_content": filing_content_payload(rng),
+        "analyze_form4_transactions": form4_payload(rng),
+    }
+    levels = [(encoding, level) for encoding, level in LEVELS if encoding == "gzip" or zstandard is not None]
+
+    for name, payload in payloads.items():
+        events = sse_events(payload)
+        print(f"\n{name}: {len(payload) / 1024:.1f} KiB uncompressed, {len(events)} SSE events")
+        print(f"{'codec':<10} {'ratio':>7} {'ms':>8} {'MB/s':>8} {'sse ratio':>10} {'sse ms':>8}")
+        for encoding, level in levels:
+            seconds = min(
+                timeit.repeat(
+                    lambda: compress_bytes(payload, encoding, gzip_level=level, zstd_level=level),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            size = len(compress_bytes(payload, encoding, gzip_level=level, zstd_level=level))
+            stream_seconds = min(
+                timeit.repeat(lambda: compress_stream(events, encoding, level), number=1, repeat=args.repeat)
+            )
+            stream_size = compress_stream(events, encoding, level)
+            print(
+                f"{encoding + '-' + str(level):<10} {len(payload) / size:7.2f} {seconds * 1e3:8.2f} "
+                f"{len(payload) / seconds / 1e6:8.1f} {len(payload) / stream_size:10.2f} {stream_seconds * 1e3:8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
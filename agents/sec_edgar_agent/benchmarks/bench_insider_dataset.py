@@ -0,0 +1,106 @@
+"""
+Benchmark the insider data set store: ingest of a synthetic quarterly archive and vectorized queries over it.
+
+The default size approximates one real quarter (about 60,000 filings and 200,000 transactions
+across 6,000 issuers).
+
+Run from agents/sec_edgar_agent:
+    python -m benchmarks.bench_insider_dataset [--filings 60000] [--rows 3]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import timeit
+import zipfile
+from datetime import date, timedelta
+
+import numpy as np
+
+from sec_edgar_mcp.insider_dataset import InsiderDataset, ingest_quarter
+
+SUBMISSION_HEADER = (
+    "ACCESSION_NUMBER\tFILING_DATE\tPERIOD_OF_REPORT\tDOCUMENT_TYPE\tISSUERCIK\tISSUERNAME\tISSUERTRADINGSYMBOL"
+)
+OWNER_HEADER = "ACCESSION_NUMBER\tRPTOWNERCIK\tRPTOWNERNAME\tRPTOWNER_RELATIONSHIP\tRPTOWNER_TITLE"
+TRANSACTION_HEADER = (
+    "ACCESSION_NUMBER\tNONDERIV_TRANS_SK\tSECURITY_TITLE\tTRANS_DATE\tTRANS_FORM_TYPE\tTRANS_CODE\tTRANS_SHARES\t"
+    "TRANS_PRICEPERSHARE\tTRANS_ACQUIRED_DISP_CD\tSHRS_OWND_FOLWNG_TRANS\tDIRECT_INDIRECT_OWNERSHIP"
+)
+RELATIONSHIPS = np.array(["Officer", "Director", "Director,Officer", "TenPercentOwner", "Other"])
+CODES = np.array(["S", "S", "S", "M", "F", "A", "P", "G"])
+
+
+def make_quarter(path: str, filings: int, rows: int, issuers: int, seed: int = 11) -> None:
+    """Write a synthetic ``<quarter>_form345.zip`` with the data set's file layout and date format."""
+    rng = np.random.default_rng(seed)
+    start = date(2024, 1, 2)
+    days = [(start + timedelta(days=int(d))).strftime("%d-%b-%Y").upper() for d in range(91)]
+    issuer = rng.integers(0, issuers, filings)
+    owner = rng.integers(0, issuers * 8, filings)
+    filed = rng.integers(0, 91, filings)
+
+    submissions = [SUBMISSION_HEADER]
+    owners = [OWNER_HEADER]
+    transactions = [TRANSACTION_HEADER]
+    derivative = [TRANSACTION_HEADER.replace("NONDERIV", "DERIV")]
+    for i in range(filings):
+        accession = f"0000{1000000 + i:06d}-24-{i:06d}"
+        submissions.append(
+            f"{accession}\t{days[filed[i]]}\t{days[filed[i]]}\t4\t{100000 + issuer[i]}\t"
+            f"Issuer {issuer[i]} Inc\tT{issuer[i]}"
+        )
+        owners.append(f"{accession}\t{2000000 + owner[i]}\tOwner{owner[i]} Person\t{RELATIONSHIPS[owner[i] % 5]}\tCFO")
+        for j in range(rows):
+            code = CODES[(i + j) % len(CODES)]
+            transactions.append(
+                f"{accession}\t{i * rows + j}\tCommon Stock\t{days[max(filed[i] - 2, 0)]}\t4\t{code}\t"
+                f"{100 + j * 10}\t{50 + j:.2f}\t{'A' if code in 'PAM' else 'D'}\t{10000 - j}\tD"
+            )
+        derivative.append(f"{accession}\t{i}\tStock Option\t{days[filed[i]]}\t4\tM\t500\t\tD\t1000\tD")
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("SUBMISSION.tsv", "\n".join(submissions) + "\n")
+        archive.writestr("REPORTINGOWNER.tsv", "\n".join(owners) + "\n")
+        archive.writestr("NONDERIV_TRANS.tsv", "\n".join(transactions) + "\n")
+        archive.writestr("DERIV_TRANS.tsv", "\n".join(derivative) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filings", type=int, default=60000)
+    parser.add_argument("--rows", type=int, default=3, help="Non-derivative transactions per filing")
+    parser.add_argument("--issuers", type=int, default=6000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        archive = os.path.join(directory, "2024q1_form345.zip")
+        make_quarter(archive, args.filings, args.rows, args.issuers)
+
+        started = time.perf_counter()
+        entry = ingest_quarter(archive, os.path.join(directory, "dataset"))
+        print(
+            f"ingest {entry['transactions']:,} transactions, {entry['filings']:,} filings "
+            f"in {(time.perf_counter() - started) * 1e3:.0f} ms"
+        )
+
+        dataset = InsiderDataset(os.path.join(directory, "dataset"))
+        queries = {
+            "issuer by ticker": dict(issuer="T42"),
+            "issuer by CIK, P/S only": dict(issuer="100042", transaction_codes=["P", "S"]),
+            "owner by CIK": dict(owner="2000042"),
+            "owner by name prefix": dict(owner="OWNER42 PERSON"),
+            "all open-market sales in March": dict(
+                transaction_codes=["S"], since=date(2024, 3, 1), until=date(2024, 3, 31), include_derivative=False
+            ),
+        }
+        for label, query in queries.items():
+            rows = len(dataset.query(**query))
+            seconds = min(timeit.repeat(lambda: dataset.query(**query), number=1, repeat=args.repeat))
+            print(f"{label:<32} {seconds * 1e3:9.1f} ms  {rows:>8,} rows")
+
+
+if __name__ == "__main__":
+    main()
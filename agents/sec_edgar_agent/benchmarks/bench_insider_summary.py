@@ -0,0 +1,131 @@
+"""
+Benchmark insider summary aggregation: per-filing ``iterrows`` with keyword matching vs one vectorized group-by.
+
+The default sizes approximate a high-volume issuer's year of Form 4s (about 1,200 filings
+from 40 insiders, several transactions each).
+
+Run from agents/sec_edgar_agent:
+    python -m benchmarks.bench_insider_summary [--filings 1200] [--rows 6]
+"""
+
+import argparse
+import timeit
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from sec_edgar_mcp.insider_analytics import summarize_insider_activity
+from sec_edgar_mcp.ownership_parser import TRANSACTION_CODES
+
+CODES = np.array(["S", "S", "S", "M", "F", "A", "P", "G"])
+
+
+def make_transactions(filings: int, rows: int, insiders: int, seed: int = 7) -> pd.DataFrame:
+    """One row per transaction, as the insider store returns them."""
+    rng = np.random.default_rng(seed)
+    total = filings * rows
+    filing_index = np.repeat(np.arange(filings), rows)
+    start = date(2024, 1, 2)
+    return pd.DataFrame(
+        {
+            "accession_number": [f"0000320193-24-{i:06d}" for i in filing_index],
+            "transaction_date": [(start + timedelta(days=int(i) * 365 // filings)).isoformat() for i in filing_index],
+            "owner_name": [f"Insider {i % insiders}" for i in filing_index],
+            "transaction_code": CODES[rng.integers(0, len(CODES), total)],
+            "shares": rng.integers(100, 50_000, total).astype(np.float64),
+            "price_per_share": rng.uniform(150, 250, total).round(2),
+            "is_holding": np.zeros(total, dtype=bool),
+        }
+    )
+
+
+def per_filing_frames(transactions: pd.DataFrame):
+    """The previous input: one owner name and one DataFrame per filing, with edgartools-style type labels."""
+    frames = []
+    for _, group in transactions.groupby("accession_number", sort=False):
+        frame = pd.DataFrame(
+            {
+                "transaction_date": pd.to_datetime(group["transaction_date"]),
+                "transaction_type": group["transaction_code"].map(TRANSACTION_CODES).fillna(""),
+                "shares": group["shares"],
+                "total_value": group["shares"] * group["price_per_share"],
+            }
+        )
+        frames.append((group["owner_name"].iloc[0], frame))
+    return frames
+
+
+def iterrows_summary(frames):
+    """The previous aggregation loop: ``iterrows`` with keyword matching and nested dict updates."""
+    summary = {
+        "total_transactions": 0,
+        "buy_transactions": 0,
+        "sell_transactions": 0,
+        "total_shares_bought": 0,
+        "total_shares_sold": 0,
+        "total_value_bought": 0,
+        "total_value_sold": 0,
+        "unique_insiders": set(),
+        "by_insider": {},
+        "recent_activity": [],
+    }
+    for owner_name, df in frames:
+        summary["unique_insiders"].add(owner_name)
+        insider = summary["by_insider"].setdefault(
+            owner_name, {"transactions": 0, "shares_bought": 0, "shares_sold": 0, "value_bought": 0, "value_sold": 0}
+        )
+        for _, row in df.iterrows():
+            summary["total_transactions"] += 1
+            insider["transactions"] += 1
+            shares = float(row.get("shares", 0))
+            value = float(row.get("total_value", 0)) if row.get("total_value") else 0
+            transaction_type = row.get("transaction_type", "").upper()
+            if any(keyword in transaction_type for keyword in ["BUY", "PURCHASE", "ACQUIRE", "GRANT"]):
+                summary["buy_transactions"] += 1
+                summary["total_shares_bought"] += shares
+                summary["total_value_bought"] += value
+                insider["shares_bought"] += shares
+                insider["value_bought"] += value
+            elif any(keyword in transaction_type for keyword in ["SELL", "SALE", "DISPOSE"]):
+                summary["sell_transactions"] += 1
+                summary["total_shares_sold"] += shares
+                summary["total_value_sold"] += value
+                insider["shares_sold"] += shares
+                insider["value_sold"] += value
+            if len(summary["recent_activity"]) < 10:
+                summary["recent_activity"].append(
+                    {"date": row["transaction_date"].isoformat(), "insider": owner_name, "type": transaction_type}
+                )
+    summary["unique_insiders"] = len(summary["unique_insiders"])
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filings", type=int, default=1200)
+    parser.add_argument("--rows", type=int, default=6, help="Transactions per filing")
+    parser.add_argument("--insiders", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    transactions = make_transactions(args.filings, args.rows, args.insiders)
+    frames = per_filing_frames(transactions)
+    print(f"{args.filings} filings, {len(transactions)} transactions, {args.insiders} insiders, best of {args.repeat}")
+
+    loop_seconds = min(timeit.repeat(lambda: iterrows_summary(frames), number=1, repeat=args.repeat))
+    vector_seconds = min(
+        timeit.repeat(lambda: summarize_insider_activity(transactions), number=1, repeat=args.repeat)
+    )
+    print(f"{'iterrows + keyword matching':<32} {loop_seconds * 1e3:9.1f} ms")
+    print(f"{'vectorized group-by':<32} {vector_seconds * 1e3:9.1f} ms  ({loop_seconds / vector_seconds:.0f}x)")
+
+    summary = summarize_insider_activity(transactions)
+    print(
+        f"buys {summary['buy_transactions']}, sells {summary['sell_transactions']}, "
+        f"net shares {summary['net_shares']:,}, buy/sell ratio {summary['buy_sell_ratio']:.3f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
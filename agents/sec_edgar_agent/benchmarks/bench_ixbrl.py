@@ -0,0 +1,172 @@
+"""
+Benchmark inline XBRL extraction: one streaming parse into a fact table against a regex scan per concept.
+
+The synthetic document has the shape of a large 10-K (thousands of contexts and facts spread
+through a few MB of HTML). The regex extractor is the one ``FinancialTools`` used before the
+fact table: it rescans the whole document for every concept (three times over for a concept
+that is not tagged), takes the first match and ignores ``sign``, ``format`` and dimensions.
+
+Run from agents/sec_edgar_agent:
+    python -m benchmarks.bench_ixbrl [--facts 4000] [--padding 2000]
+"""
+
+import argparse
+import re
+import time
+
+from sec_edgar_mcp.ixbrl_parser import parse_inline_xbrl
+
+# The concepts ``FinancialTools`` extracts from every filing; some are missing from the synthetic document
+CONCEPTS = [
+    "Revenues",
+    "RevenueFromContractWithCustomerExcludingAssessedTax",
+    "CostOfRevenue",
+    "CostOfGoodsAndServicesSold",
+    "GrossProfit",
+    "OperatingExpenses",
+    "OperatingIncomeLoss",
+    "NetIncomeLoss",
+    "EarningsPerShareBasic",
+    "EarningsPerShareDiluted",
+    "Assets",
+    "AssetsCurrent",
+    "AssetsNoncurrent",
+    "CashAndCashEquivalentsAtCarryingValue",
+    "AccountsReceivableNetCurrent",
+    "InventoryNet",
+    "PropertyPlantAndEquipmentNet",
+    "Goodwill",
+    "Liabilities",
+    "LiabilitiesCurrent",
+    "LiabilitiesNoncurrent",
+    "AccountsPayableCurrent",
+    "LongTermDebtNoncurrent",
+    "StockholdersEquity",
+    "CommonStockValue",
+    "RetainedEarningsAccumulatedDeficit",
+    "NetCashProvidedByUsedInOperatingActivities",
+    "NetCashProvidedByUsedInInvestingActivities",
+    "NetCashProvidedByUsedInFinancingActivities",
+    "CommonStockSharesOutstanding",
+    "CommonStockSharesIssued",
+]
+TAGGED = [concept for i, concept in enumerate(CONCEPTS) if i % 4 != 3]
+
+CONTEXT = (
+    '<xbrli:context id="c-{i}"><xbrli:entity><xbrli:identifier scheme="http://www.sec.gov/CIK">0000320193'
+    "</xbrli:identifier>{segment}</xbrli:entity><xbrli:period><xbrli:startDate>{start}</xbrli:startDate>"
+    "<xbrli:endDate>{end}</xbrli:endDate></xbrli:period></xbrli:context>\n"
+)
+SEGMENT = (
+    '<xbrli:segment><xbrldi:explicitMember dimension="us-gaap:StatementBusinessSegmentsAxis">'
+    "aapl:Segment{i}Member</xbrldi:explicitMember></xbrli:segment>"
+)
+FACT = (
+    '<tr><td style="padding:0 1pt">Line item {i}</td><td style="text-align:right">{open}<ix:nonFraction '
+    'unitRef="usd" contextRef="c-{context}" decimals="-6" name="us-gaap:{name}" format="ixt:num-dot-decimal" '
+    'scale="6"{sign} id="f-{i}">{value:,}</ix:nonFraction>{close}</td></tr>\n'
+)
+PADDING = '<p style="margin-top:6pt">' + "Discussion of results and risk factors. " * 10 + "</p>\n"
+
+
+def make_document(facts: int, padding: int) -> str:
+    """A 10-K-shaped inline XBRL document; the first three contexts are the last three fiscal years.
+
+    Segment facts (contexts with a dimension) fill the notes, followed by the consolidated
+    statements with every tagged concept for each year.
+    """
+    years = [("2023-10-01", "2024-09-28"), ("2022-09-25", "2023-09-30"), ("2021-09-26", "2022-09-24")]
+    contexts = [
+        CONTEXT.format(i=i, start=years[i % 3][0], end=years[i % 3][1], segment=SEGMENT.format(i=i) if i > 2 else "")
+        for i in range(max(facts // 4, 4))
+    ]
+    body = [
+        '<ix:nonNumeric name="dei:DocumentType" contextRef="c-0">10-K</ix:nonNumeric>',
+        '<ix:nonNumeric name="dei:DocumentPeriodEndDate" contextRef="c-0">September 28, 2024</ix:nonNumeric>',
+    ]
+    statements = [(concept, year) for concept in TAGGED for year in range(3)]
+    notes = [(TAGGED[i % len(TAGGED)], 3 + (i * 7) % (len(contexts) - 3)) for i in range(facts - len(statements))]
+    for i, (name, context) in enumerate(notes + statements):
+        negative = i % 5 == 0
+        body.append(
+            FACT.format(
+                i=i,
+                name=name,
+                context=context,
+                value=1000 + i * 37,
+                sign=' sign="-"' if negative else "",
+                open="(" if negative else "",
+                close=")" if negative else "",
+            )
+        )
+        if padding and i % max(facts // padding, 1) == 0:
+            body.append(PADDING)
+    return (
+        '<html xmlns:ix="http://www.xbrl.org/2013/inlineXBRL"><body><div style="display:none"><ix:header>'
+        '<ix:resources><xbrli:unit id="usd"><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unit>\n'
+        + "".join(contexts)
+        + "</ix:resources></ix:header></div>\n"
+        + "".join(body)
+        + "</body></html>"
+    )
+
+
+def regex_extract(filing_content: str, concept: str):
+    """The previous per-concept regex extraction, for comparison."""
+    patterns = [
+        rf'<ix:nonFraction[^>]*name="[^"]*:{re.escape(concept)}"[^>]*>([^<]+)</ix:nonFraction>',
+        rf'<ix:nonFraction[^>]*name="{re.escape(concept)}"[^>]*>([^<]+)</ix:nonFraction>',
+        rf'<ix:nonFraction[^>]*name="[^"]*{re.escape(concept)}[^"]*"[^>]*>([^<]+)</ix:nonFraction>',
+    ]
+    for pattern in patterns:
+        for match in re.finditer(pattern, filing_content, re.IGNORECASE | re.DOTALL):
+            value_text = match.group(1).strip()
+            numeric_value = float(re.sub(r"[,$()]", "", value_text))
+            scale_match = re.search(r'scale="(-?\d+)"', match.group(0))
+            scale = int(scale_match.group(1)) if scale_match else 0
+            context_ref = re.search(r'contextRef="([^"]+)"', match.group(0)).group(1)
+            context_pattern = rf'<xbrli:context[^>]*id="{re.escape(context_ref)}"[^>]*>(.*?)</xbrli:context>'
+            context = re.search(context_pattern, filing_content, re.DOTALL)
+            end = re.search(r"<xbrli:endDate>([^<]+)</xbrli:endDate>", context.group(1)) if context else None
+            return {"value": numeric_value * (10**scale), "period": end.group(1) if end else None}
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--facts", type=int, default=4000)
+    parser.add_argument("--padding", type=int, default=2000, help="Paragraphs of narrative text between facts")
+    args = parser.parse_args()
+
+    document = make_document(args.facts, args.padding)
+    encoded = document.encode("utf-8")
+    print(f"document: {len(encoded) / 1e6:.1f} MB, {args.facts:,} facts")
+
+    started = time.perf_counter()
+    old = {concept: regex_extract(document, concept) for concept in CONCEPTS}
+    regex_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    # Fed in chunks, as it would be from the HTTP response
+    table = parse_inline_xbrl(encoded[i : i + 256 * 1024] for i in range(0, len(encoded), 256 * 1024))
+    parse_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    new = {concept: table.lookup(concept) for concept in CONCEPTS}
+    lookup_seconds = time.perf_counter() - started
+
+    print(f"regex, {len(CONCEPTS)} concepts          {regex_seconds * 1e3:9.1f} ms")
+    print(f"fact table parse               {parse_seconds * 1e3:9.1f} ms  ({len(table):,} facts)")
+    print(f"fact table, {len(CONCEPTS)} lookups          {lookup_seconds * 1e3:9.1f} ms")
+
+    differing = 0
+    for concept in CONCEPTS:
+        before = old[concept] and (old[concept]["value"], old[concept]["period"])
+        after = new[concept] and (new[concept]["value"], new[concept]["period_end"])
+        if before != after:
+            differing += 1
+            print(f"  {concept}: regex {before} -> fact table {after}")
+    print(f"{differing} of {len(CONCEPTS)} concepts differ (regex takes the first match, ignoring sign and dimensions)")
+
+
+if __name__ == "__main__":
+    main()
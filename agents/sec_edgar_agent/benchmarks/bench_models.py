@@ -0,0 +1,77 @@
+"""
+Benchmark response building for filing lists: per-row ``to_dict`` vs bulk serialization.
+
+Run from agents/sec_edgar_agent:
+    python -m benchmarks.bench_models [--rows 500]
+"""
+
+import argparse
+import json
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta
+
+from sec_edgar_mcp.core.models import FilingInfo, serialize_records
+
+
+def make_filings(rows: int):
+    start = datetime(2024, 1, 2, 16, 30)
+    return [
+        FilingInfo(
+            accession_number=f"0000320193-24-{i:06d}",
+            filing_date=start + timedelta(days=i),
+            form_type="10-Q" if i % 4 else "10-K",
+            company_name="Apple Inc.",
+            cik="0000320193",
+            file_number="001-36743",
+            acceptance_datetime=start + timedelta(days=i, hours=1),
+            period_of_report=start + timedelta(days=i - 30),
+        )
+        for i in range(rows)
+    ]
+
+
+def per_row_to_dict(filings):
+    """The pre-bulk shape: one hand-built dict and three isoformat checks per filing."""
+    return [
+        {
+            "accession_number": f.accession_number,
+            "filing_date": f.filing_date.isoformat() if f.filing_date else None,
+            "form_type": f.form_type,
+            "company_name": f.company_name,
+            "cik": f.cik,
+            "file_number": f.file_number,
+            "acceptance_datetime": f.acceptance_datetime.isoformat() if f.acceptance_datetime else None,
+            "period_of_report": f.period_of_report.isoformat() if f.period_of_report else None,
+            "items": f.items,
+        }
+        for f in filings
+    ]
+
+
+def measure(label, fn, repeat):
+    seconds = min(timeit.repeat(fn, number=1, repeat=repeat))
+    tracemalloc.start()
+    payload = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size = len(json.dumps(payload, separators=(",", ":")))
+    print(f"{label:<32} {seconds * 1e3:8.3f} ms  peak {peak / 1024:8.1f} KiB  json {size / 1024:8.1f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    filings = make_filings(args.rows)
+    print(f"{args.rows} FilingInfo rows, best of {args.repeat}")
+    measure("per-row to_dict", lambda: per_row_to_dict(filings), args.repeat)
+    measure("serialize_records(records)", lambda: serialize_records(filings), args.repeat)
+    measure("serialize_records(rows)", lambda: serialize_records(filings, orient="rows"), args.repeat)
+    measure("serialize_records(columns)", lambda: serialize_records(filings, orient="columns"), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Benchmark Form 4 parsing: edgartools ``Form4`` + ``to_dataframe`` per filing vs the streaming columnar parser.
+
+Run from agents/sec_edgar_agent:
+    python -m benchmarks.bench_ownership [--filings 500]
+"""
+
+import argparse
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from sec_edgar_mcp.ownership_parser import OwnershipTransactions, parse_ownership_xml
+
+FORM4_TEMPLATE = """<?xml version="1.0"?>
+<ownershipDocument>
+    <schemaVersion>X0508</schemaVersion>
+    <documentType>4</documentType>
+    <periodOfReport>{date}</periodOfReport>
+    <notSubjectToSection16>0</notSubjectToSection16>
+    <issuer>
+        <issuerCik>0000320193</issuerCik>
+        <issuerName>Apple Inc.</issuerName>
+        <issuerTradingSymbol>AAPL</issuerTradingSymbol>
+    </issuer>
+    <reportingOwner>
+        <reportingOwnerId>
+            <rptOwnerCik>{owner_cik}</rptOwnerCik>
+            <rptOwnerName>Owner {index}</rptOwnerName>
+        </reportingOwnerId>
+        <reportingOwnerAddress>
+            <rptOwnerStreet1>ONE APPLE PARK WAY</rptOwnerStreet1>
+            <rptOwnerCity>CUPERTINO</rptOwnerCity>
+            <rptOwnerState>CA</rptOwnerState>
+            <rptOwnerZipCode>95014</rptOwnerZipCode>
+        </reportingOwnerAddress>
+        <reportingOwnerRelationship>
+            <isDirector>0</isDirector>
+            <isOfficer>1</isOfficer>
+            <isTenPercentOwner>0</isTenPercentOwner>
+            <isOther>0</isOther>
+            <officerTitle>SVP</officerTitle>
+        </reportingOwnerRelationship>
+    </reportingOwner>
+    <aff10b5One>0</aff10b5One>
+    <nonDerivativeTable>{non_derivative}
+    </nonDerivativeTable>
+    <derivativeTable>
+        <derivativeTransaction>
+            <securityTitle><value>Restricted Stock Unit</value></securityTitle>
+            <conversionOrExercisePrice><footnoteId id="F1"/></conversionOrExercisePrice>
+            <transactionDate><value>{date}</value></transactionDate>
+            <transactionCoding>
+                <transactionFormType>4</transactionFormType>
+                <transactionCode>M</transactionCode>
+                <equitySwapInvolved>0</equitySwapInvolved>
+            </transactionCoding>
+            <transactionAmounts>
+                <transactionShares><value>5000</value></transactionShares>
+                <transactionPricePerShare><value>0</value></transactionPricePerShare>
+                <transactionAcquiredDisposedCode><value>D</value></transactionAcquiredDisposedCode>
+            </transactionAmounts>
+            <exerciseDate><footnoteId id="F2"/></exerciseDate>
+            <expirationDate><footnoteId id="F2"/></expirationDate>
+            <underlyingSecurity>
+                <underlyingSecurityTitle><value>Common Stock</value></underlyingSecurityTitle>
+                <underlyingSecurityShares><value>5000</value></underlyingSecurityShares>
+            </underlyingSecurity>
+            <postTransactionAmounts>
+                <sharesOwnedFollowingTransaction><value>15000</value></sharesOwnedFollowingTransaction>
+            </postTransactionAmounts>
+            <ownershipNature>
+                <directOrIndirectOwnership><value>D</value></directOrIndirectOwnership>
+            </ownershipNature>
+        </derivativeTransaction>
+    </derivativeTable>
+    <footnotes>
+        <footnote id="F1">Each restricted stock unit represents the right to receive one share.</footnote>
+        <footnote id="F2">The units vest in equal installments.</footnote>
+    </footnotes>
+    <ownerSignature>
+        <signatureName>Attorney-in-fact</signatureName>
+        <signatureDate>{date}</signatureDate>
+    </ownerSignature>
+</ownershipDocument>
+"""
+
+SALE_TEMPLATE = """
+        <nonDerivativeTransaction>
+            <securityTitle><value>Common Stock</value></securityTitle>
+            <transactionDate><value>{date}</value></transactionDate>
+            <transactionCoding>
+                <transactionFormType>4</transactionFormType>
+                <transactionCode>{code}</transactionCode>
+                <equitySwapInvolved>0</equitySwapInvolved>
+            </transactionCoding>
+            <transactionAmounts>
+                <transactionShares><value>{shares}</value></transactionShares>
+                <transactionPricePerShare><value>{price}</value></transactionPricePerShare>
+                <transactionAcquiredDisposedCode><value>{direction}</value></transactionAcquiredDisposedCode>
+            </transactionAmounts>
+            <postTransactionAmounts>
+                <sharesOwnedFollowingTransaction><value>{after}</value></sharesOwnedFollowingTransaction>
+            </postTransactionAmounts>
+            <ownershipNature>
+                <directOrIndirectOwnership><value>D</value></directOrIndirectOwnership>
+            </ownershipNature>
+        </nonDerivativeTransaction>"""
+
+
+def make_form4s(filings: int, rows: int):
+    start = date(2024, 1, 2)
+    documents = []
+    for i in range(filings):
+        day = (start + timedelta(days=i % 365)).isoformat()
+        non_derivative = "".join(
+            SALE_TEMPLATE.format(
+                date=day,
+                code="S" if j % 3 else "M",
+                shares=1000 + j,
+                price=f"{180 + j * 0.25:.2f}",
+                direction="D" if j % 3 else "A",
+                after=50000 - j * 1000,
+            )
+            for j in range(rows)
+        )
+        documents.append(
+            FORM4_TEMPLATE.format(
+                date=day, owner_cik=f"{1000000 + i % 40:010d}", index=i % 40, non_derivative=non_derivative
+            )
+        )
+    return documents
+
+
+def parse_with_edgartools(documents):
+    from edgar.ownership import Form4
+
+    return [Form4.parse_xml(xml).to_dataframe() for xml in documents]
+
+
+def parse_columnar(documents):
+    transactions = OwnershipTransactions()
+    for i, xml in enumerate(documents):
+        parse_ownership_xml(xml, accession_number=f"0000320193-24-{i:06d}", into=transactions)
+    return transactions
+
+
+def measure(label, fn):
+    started = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - started
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<32} {seconds * 1e3:9.1f} ms  peak {peak / 1024 / 1024:8.2f} MiB")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filings", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=4, help="Non-derivative transactions per filing")
+    args = parser.parse_args()
+
+    documents = make_form4s(args.filings, args.rows)
+    print(f"{args.filings} Form 4 documents, {args.rows + 1} transactions each")
+    transactions = measure("streaming columnar parser", lambda: parse_columnar(documents))
+    print(f"{'':<32} {len(transactions)} rows")
+    try:
+        measure("edgartools Form4 + to_dataframe", lambda: parse_with_edgartools(documents))
+    except Exception as e:
+        # edgartools looks up each reporting owner's entity on SEC while parsing, so it needs network access
+        print(f"edgartools comparison skipped: {type(e).__name__}: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from sec_edgar_mcp.core import EdgarClient, CompanyInfo, FilingInfo, TransactionInfo
-from sec_edgar_mcp.tools import CompanyTools, FilingsTools, FinancialTools, InsiderTools
+from sec_edgar_mcp.tools import CompanyTools, DocumentTools, FilingsTools, FinancialTools, InsiderTools
 from sec_edgar_mcp.utils import TickerCache, SEC_USER_AGENT
 
 __version__ = "1.0.4"
@@ -12,6 +12,7 @@ __all__ = [
     "TransactionInfo",
     # Tools
     "CompanyTools",
+    "DocumentTools",
     "FilingsTools",
     "FinancialTools",
     "InsiderTools",
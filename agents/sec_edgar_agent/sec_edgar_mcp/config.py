@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 
 def initialize_config():
@@ -8,3 +9,11 @@ def initialize_config():
         raise ValueError("SEC_EDGAR_USER_AGENT environment variable is not set.")
 
     return sec_edgar_user_agent
+
+
+def get_cache_dir():
+    """Get the directory used for on-disk caches, creating it if needed"""
+    cache_dir = os.getenv("SEC_EDGAR_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "sec_edgar_mcp")
+    os.makedirs(cache_dir, exist_ok=True)
+
+    return cache_dir
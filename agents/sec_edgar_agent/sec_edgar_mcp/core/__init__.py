@@ -1,8 +1,8 @@
 try:
     from .client import EdgarClient
-    from .models import CompanyInfo, FilingInfo, TransactionInfo
+    from .models import CompanyInfo, FilingInfo, TransactionInfo, serialize_records
 except ImportError:
     from client import EdgarClient
-    from models import CompanyInfo, FilingInfo, TransactionInfo
+    from models import CompanyInfo, FilingInfo, TransactionInfo, serialize_records
 
-__all__ = ["EdgarClient", "CompanyInfo", "FilingInfo", "TransactionInfo"]
+__all__ = ["EdgarClient", "CompanyInfo", "FilingInfo", "TransactionInfo", "serialize_records"]
@@ -1,14 +1,80 @@
-from typing import Optional
-from edgar import Company, set_identity, find_company, search
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional
 try:
-    from ..utils.cache import TickerCache
+    from ..utils.cache import MemoryCache, TickerCache
     from ..utils.exceptions import CompanyNotFoundError
+    from ..utils.sec_http import install_edgar_rate_limiter
     from ..config import initialize_config
 except ImportError:
-    from utils.cache import TickerCache
+    from utils.cache import MemoryCache, TickerCache
     from utils.exceptions import CompanyNotFoundError
+    from utils.sec_http import install_edgar_rate_limiter
     from config import initialize_config
-import edgar
+
+if TYPE_CHECKING:
+    from edgar import Company
+
+# How long Company objects (submissions) and company facts are served before being revalidated
+COMPANY_CACHE_TTL = float(os.getenv("SEC_EDGAR_COMPANY_CACHE_TTL", 15 * 60))
+
+# Past this age a cached company is reloaded before answering instead of in the background
+COMPANY_MAX_STALE = float(os.getenv("SEC_EDGAR_COMPANY_MAX_STALE", 24 * 60 * 60))
+
+# edgartools (and pandas with it) is imported on first use rather than at import time;
+# the identity only needs to be set once per process.
+_edgar_lock = threading.Lock()
+_edgar_identity: Optional[str] = None
+_ticker_cache: Optional[TickerCache] = None
+
+# Process-wide caches shared by every client. Filed XBRL never changes, so it only ages out by LRU.
+_companies = MemoryCache(max_entries=256, ttl=COMPANY_CACHE_TTL)
+_company_facts = MemoryCache(max_entries=64, ttl=COMPANY_CACHE_TTL)
+_filing_xbrl = MemoryCache(max_entries=32)
+
+# Latest filing per form for each company, keyed by CIK and rebuilt only when a new accession appears
+_latest_filings = MemoryCache(max_entries=256)
+
+# The later of the latest 10-K and 10-Q, for ``EdgarClient.latest_filing``
+PERIODIC = "periodic"
+
+
+def _edgar(user_agent: str):
+    """Import edgartools, setting its identity and shared rate limiter the first time."""
+    global _edgar_identity
+    import edgar
+
+    if _edgar_identity != user_agent:
+        with _edgar_lock:
+            if _edgar_identity is None:
+                install_edgar_rate_limiter()
+            if _edgar_identity != user_agent:
+                edgar.set_identity(user_agent)
+                _edgar_identity = user_agent
+    return edgar
+
+
+def _shared_ticker_cache(user_agent: str) -> TickerCache:
+    """Get the ticker cache shared by all clients in this process."""
+    global _ticker_cache
+    if _ticker_cache is None:
+        with _edgar_lock:
+            if _ticker_cache is None:
+                _ticker_cache = TickerCache(user_agent)
+    return _ticker_cache
+
+
+def _latest_by_form(filings: Any) -> Dict[str, Any]:
+    """The latest filing of each form in one pass over a company's filings, amendments under their form."""
+    forms = filings.data["form"].to_pylist()
+    dates = filings.data["filing_date"].to_pylist()
+    latest: Dict[str, int] = {}
+    for i, (form, filing_date) in enumerate(zip(forms, dates)):
+        form = form[:-2] if form.endswith("/A") else form
+        # Strictly later, so the first of several filed the same day wins as with ``latest()``
+        if form not in latest or filing_date > dates[latest[form]]:
+            latest[form] = i
+    return {form: filings.get_filing_at(i) for form, i in latest.items()}
 
 
 class EdgarClient:
@@ -16,29 +82,112 @@ class EdgarClient:
 
     def __init__(self):
         self._user_agent = initialize_config()
-        # Set identity for edgar-tools
-        set_identity(self._user_agent)
-        # Also set the default user agent
-        edgar.set_identity(self._user_agent)
-        self._ticker_cache = TickerCache(self._user_agent)
-
-    def get_company(self, identifier: str) -> Company:
-        """Get a Company object by ticker or CIK."""
+        self._ticker_cache = _shared_ticker_cache(self._user_agent)
+
+    @property
+    def edgar(self):
+        """The edgartools module, imported and configured on first use."""
+        return _edgar(self._user_agent)
+
+    def get_company(self, identifier: str) -> "Company":
+        """Get a Company object by ticker or CIK, reusing a recently loaded one when possible."""
+        Company = self.edgar.Company
         try:
             # First try as CIK (if it's all digits)
             if identifier.isdigit() or (identifier.startswith("000") and len(identifier) == 10):
-                return Company(identifier)
+                return self._cached_company(identifier)
 
             # For tickers, always convert to CIK first
             cik = self.get_cik_by_ticker(identifier)
             if cik:
-                return Company(cik)
+                return self._cached_company(cik)
 
             # Last resort - try direct lookup
             return Company(identifier)
         except Exception:
             raise CompanyNotFoundError(f"Company '{identifier}' not found")
 
+    def _cached_company(self, cik: str) -> "Company":
+        key = str(int(cik)).zfill(10)
+        return _companies.get_or_load(key, lambda: self._load_company(key), max_stale=COMPANY_MAX_STALE)
+
+    def _load_company(self, cik: str) -> "Company":
+        return self.edgar.Company(int(cik))
+
+    def get_company_facts(self, company: "Company") -> Optional[Any]:
+        """Get the companyfacts for a company, cached per CIK with stale-while-revalidate."""
+        key = str(int(company.cik)).zfill(10)
+        return _company_facts.get_or_load(key, lambda: self._load_company_facts(key), max_stale=COMPANY_MAX_STALE)
+
+    def _load_company_facts(self, cik: str) -> Optional[Any]:
+        # edgartools keeps the last facts it loaded in memory; drop them so a reload hits SEC
+        try:
+            from edgar.entity.entity_facts import clear_company_facts_cache
+
+            clear_company_facts_cache()
+        except ImportError:
+            pass
+        company = self._cached_company(cik)
+        return company.get_facts()
+
+    def refresh_company(self, cik: str, facts: bool = True) -> None:
+        """Reload a company's submissions (and optionally facts) in the background after new filings."""
+        key = str(int(cik)).zfill(10)
+        _companies.revalidate(key, lambda: self._load_company(key))
+        if facts:
+            _company_facts.revalidate(key, lambda: self._load_company_facts(key))
+
+    def company_cached_at(self, cik: str) -> Optional[float]:
+        """When a company's submissions were cached, or None if they are not."""
+        entry = _companies.get_entry(str(int(cik)).zfill(10))
+        return entry[1] if entry is not None else None
+
+    def mark_company_fresh(self, cik: str) -> None:
+        """Record that a company's cached data was confirmed current, e.g. by a 304 response."""
+        key = str(int(cik)).zfill(10)
+        _companies.touch(key)
+        _company_facts.touch(key)
+
+    def get_filing_xbrl(self, filing: Any) -> Optional[Any]:
+        """Get the parsed XBRL of a filing, cached per accession number."""
+        xbrl = _filing_xbrl.get(filing.accession_number)
+        if xbrl is None:
+            xbrl = filing.xbrl()
+            if xbrl is not None:
+                _filing_xbrl.put(filing.accession_number, xbrl)
+        return xbrl
+
+    def latest_filing(self, company: "Company", form: str) -> Optional[Any]:
+        """Get a company's latest filing of a form, or None if it has none.
+
+        Amendments count as their form, as with ``get_filings(form=...).latest()``. ``PERIODIC``
+        gives the later of the latest 10-K and 10-Q (the 10-K when both were filed the same day).
+        """
+        if form == PERIODIC:
+            annual = self.latest_filing(company, "10-K")
+            quarterly = self.latest_filing(company, "10-Q")
+            if annual is None or quarterly is None:
+                return annual or quarterly
+            return quarterly if quarterly.filing_date > annual.filing_date else annual
+
+        if form.endswith("/A"):
+            return company.get_filings(form=form, amendments=True).latest()
+
+        key = str(int(company.cik)).zfill(10)
+        recent = company.get_filings(trigger_full_load=False)
+        newest = recent.data["accession_number"][0].as_py() if len(recent) else None
+        entry = _latest_filings.get(key)
+        if entry is None or entry[0] != newest:
+            entry = (newest, _latest_by_form(recent), False)
+            _latest_filings.put(key, entry)
+
+        if form not in entry[1] and not entry[2]:
+            # Forms not filed recently are only in the older submission pages, loaded on demand
+            filings = company.get_filings()
+            entry = (newest, _latest_by_form(filings), True)
+            _latest_filings.put(key, entry)
+        return entry[1].get(form)
+
     def get_cik_by_ticker(self, ticker: str) -> Optional[str]:
         """Get CIK by ticker symbol."""
         # Try the cache first
@@ -48,16 +197,26 @@ class EdgarClient:
 
         # Try to get via Company object
         try:
-            company = Company(ticker)
+            company = self.edgar.Company(ticker)
             return company.cik
         except Exception:
             return None
 
+    def resolve_cik(self, identifier: str) -> str:
+        """Resolve a ticker or CIK to a CIK without building a Company object."""
+        if identifier.isdigit():
+            return str(int(identifier)).zfill(10)
+
+        cik = self.get_cik_by_ticker(identifier)
+        if not cik:
+            raise CompanyNotFoundError(f"Company '{identifier}' not found")
+        return str(int(cik)).zfill(10)
+
     def search_companies(self, query: str, limit: int = 10) -> list:
         """Search for companies by name."""
         try:
             # Use edgar-tools search functionality
-            results = search(query)
+            results = self.edgar.search(query)
 
             # Convert to list format and limit results
             companies = []
@@ -70,7 +229,7 @@ class EdgarClient:
         except Exception:
             # Fallback to find_company if search fails
             try:
-                company = find_company(query)
+                company = self.edgar.find_company(query)
                 if company:
                     return [{"cik": company.cik, "name": company.name, "tickers": getattr(company, "tickers", [])}]
             except Exception:
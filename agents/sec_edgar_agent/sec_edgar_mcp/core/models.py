@@ -1,9 +1,10 @@
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from dataclasses import dataclass, fields
+from datetime import date, datetime
+from operator import attrgetter
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Sequence, Tuple, get_args
 
 
-@dataclass
+@dataclass(slots=True)
 class CompanyInfo:
     """Company information model."""
 
@@ -18,19 +19,10 @@ class CompanyInfo:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "cik": self.cik,
-            "name": self.name,
-            "ticker": self.ticker,
-            "sic": self.sic,
-            "sic_description": self.sic_description,
-            "exchange": self.exchange,
-            "state": self.state,
-            "fiscal_year_end": self.fiscal_year_end,
-        }
-
-
-@dataclass
+        return serialize_records([self])[0]
+
+
+@dataclass(slots=True)
 class FilingInfo:
     """Filing information model."""
 
@@ -46,20 +38,10 @@ class FilingInfo:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "accession_number": self.accession_number,
-            "filing_date": self.filing_date.isoformat() if self.filing_date else None,
-            "form_type": self.form_type,
-            "company_name": self.company_name,
-            "cik": self.cik,
-            "file_number": self.file_number,
-            "acceptance_datetime": self.acceptance_datetime.isoformat() if self.acceptance_datetime else None,
-            "period_of_report": self.period_of_report.isoformat() if self.period_of_report else None,
-            "items": self.items,
-        }
-
-
-@dataclass
+        return serialize_records([self])[0]
+
+
+@dataclass(slots=True)
 class TransactionInfo:
     """Transaction information model for insider filings."""
 
@@ -75,14 +57,67 @@ class TransactionInfo:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "transaction_date": self.transaction_date.isoformat() if self.transaction_date else None,
-            "security_title": self.security_title,
-            "transaction_type": self.transaction_type,
-            "shares": self.shares,
-            "price_per_share": self.price_per_share,
-            "total_value": self.total_value,
-            "ownership_type": self.ownership_type,
-            "owner_name": self.owner_name,
-            "owner_title": self.owner_title,
-        }
+        return serialize_records([self])[0]
+
+
+class _Layout:
+    """Field names of a model, with a getter for all field values at once, built once per class."""
+
+    __slots__ = ("names", "values", "dates")
+
+    _cache: ClassVar[Dict[type, "_Layout"]] = {}
+
+    def __init__(self, model: type):
+        model_fields = fields(model)
+        self.names: Tuple[str, ...] = tuple(field.name for field in model_fields)
+        getter = attrgetter(*self.names)
+        self.values = getter if len(self.names) > 1 else lambda record: (getter(record),)
+        # Positions of date fields; other values (including dates given as strings) pass through
+        self.dates: Tuple[int, ...] = tuple(
+            i for i, field in enumerate(model_fields) if field.type is datetime or datetime in get_args(field.type)
+        )
+
+    def rows(self, records: Sequence[Any]) -> Iterator[List[Any]]:
+        """Field values of each record in field order, with dates as ISO strings."""
+        values, dates = self.values, self.dates
+        for record in records:
+            row = list(values(record))
+            for i in dates:
+                if isinstance(row[i], date):
+                    row[i] = row[i].isoformat()
+            yield row
+
+    @classmethod
+    def of(cls, model: type) -> "_Layout":
+        layout = cls._cache.get(model)
+        if layout is None:
+            layout = cls._cache[model] = cls(model)
+        return layout
+
+
+def serialize_records(records: Sequence[Any], orient: str = "records") -> Any:
+    """Serialize model instances of one class in a single pass.
+
+    ``orient`` selects the output shape:
+    - ``"records"``: a list of dicts (the historical ``to_dict`` shape)
+    - ``"rows"``: ``{"columns": [...], "rows": [[...], ...]}`` with field names sent once
+    - ``"columns"``: a dict of field name -> list of values
+
+    Dates and datetimes are converted to ISO strings.
+    """
+    if orient not in ("records", "rows", "columns"):
+        raise ValueError(f"Unknown orient: {orient}")
+    if not records:
+        return [] if orient == "records" else {"columns": [], "rows": []} if orient == "rows" else {}
+
+    layout = _Layout.of(type(records[0]))
+
+    if orient == "records":
+        names = layout.names
+        return [dict(zip(names, row)) for row in layout.rows(records)]
+
+    rows = list(layout.rows(records))
+    if orient == "rows":
+        return {"columns": list(layout.names), "rows": rows}
+    return {name: list(values) for name, values in zip(layout.names, zip(*rows))}
+
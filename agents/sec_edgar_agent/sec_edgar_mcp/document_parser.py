@@ -3,9 +3,10 @@ SEC EDGAR document parser for handling large filing content with chunking strate
 """
 
 import re
-import requests
-from typing import List, Dict, Optional, Any, Union
-from bs4 import BeautifulSoup
+from typing import List, Dict, Optional, Any, Tuple, Union
+from .filing_index import primary_document
+from .submission_reader import read_submission
+from .utils.sec_http import sec_get
 
 
 class FilingSection:
@@ -82,8 +83,10 @@ class SECDocumentParser:
             "Connection": "keep-alive",
         }
 
+        import requests
+
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = sec_get(url, headers=headers, timeout=30)
             response.raise_for_status()
             return response.text
         except requests.RequestException as e:
@@ -93,8 +96,39 @@ class SECDocumentParser:
         """Fetch the complete SEC filing in .txt format (most reliable)."""
         return self.fetch_document(cik, accession_number, f"{accession_number}.txt")
 
-    def clean_html_content(self, html_content: str) -> str:
-        """Clean HTML content and extract readable text."""
+    def fetch_primary_document(self, cik: str, accession_number: str) -> str:
+        """Fetch only the filing's primary document, selected from its JSON index.
+
+        When the primary document cannot be determined it is read from the start of the
+        .txt submission, closing the connection once the document is complete.
+        ``extract_filing_text`` accepts either the document or a whole submission.
+        """
+        try:
+            document = primary_document(cik, accession_number)
+        except Exception:
+            document = None
+        if document is not None:
+            return self.fetch_document(cik, accession_number, document["filename"])
+
+        import requests
+
+        try:
+            documents = read_submission(cik, accession_number, main_only=True)["documents"]
+        except requests.RequestException as e:
+            raise Exception(f"Failed to fetch document: {str(e)}")
+        if not documents:
+            return self.fetch_filing_txt(cik, accession_number)
+        return documents[0]["text"]
+
+    def clean_html_content(self, html_content: str, keep_inline_xbrl: bool = False) -> str:
+        """Clean HTML content and extract readable text.
+
+        With ``keep_inline_xbrl`` only the hidden ``ix:header`` block is dropped and the
+        text wrapped by inline XBRL tags (tagged numbers, text blocks) is kept.
+        """
+        # BeautifulSoup is only needed for HTML filings, so it is imported here rather than at startup
+        from bs4 import BeautifulSoup
+
         # Parse HTML
         soup = BeautifulSoup(html_content, "html.parser")
 
@@ -102,9 +136,13 @@ class SECDocumentParser:
         for script in soup(["script", "style", "meta", "link"]):
             script.decompose()
 
-        # Remove XBRL tags (common in modern filings)
-        for xbrl_tag in soup.find_all(re.compile(r"^(ix:|xbrli:|dei:|us-gaap:)")):
-            xbrl_tag.decompose()
+        if keep_inline_xbrl:
+            for header in soup.find_all("ix:header"):
+                header.decompose()
+        else:
+            # Remove XBRL tags (common in modern filings)
+            for xbrl_tag in soup.find_all(re.compile(r"^(ix:|xbrli:|dei:|us-gaap:)")):
+                xbrl_tag.decompose()
 
         # Get text content
         text = soup.get_text()
@@ -383,6 +421,28 @@ class SECDocumentParser:
 
         return content
 
+    def extract_filing_text(self, txt_content: str) -> str:
+        """Extract the readable text of the primary document from a .txt filing or the document itself.
+
+        The primary document is always the first ``<DOCUMENT>`` of a submission. Its raw
+        ``<TEXT>`` body is kept intact (unlike the line-based extractors above) so HTML
+        markup spanning several lines is converted to text correctly.
+        """
+        match = re.search(r"<DOCUMENT>.*?<TEXT>(.*?)</TEXT>", txt_content, re.DOTALL)
+        if match:
+            main_document = match.group(1)
+        elif "<DOCUMENT>" in txt_content:
+            return self.clean_txt_content(txt_content)
+        else:
+            # A primary document fetched on its own
+            main_document = txt_content
+        if re.search(r"(?i)<(html|body|div|p|table|font)\b", main_document):
+            return self.clean_html_content(main_document, keep_inline_xbrl=True)
+
+        text = re.sub(r"\n\s*\n\s*\n", "\n\n", main_document)
+        text = re.sub(r" +", " ", text)
+        return text.strip()
+
     def get_document_info_from_txt(self, txt_content: str) -> List[Dict[str, Any]]:
         """Get information about all documents in the .txt filing."""
         lines = txt_content.split("\n")
@@ -433,6 +493,71 @@ class SECDocumentParser:
         """Extract sections from a filing document."""
         sections = []
 
+        for start_pos, end_pos, section_id, section_title in self._find_section_boundaries(content):
+            section_content = content[start_pos:end_pos].strip()
+
+            # Clean section title
+            clean_title = re.sub(r"\s+", " ", section_title).strip()
+
+            sections.append(FilingSection(name=clean_title, content=section_content, section_type=section_id))
+
+        return sections
+
+    def build_section_index(
+        self, content: str, chunk_size: int = 8000, overlap_size: int = 200
+    ) -> List[Dict[str, Any]]:
+        """Build an offset index of the sections in a filing document.
+
+        Each entry records where the section starts and ends in ``content`` so a section
+        or one of its chunks can later be sliced out without re-running the patterns.
+        """
+        index = []
+
+        for position, (start_pos, end_pos, section_id, section_title) in enumerate(
+            self._find_section_boundaries(content)
+        ):
+            section_content = content[start_pos:end_pos]
+            index.append(
+                {
+                    "index": position,
+                    "name": re.sub(r"\s+", " ", section_title).strip(),
+                    "type": section_id,
+                    "start": start_pos,
+                    "end": end_pos,
+                    "char_count": len(section_content.strip()),
+                    "word_count": len(section_content.split()),
+                    "chunk_count": len(self.chunk_bounds(section_content, chunk_size, overlap_size)),
+                }
+            )
+
+        return index
+
+    def chunk_section(
+        self, content: str, section: Dict[str, Any], chunk_size: int = 8000, overlap_size: int = 200
+    ) -> List[DocumentChunk]:
+        """Chunk a single section described by a ``build_section_index`` entry."""
+        section_start = section["start"]
+        section_content = content[section_start : section["end"]]
+
+        chunks = []
+        for chunk_index, (start, end) in enumerate(self.chunk_bounds(section_content, chunk_size, overlap_size)):
+            chunks.append(
+                DocumentChunk(
+                    content=section_content[start:end].strip(),
+                    section_name=section["name"],
+                    chunk_index=chunk_index,
+                    metadata={
+                        "section_type": section["type"],
+                        "start_pos": section_start + start,
+                        "end_pos": section_start + end,
+                    },
+                )
+            )
+
+        return chunks
+
+    def _find_section_boundaries(self, content: str) -> List[Tuple[int, int, str, str]]:
+        """Find (start, end, section_id, title) tuples for the sections in a document."""
         # Find section boundaries
         section_matches = []
         for section_id, pattern in self.section_patterns.items():
@@ -443,7 +568,7 @@ class SECDocumentParser:
         # Sort by position
         section_matches.sort(key=lambda x: x[0])
 
-        # Extract section content
+        boundaries = []
         for i, (start_pos, section_id, section_title) in enumerate(section_matches):
             # Determine end position
             if i + 1 < len(section_matches):
@@ -451,22 +576,32 @@ class SECDocumentParser:
             else:
                 end_pos = len(content)
 
-            section_content = content[start_pos:end_pos].strip()
-
-            # Clean section title
-            clean_title = re.sub(r"\s+", " ", section_title).strip()
-
-            sections.append(FilingSection(name=clean_title, content=section_content, section_type=section_id))
+            boundaries.append((start_pos, end_pos, section_id, section_title))
 
-        return sections
+        return boundaries
 
     def chunk_content(
         self, content: str, chunk_size: int = 8000, overlap_size: int = 200, section_name: str = "unknown"
     ) -> List[DocumentChunk]:
         """Chunk content into smaller pieces with overlap."""
         chunks = []
+
+        for chunk_index, (start, end) in enumerate(self.chunk_bounds(content, chunk_size, overlap_size)):
+            chunks.append(
+                DocumentChunk(
+                    content=content[start:end].strip(),
+                    section_name=section_name,
+                    chunk_index=chunk_index,
+                    metadata={"start_pos": start, "end_pos": end, "total_length": len(content)},
+                )
+            )
+
+        return chunks
+
+    def chunk_bounds(self, content: str, chunk_size: int = 8000, overlap_size: int = 200) -> List[Tuple[int, int]]:
+        """Compute (start, end) offsets of non-empty chunks, breaking at natural boundaries."""
+        bounds = []
         start = 0
-        chunk_index = 0
 
         while start < len(content):
             # Calculate end position
@@ -484,25 +619,20 @@ class SECDocumentParser:
                     if sent_break > start + chunk_size // 2:
                         end = sent_break + 2
 
-            chunk_content = content[start:end].strip()
+            if content[start:end].strip():
+                bounds.append((start, end))
 
-            if chunk_content:
-                chunks.append(
-                    DocumentChunk(
-                        content=chunk_content,
-                        section_name=section_name,
-                        chunk_index=chunk_index,
-                        metadata={"start_pos": start, "end_pos": end, "total_length": len(content)},
-                    )
-                )
-                chunk_index += 1
+            # Stop once the end of the content is reached; stepping back by the overlap
+            # here would only produce ever smaller tail chunks
+            if end >= len(content):
+                break
 
             # Move start position with overlap
             start = max(end - overlap_size, start + 1)
             if start >= len(content):
                 break
 
-        return chunks
+        return bounds
 
     def chunk_by_sections(
         self, sections: List[FilingSection], chunk_size: int = 8000, overlap_size: int = 200
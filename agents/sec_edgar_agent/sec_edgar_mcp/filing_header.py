@@ -0,0 +1,211 @@
+"""
+Filing metadata from the SEC-HEADER block, without downloading the filing's documents.
+
+EDGAR keeps a small ``<accession>-index-headers.html`` page per filing with the submission
+header and one entry per document. It is streamed with a size cap and closed as soon as
+it is read; filings without the page fall back to streaming the full ``.txt`` submission
+and closing the connection at ``</SEC-HEADER>``. Either way a metadata lookup transfers a
+few KB instead of the whole filing, and the parsed header is cached per accession.
+"""
+
+import html
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .utils.accession import normalize_accession_number
+from .utils.cache import FilingCache
+from .utils.sec_http import sec_get
+
+ARCHIVES_URL = "https://www.sec.gov/Archives/edgar/data/{cik}/{folder}/"
+
+# Stop reading after this much, in case a page is much larger than a header should be
+MAX_HEADER_BYTES = 256 * 1024
+
+# Top-level header sections that describe an entity, and the role each is reported under
+ENTITY_SECTIONS = {
+    "FILER": "filer",
+    "REPORTING-OWNER": "reporting_owner",
+    "ISSUER": "issuer",
+    "SUBJECT COMPANY": "subject_company",
+    "FILED BY": "filed_by",
+    "SERIAL COMPANY": "serial_company",
+}
+
+_HTML_TAGS = re.compile(r"</?(?:html|head|title|body|pre|a|hr|br|div|p|font|b)\b[^>]*>", re.IGNORECASE)
+_DOCUMENT = re.compile(r"<DOCUMENT>(.*?)(?:</DOCUMENT>|\Z)", re.DOTALL)
+_DOCUMENT_FIELD = re.compile(r"^<(TYPE|SEQUENCE|FILENAME|DESCRIPTION)>(.*)$", re.MULTILINE)
+
+_cache: Optional[FilingCache] = None
+
+
+def _header_date(value: Optional[str]) -> Optional[str]:
+    """Convert a header date (``20240102``) or timestamp (``20240102163012``) to ISO format."""
+    if not value:
+        return None
+    try:
+        if len(value) >= 14:
+            return datetime.strptime(value[:14], "%Y%m%d%H%M%S").isoformat()
+        return datetime.strptime(value[:8], "%Y%m%d").date().isoformat()
+    except ValueError:
+        return value
+
+
+def _entity(role: str, sections: Dict[str, Dict[str, str]], former_names: List[str]) -> Dict[str, Any]:
+    """Flatten one entity section (company or owner data, filing values, addresses) into a record."""
+    data = sections.get("COMPANY DATA") or sections.get("OWNER DATA") or {}
+    values = sections.get("FILING VALUES", {})
+    address = sections.get("BUSINESS ADDRESS") or sections.get("MAIL ADDRESS") or {}
+    return {
+        "role": role,
+        "name": data.get("COMPANY CONFORMED NAME"),
+        "cik": (data.get("CENTRAL INDEX KEY") or "").lstrip("0") or None,
+        "sic": data.get("STANDARD INDUSTRIAL CLASSIFICATION"),
+        "state_of_incorporation": data.get("STATE OF INCORPORATION"),
+        "fiscal_year_end": data.get("FISCAL YEAR END"),
+        "form_type": values.get("FORM TYPE"),
+        "file_number": values.get("SEC FILE NUMBER"),
+        "business_address": ", ".join(
+            address[key] for key in ("STREET 1", "STREET 2", "CITY", "STATE", "ZIP") if address.get(key)
+        )
+        or None,
+        "former_names": former_names,
+    }
+
+
+def parse_sec_header(text: str) -> Dict[str, Any]:
+    """Parse an SEC-HEADER block and any document entries following it.
+
+    Accepts the ``-index-headers.html`` page (HTML-escaped) or the start of a ``.txt``
+    submission. Header lines are ``KEY:<tabs>value`` with tab indentation for nesting:
+    top-level sections such as ``REPORTING-OWNER`` or ``ISSUER`` hold sub-sections such
+    as ``OWNER DATA`` or ``BUSINESS ADDRESS``.
+    """
+    text = html.unescape(_HTML_TAGS.sub("", text))
+    start = text.find("<SEC-HEADER>")
+    end = text.find("</SEC-HEADER>")
+    header = text[start if start >= 0 else 0 : end if end >= 0 else len(text)]
+
+    fields: Dict[str, List[str]] = {}
+    entities: List[Dict[str, Any]] = []
+    # Entity being read: its role, sub-sections by name and former names
+    current: Optional[Tuple[str, Dict[str, Dict[str, str]], List[str]]] = None
+    section: Optional[str] = None
+
+    for line in header.splitlines():
+        if line.startswith("<ACCEPTANCE-DATETIME>"):
+            fields.setdefault("ACCEPTANCE-DATETIME", []).append(line[len("<ACCEPTANCE-DATETIME>") :].strip())
+            continue
+        if line.startswith("<") or ":" not in line:
+            continue
+        depth = len(line) - len(line.lstrip("\t"))
+        key, _, value = line.strip().partition(":")
+        key, value = key.strip(), value.strip()
+
+        if depth == 0:
+            if current is not None:
+                entities.append(_entity(*current))
+                current = None
+            if not value and key in ENTITY_SECTIONS:
+                current = (ENTITY_SECTIONS[key], {}, [])
+                section = None
+            elif value:
+                fields.setdefault(key, []).append(value)
+        elif current is not None:
+            if not value:
+                section = key
+            elif key == "FORMER CONFORMED NAME":
+                current[2].append(value)
+            elif section is not None:
+                current[1].setdefault(section, {}).setdefault(key, value)
+    if current is not None:
+        entities.append(_entity(*current))
+
+    def first(key: str) -> Optional[str]:
+        return fields.get(key, [None])[0]
+
+    documents = []
+    for block in _DOCUMENT.findall(text[end:] if end >= 0 else ""):
+        document = {name.lower(): value.strip() for name, value in _DOCUMENT_FIELD.findall(block)}
+        if document:
+            documents.append(
+                {
+                    "sequence": document.get("sequence"),
+                    "type": document.get("type"),
+                    "filename": document.get("filename"),
+                    "description": document.get("description"),
+                }
+            )
+
+    document_count = first("PUBLIC DOCUMENT COUNT")
+    return {
+        "accession_number": first("ACCESSION NUMBER"),
+        "form_type": first("CONFORMED SUBMISSION TYPE"),
+        "filing_date": _header_date(first("FILED AS OF DATE")),
+        "period_of_report": _header_date(first("CONFORMED PERIOD OF REPORT")),
+        "acceptance_datetime": _header_date(first("ACCEPTANCE-DATETIME")),
+        "date_of_change": _header_date(first("DATE AS OF CHANGE")),
+        "document_count": int(document_count) if document_count and document_count.isdigit() else None,
+        "items": fields.get("ITEM INFORMATION", []),
+        "filers": [entity for entity in entities if entity["role"] != "reporting_owner"],
+        "reporting_owners": [entity for entity in entities if entity["role"] == "reporting_owner"],
+        "documents": documents,
+    }
+
+
+def _stream(url: str, marker: bytes) -> Tuple[bytes, bool]:
+    """Read ``url`` until ``marker`` or ``MAX_HEADER_BYTES``, then close the connection.
+
+    Returns the bytes read and whether the response was found.
+    """
+    response = sec_get(url, headers={"Accept-Encoding": "gzip, deflate"}, timeout=30, stream=True)
+    try:
+        if response.status_code == 404:
+            return b"", False
+        response.raise_for_status()
+        data = bytearray()
+        for chunk in response.iter_content(chunk_size=16 * 1024):
+            # Look for the marker across the chunk boundary too
+            search_from = max(0, len(data) - len(marker))
+            data.extend(chunk)
+            if data.find(marker, search_from) >= 0 or len(data) >= MAX_HEADER_BYTES:
+                break
+        return bytes(data), True
+    finally:
+        response.close()
+
+
+def fetch_filing_header(cik: Any, accession_number: str) -> Dict[str, Any]:
+    """Get a filing's header metadata: filers, reporting owners, period, items and document list.
+
+    Headers never change after acceptance, so each is fetched once and cached on disk.
+    """
+    global _cache
+    if _cache is None:
+        _cache = FilingCache()
+
+    accession_number = normalize_accession_number(accession_number)
+    cached = _cache.get_json(accession_number, "header.json")
+    if cached is not None:
+        return cached
+
+    base_url = ARCHIVES_URL.format(cik=str(cik).lstrip("0"), folder=accession_number.replace("-", ""))
+    data, found = _stream(f"{base_url}{accession_number}-index-headers.html", b"</html>")
+    source = "index-headers"
+    if not found:
+        # The header is at the very start of the full submission; stop reading right after it
+        data, found = _stream(f"{base_url}{accession_number}.txt", b"</SEC-HEADER>")
+        source = "submission"
+    if not found:
+        raise ValueError(f"No header found for filing {accession_number}")
+
+    header = parse_sec_header(data.decode("utf-8", errors="replace"))
+    header["accession_number"] = header["accession_number"] or accession_number
+    for document in header["documents"]:
+        document["url"] = f"{base_url}{document['filename']}" if document["filename"] else None
+    header["index_url"] = f"{base_url}{accession_number}-index.htm"
+    header["source"] = source
+    header["bytes_read"] = len(data)
+
+    _cache.put_json(accession_number, "header.json", header)
+    return header
@@ -0,0 +1,105 @@
+"""
+Selection of a filing's primary document from its JSON directory index.
+
+The ``{accession}.txt`` submission bundles every document of a filing (exhibits, XBRL
+schemas and linkbases, uuencoded images and PDFs) and is often many times the size of
+the one document a tool needs. Each filing folder also has a small ``index.json``
+listing its files with sizes, from which the primary document is chosen:
+
+1. For inline XBRL filings EDGAR extracts the instance as ``<name>_htm.xml``; the
+   primary document is the ``<name>.htm`` it was extracted from.
+2. Otherwise the first document of the filing's SEC header (``fetch_filing_header``,
+   itself a few KB and cached) is the primary document.
+
+Callers fall back to the ``.txt`` submission when neither applies.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .filing_header import ARCHIVES_URL, fetch_filing_header
+from .utils.accession import normalize_accession_number
+from .utils.cache import FilingCache
+from .utils.sec_http import sec_get
+
+_cache: Optional[FilingCache] = None
+
+
+def _filing_cache() -> FilingCache:
+    global _cache
+    if _cache is None:
+        _cache = FilingCache()
+    return _cache
+
+
+def filing_folder_url(cik: Any, accession_number: str) -> str:
+    """URL of a filing's folder in the EDGAR archives, with a trailing slash."""
+    folder = normalize_accession_number(accession_number).replace("-", "")
+    return ARCHIVES_URL.format(cik=str(cik).lstrip("0"), folder=folder)
+
+
+def fetch_filing_index(cik: Any, accession_number: str) -> List[Dict[str, Any]]:
+    """Files in a filing's folder as ``{"name", "size"}`` records, from its ``index.json``.
+
+    Returns an empty list when the filing has no JSON index. Cached per accession.
+    """
+    accession_number = normalize_accession_number(accession_number)
+    cached = _filing_cache().get_json(accession_number, "index.json")
+    if cached is not None:
+        return cached
+
+    response = sec_get(f"{filing_folder_url(cik, accession_number)}index.json", timeout=30)
+    if response.status_code == 404:
+        files: List[Dict[str, Any]] = []
+    else:
+        response.raise_for_status()
+        items = response.json().get("directory", {}).get("item", [])
+        files = [
+            {"name": item["name"], "size": int(item["size"]) if str(item.get("size") or "").isdigit() else None}
+            for item in items
+            if item.get("name") and item.get("type") != "folder.gif"
+        ]
+
+    _filing_cache().put_json(accession_number, "index.json", files)
+    return files
+
+
+def inline_xbrl_document(cik: Any, accession_number: str) -> Optional[Dict[str, Any]]:
+    """The inline XBRL primary document of a filing, or None if the filing has none (or no JSON index)."""
+    files = {file["name"]: file for file in fetch_filing_index(cik, accession_number)}
+    for name in files:
+        if name.endswith("_htm.xml"):
+            stem = name[: -len("_htm.xml")]
+            for filename in (f"{stem}.htm", f"{stem}.html"):
+                if filename in files:
+                    return _document(cik, accession_number, filename, files, inline_xbrl=True, source="index.json")
+    return None
+
+
+def primary_document(cik: Any, accession_number: str) -> Optional[Dict[str, Any]]:
+    """The primary document of a filing: ``filename``, ``url``, ``size``, ``inline_xbrl`` and ``source``.
+
+    Returns None when it cannot be determined, in which case the ``.txt`` submission is the
+    only complete source.
+    """
+    document = inline_xbrl_document(cik, accession_number)
+    if document is not None:
+        return document
+
+    files = {file["name"]: file for file in fetch_filing_index(cik, accession_number)}
+    documents = fetch_filing_header(cik, accession_number).get("documents") or []
+    filename = documents[0].get("filename") if documents else None
+    if not filename or (files and filename not in files):
+        return None
+    return _document(cik, accession_number, filename, files, inline_xbrl=False, source="header")
+
+
+def _document(
+    cik: Any, accession_number: str, filename: str, files: Dict[str, Dict[str, Any]], inline_xbrl: bool, source: str
+) -> Dict[str, Any]:
+    return {
+        "filename": filename,
+        "url": f"{filing_folder_url(cik, accession_number)}{filename}",
+        "size": files[filename]["size"] if filename in files else None,
+        "inline_xbrl": inline_xbrl,
+        "source": source,
+    }
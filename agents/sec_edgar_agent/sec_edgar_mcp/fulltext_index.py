@@ -0,0 +1,360 @@
+"""
+Persistent, incremental full-text index over the cached filings of one company.
+
+Each batch of newly indexed filings is written as an immutable segment: a JSON term
+dictionary plus a postings file of delta + varint encoded (doc id, term frequency)
+pairs. Postings files are read through ``mmap`` so a query only touches the pages of
+the terms it asks for. When too many segments accumulate they are merged into one.
+"""
+
+import json
+import math
+import mmap
+import os
+import tempfile
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import date
+from heapq import nlargest
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms fall back to the in-process lock only
+    fcntl = None
+
+from .search_index import tokenize
+
+INDEX_FORMAT_VERSION = 1
+MAX_SEGMENTS = 8
+
+
+def encode_varint(value: int, out: bytearray) -> None:
+    """Append an unsigned LEB128 varint to ``out``."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(buffer, position: int) -> Tuple[int, int]:
+    """Decode an unsigned LEB128 varint, returning (value, next_position)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = buffer[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def encode_postings(postings: Sequence[Tuple[int, int]]) -> bytes:
+    """Encode (doc_id, term_freq) pairs sorted by doc id as delta + varint bytes."""
+    out = bytearray()
+    previous = 0
+    for doc_id, freq in postings:
+        encode_varint(doc_id - previous, out)
+        encode_varint(freq, out)
+        previous = doc_id
+    return bytes(out)
+
+
+def decode_postings(buffer, start: int, end: int) -> Iterator[Tuple[int, int]]:
+    """Decode the delta + varint postings stored in ``buffer[start:end]``."""
+    doc_id = 0
+    position = start
+    while position < end:
+        delta, position = decode_varint(buffer, position)
+        freq, position = decode_varint(buffer, position)
+        doc_id += delta
+        yield doc_id, freq
+
+
+class _Segment:
+    """Read-only view of one index segment."""
+
+    def __init__(self, directory: str, name: str):
+        with open(os.path.join(directory, f"{name}.meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        self.name = name
+        self.term_ids: Dict[str, int] = {term: term_id for term_id, term in enumerate(meta["terms"])}
+        self.terms: List[str] = meta["terms"]
+        self.term_offsets: List[int] = meta["term_offsets"]
+        self.doc_freqs: List[int] = meta["doc_freqs"]
+        self.filings: List[str] = meta["filings"]
+        # Each doc is [filing position, start offset, end offset, token count]
+        self.docs: List[List[int]] = meta["docs"]
+
+        self._file = open(os.path.join(directory, f"{name}.post"), "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._postings = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+    def doc_freq(self, term: str) -> int:
+        term_id = self.term_ids.get(term)
+        return self.doc_freqs[term_id] if term_id is not None else 0
+
+    def postings(self, term: str) -> Iterator[Tuple[int, int]]:
+        term_id = self.term_ids.get(term)
+        if term_id is None:
+            return iter(())
+        return decode_postings(self._postings, self.term_offsets[term_id], self.term_offsets[term_id + 1])
+
+    def close(self) -> None:
+        if isinstance(self._postings, mmap.mmap):
+            self._postings.close()
+        self._file.close()
+
+
+class FullTextIndex:
+    """Incremental on-disk inverted index over the filings of one CIK."""
+
+    def __init__(self, directory: str, k1: float = 1.2, b: float = 0.75):
+        self.directory = directory
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._segments: Dict[str, _Segment] = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def indexed_accessions(self) -> Dict[str, Dict[str, Any]]:
+        """Get the accession -> filing metadata map of everything indexed so far."""
+        return self._read_manifest()["filings"]
+
+    def add_filings(self, filings: List[Dict[str, Any]]) -> int:
+        """Add filings as one new segment.
+
+        Each filing is a dict with ``accession_number``, ``form``, ``filing_date`` (ISO
+        string) and ``passages`` as (start_offset, end_offset, text) tuples. Filings that
+        are already indexed are skipped. Returns the number of filings added.
+        """
+        with self._write_lock():
+            manifest = self._read_manifest()
+            filings = [f for f in filings if f["accession_number"] not in manifest["filings"]]
+            if not filings:
+                return 0
+
+            postings: Dict[str, List[Tuple[int, int]]] = {}
+            docs: List[List[int]] = []
+            for filing_position, filing in enumerate(filings):
+                for start, end, text in filing["passages"]:
+                    tokens = tokenize(text)
+                    doc_id = len(docs)
+                    docs.append([filing_position, start, end, len(tokens)])
+                    for term, freq in Counter(tokens).items():
+                        postings.setdefault(term, []).append((doc_id, freq))
+
+            name = f"seg-{manifest['next_segment']:06d}"
+            self._write_segment(name, postings, docs, [f["accession_number"] for f in filings])
+
+            manifest["next_segment"] += 1
+            manifest["segments"].append(name)
+            for filing in filings:
+                manifest["filings"][filing["accession_number"]] = {
+                    "form": filing["form"],
+                    "filing_date": filing["filing_date"],
+                }
+
+            if len(manifest["segments"]) > MAX_SEGMENTS:
+                self._merge_segments(manifest)
+
+            self._write_manifest(manifest)
+            return len(filings)
+
+    def search(
+        self,
+        query: str,
+        form_types: Optional[List[str]] = None,
+        since: Optional[date] = None,
+        k: int = 10,
+        passages_per_filing: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """Rank indexed filings for a query.
+
+        Passages are scored with BM25 over all segments, then grouped by filing. Returns
+        up to ``k`` filings ordered by their best passage score.
+        """
+        terms = sorted(set(tokenize(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            manifest, segments = self._load_segments()
+
+            allowed = {
+                accession
+                for accession, meta in manifest["filings"].items()
+                if (not form_types or meta["form"] in form_types)
+                and (since is None or meta["filing_date"] >= since.isoformat())
+            }
+
+            doc_count = sum(len(segment.docs) for segment in segments)
+            if not doc_count or not allowed:
+                return []
+            avg_doc_length = (sum(doc[3] for segment in segments for doc in segment.docs) / doc_count) or 1.0
+
+            scores: Dict[Tuple[int, int], float] = {}
+            for term in terms:
+                doc_freq = sum(segment.doc_freq(term) for segment in segments)
+                if not doc_freq:
+                    continue
+                idf = math.log(1 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+
+                for segment_position, segment in enumerate(segments):
+                    for doc_id, freq in segment.postings(term):
+                        doc_length = segment.docs[doc_id][3]
+                        norm = self.k1 * (1 - self.b + self.b * doc_length / avg_doc_length)
+                        key = (segment_position, doc_id)
+                        scores[key] = scores.get(key, 0.0) + idf * freq * (self.k1 + 1) / (freq + norm)
+
+            by_filing: Dict[str, List[Tuple[float, int, int]]] = {}
+            for (segment_position, doc_id), score in scores.items():
+                filing_position, start, end, _ = segments[segment_position].docs[doc_id]
+                accession = segments[segment_position].filings[filing_position]
+                if accession in allowed:
+                    by_filing.setdefault(accession, []).append((score, start, end))
+
+            results = []
+            for accession, hits in by_filing.items():
+                best = nlargest(passages_per_filing, hits)
+                results.append(
+                    {
+                        "accession_number": accession,
+                        "form": manifest["filings"][accession]["form"],
+                        "filing_date": manifest["filings"][accession]["filing_date"],
+                        "score": best[0][0],
+                        "matching_passages": len(hits),
+                        "passages": [
+                            {"score": score, "start_offset": start, "end_offset": end} for score, start, end in best
+                        ],
+                    }
+                )
+
+            return nlargest(k, results, key=lambda r: (r["score"], r["filing_date"]))
+
+    def close(self) -> None:
+        """Release memory-mapped segment files."""
+        with self._lock:
+            for segment in self._segments.values():
+                segment.close()
+            self._segments.clear()
+
+    def _load_segments(self) -> Tuple[Dict[str, Any], List[_Segment]]:
+        """Read the manifest and open its segments, dropping segments merged away by other writers."""
+        for attempt in range(2):
+            manifest = self._read_manifest()
+            for name in [name for name in self._segments if name not in manifest["segments"]]:
+                self._segments.pop(name).close()
+            try:
+                return manifest, [self._open_segment(name) for name in manifest["segments"]]
+            except OSError:
+                # A concurrent merge replaced the segments between reading the manifest and opening them
+                if attempt:
+                    raise
+        return self._read_manifest(), []
+
+    def _open_segment(self, name: str) -> _Segment:
+        segment = self._segments.get(name)
+        if segment is None:
+            segment = _Segment(self.directory, name)
+            self._segments[name] = segment
+        return segment
+
+    def _write_segment(
+        self, name: str, postings: Dict[str, List[Tuple[int, int]]], docs: List[List[int]], filings: List[str]
+    ) -> None:
+        terms = sorted(postings)
+        term_offsets = [0]
+        doc_freqs = []
+        data = bytearray()
+        for term in terms:
+            term_postings = postings[term]
+            data += encode_postings(term_postings)
+            term_offsets.append(len(data))
+            doc_freqs.append(len(term_postings))
+
+        self._atomic_write(f"{name}.post", bytes(data))
+        meta = {
+            "version": INDEX_FORMAT_VERSION,
+            "terms": terms,
+            "term_offsets": term_offsets,
+            "doc_freqs": doc_freqs,
+            "filings": filings,
+            "docs": docs,
+        }
+        self._atomic_write(f"{name}.meta.json", json.dumps(meta, separators=(",", ":")).encode("utf-8"))
+
+    def _merge_segments(self, manifest: Dict[str, Any]) -> None:
+        """Merge all segments into one, remapping doc ids and filing positions."""
+        segments = [self._open_segment(name) for name in manifest["segments"]]
+
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        docs: List[List[int]] = []
+        filings: List[str] = []
+        for segment in segments:
+            doc_base = len(docs)
+            filing_base = len(filings)
+            filings.extend(segment.filings)
+            docs.extend([position + filing_base, start, end, length] for position, start, end, length in segment.docs)
+            for term in segment.terms:
+                term_postings = postings.setdefault(term, [])
+                term_postings.extend((doc_id + doc_base, freq) for doc_id, freq in segment.postings(term))
+
+        name = f"seg-{manifest['next_segment']:06d}"
+        self._write_segment(name, postings, docs, filings)
+        manifest["next_segment"] += 1
+
+        old_names = manifest["segments"]
+        manifest["segments"] = [name]
+        self._write_manifest(manifest)
+
+        for old_name in old_names:
+            segment = self._segments.pop(old_name, None)
+            if segment is not None:
+                segment.close()
+            for suffix in (".post", ".meta.json"):
+                try:
+                    os.remove(os.path.join(self.directory, old_name + suffix))
+                except OSError:
+                    pass
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        try:
+            with open(os.path.join(self.directory, "manifest.json"), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") == INDEX_FORMAT_VERSION:
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {"version": INDEX_FORMAT_VERSION, "next_segment": 1, "segments": [], "filings": {}}
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        self._atomic_write("manifest.json", json.dumps(manifest, separators=(",", ":")).encode("utf-8"))
+
+    def _atomic_write(self, filename: str, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, os.path.join(self.directory, filename))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @contextmanager
+    def _write_lock(self):
+        """Serialize writers within this process and, where supported, across processes."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(os.path.join(self.directory, ".lock"), "a+") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
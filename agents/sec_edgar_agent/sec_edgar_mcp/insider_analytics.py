@@ -0,0 +1,241 @@
+"""
+Vectorized aggregation of insider transactions.
+"""
+
+from typing import Any, Dict, List
+
+from .ownership_parser import TRANSACTION_CODES
+
+BUY = "buy"
+SELL = "sell"
+
+# Buy/sell category of each SEC transaction code; other codes (exercises, gifts, ...) are neither
+TRANSACTION_CATEGORIES = {
+    "P": BUY,  # Open-market or private purchase
+    "A": BUY,  # Grant or award from the issuer
+    "S": SELL,  # Open-market or private sale
+    "D": SELL,  # Disposition to the issuer
+    "F": SELL,  # Shares withheld for exercise price or taxes
+}
+
+# Categories of the sentiment series: only open-market trades, which insiders choose to make;
+# grants, tax withholding and dispositions to the issuer are compensation events
+OPEN_MARKET_CATEGORIES = {"P": BUY, "S": SELL}
+
+# Reporting-owner roles of the sentiment series and the flag column of each
+ROLES = {
+    "officer": "is_officer",
+    "director": "is_director",
+    "ten_percent_owner": "is_ten_percent_owner",
+}
+
+PERIODS = ("month", "week")
+
+_TOTAL_COLUMNS = ("shares_bought", "shares_sold", "value_bought", "value_sold")
+
+
+def categorize_transactions(frame, categories: Dict[str, str] = TRANSACTION_CATEGORIES):
+    """Add ``category``, ``shares`` and ``value`` columns used by the aggregations.
+
+    ``categories`` maps transaction codes to buy or sell. ``frame`` needs ``transaction_code``, ``shares`` and ``price_per_share`` columns, as
+    produced by ``OwnershipTransactions.to_dataframe`` or the insider store. Holding
+    rows are dropped when an ``is_holding`` column is present.
+    """
+    if "is_holding" in frame:
+        frame = frame[~frame["is_holding"].astype(bool)]
+
+    shares = frame["shares"].astype("float64").fillna(0.0)
+    value = (frame["shares"].astype("float64") * frame["price_per_share"].astype("float64")).fillna(0.0)
+    return frame.assign(
+        category=frame["transaction_code"].map(categories),
+        shares=shares,
+        value=value,
+    )
+
+
+def summarize_insider_activity(frame, recent: int = 10) -> Dict[str, Any]:
+    """Aggregate insider transactions into overall and per-insider buy/sell totals.
+
+    One group-by replaces per-row keyword matching: transaction codes are mapped to
+    buy/sell through ``TRANSACTION_CATEGORIES`` and all sums are column operations.
+    """
+    import numpy as np
+    import pandas as pd
+
+    frame = categorize_transactions(frame)
+    is_buy = frame["category"].eq(BUY).to_numpy()
+    is_sell = frame["category"].eq(SELL).to_numpy()
+    shares = frame["shares"].to_numpy()
+    value = frame["value"].to_numpy()
+
+    work = pd.DataFrame(
+        {
+            "insider": frame["owner_name"].fillna("").replace("", "Unknown").to_numpy(),
+            "buy_transactions": is_buy.astype(np.int64),
+            "sell_transactions": is_sell.astype(np.int64),
+            "shares_bought": np.where(is_buy, shares, 0.0),
+            "shares_sold": np.where(is_sell, shares, 0.0),
+            "value_bought": np.where(is_buy, value, 0.0),
+            "value_sold": np.where(is_sell, value, 0.0),
+        }
+    )
+
+    by_insider = work.groupby("insider", sort=True).agg(
+        transactions=("buy_transactions", "size"),
+        buy_transactions=("buy_transactions", "sum"),
+        sell_transactions=("sell_transactions", "sum"),
+        shares_bought=("shares_bought", "sum"),
+        shares_sold=("shares_sold", "sum"),
+        value_bought=("value_bought", "sum"),
+        value_sold=("value_sold", "sum"),
+    )
+    by_insider["net_shares"] = by_insider["shares_bought"] - by_insider["shares_sold"]
+    by_insider["buy_sell_ratio"] = _ratio(by_insider["buy_transactions"], by_insider["sell_transactions"])
+
+    totals = work[["buy_transactions", "sell_transactions", *_TOTAL_COLUMNS]].sum()
+    buys = int(totals["buy_transactions"])
+    sells = int(totals["sell_transactions"])
+
+    summary: Dict[str, Any] = {
+        "total_transactions": len(work),
+        "buy_transactions": buys,
+        "sell_transactions": sells,
+        "total_shares_bought": float(totals["shares_bought"]),
+        "total_shares_sold": float(totals["shares_sold"]),
+        "total_value_bought": float(totals["value_bought"]),
+        "total_value_sold": float(totals["value_sold"]),
+        "unique_insiders": len(by_insider),
+        "by_insider": by_insider.to_dict(orient="index"),
+        "recent_activity": _recent_activity(frame, recent),
+    }
+    summary["net_shares"] = int(summary["total_shares_bought"]) - int(summary["total_shares_sold"])
+    summary["net_value"] = summary["total_value_bought"] - summary["total_value_sold"]
+    summary["buy_sell_ratio"] = buys / sells if sells > 0 else float("inf")
+    return summary
+
+
+def sentiment_series(frame, period: str = "month") -> Dict[str, Any]:
+    """Bucket open-market insider buys and sells into a monthly or weekly series per reporting-owner role.
+
+    Only purchases (P) and sales (S) are counted (``OPEN_MARKET_CATEGORIES``), the same
+    trades as the open-market totals reported next to the series.
+
+    Each transaction is assigned a bucket index from its transaction date (falling back to
+    the filing date) and all series are built with ``np.bincount`` over those indices, so
+    the cost is a few array passes regardless of how many buckets or roles there are. A
+    transaction by an owner with several roles counts toward each of them. Weeks start on
+    Monday.
+
+    Returns:
+        ``periods`` (bucket start dates) and ``by_role``: for ``all`` and each role in
+        ``ROLES``, lists aligned with ``periods`` of buy/sell counts, shares, dollar values
+        and net shares and value
+    """
+    import numpy as np
+
+    if period not in PERIODS:
+        raise ValueError(f"period must be one of {', '.join(PERIODS)}")
+
+    frame = categorize_transactions(frame, OPEN_MARKET_CATEGORIES)
+    dates = _transaction_days(frame)
+    frame = frame[~np.isnat(dates)]
+    dates = dates[~np.isnat(dates)]
+    if not len(dates):
+        return {"period": period, "periods": [], "by_role": {}}
+
+    # Bucket index of each transaction counted from the earliest bucket, so empty periods stay in the series
+    if period == "month":
+        months = dates.astype("datetime64[M]").astype(np.int64)
+        index = months - months.min()
+        length = int(index.max()) + 1
+        buckets = (np.arange(length) + months.min()).astype("datetime64[M]").astype("datetime64[D]")
+    else:
+        # 1970-01-01 was a Thursday; shift so buckets start on Monday
+        mondays = (dates.astype(np.int64) + 3) // 7 * 7 - 3
+        index = (mondays - mondays.min()) // 7
+        length = int(index.max()) + 1
+        buckets = (np.arange(length) * 7 + mondays.min()).astype("datetime64[D]")
+
+    is_buy = frame["category"].eq(BUY).to_numpy()
+    is_sell = frame["category"].eq(SELL).to_numpy()
+    shares = frame["shares"].to_numpy()
+    value = frame["value"].to_numpy()
+
+    def bucketed(mask) -> Dict[str, List[float]]:
+        buys = mask & is_buy
+        sells = mask & is_sell
+        counts = {
+            "buy_transactions": np.bincount(index, weights=buys, minlength=length),
+            "sell_transactions": np.bincount(index, weights=sells, minlength=length),
+            "shares_bought": np.bincount(index, weights=np.where(buys, shares, 0.0), minlength=length),
+            "shares_sold": np.bincount(index, weights=np.where(sells, shares, 0.0), minlength=length),
+            "value_bought": np.bincount(index, weights=np.where(buys, value, 0.0), minlength=length),
+            "value_sold": np.bincount(index, weights=np.where(sells, value, 0.0), minlength=length),
+        }
+        counts["net_shares"] = counts["shares_bought"] - counts["shares_sold"]
+        counts["net_value"] = counts["value_bought"] - counts["value_sold"]
+        return {
+            name: values.astype(np.int64).tolist() if name.endswith("_transactions") else values.round(2).tolist()
+            for name, values in counts.items()
+        }
+
+    by_role = {"all": bucketed(np.ones(len(frame), dtype=bool))}
+    for role, column in ROLES.items():
+        if column in frame:
+            by_role[role] = bucketed(frame[column].astype(bool).to_numpy())
+
+    return {
+        "period": period,
+        "periods": [str(start) for start in buckets],
+        "by_role": by_role,
+    }
+
+
+def _transaction_days(frame):
+    """Transaction dates as ``datetime64[D]``, using the filing date where a row has none."""
+    import pandas as pd
+
+    dates = pd.to_datetime(frame["transaction_date"], errors="coerce")
+    if "filing_date" in frame:
+        dates = dates.fillna(pd.to_datetime(frame["filing_date"], errors="coerce"))
+    return dates.to_numpy(dtype="datetime64[D]")
+
+
+def _ratio(numerator, denominator):
+    """Element-wise ratio with ``inf`` where the denominator is zero, matching the overall ratio."""
+    import numpy as np
+
+    numerator = numerator.to_numpy(dtype=np.float64)
+    denominator = denominator.to_numpy(dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.full_like(numerator, np.inf), where=denominator > 0)
+
+
+def _recent_activity(frame, count: int):
+    """The ``count`` most recent transactions as dictionaries, newest first."""
+    if "transaction_date" in frame:
+        frame = frame.sort_values("transaction_date", ascending=False, kind="stable", na_position="last")
+    rows = frame.head(count)
+    return [
+        {
+            "date": _isoformat(transaction_date),
+            "insider": owner_name or "Unknown",
+            "type": TRANSACTION_CODES.get(code, code or ""),
+            "shares": float(shares),
+            "value": float(value),
+        }
+        for transaction_date, owner_name, code, shares, value in zip(
+            rows["transaction_date"] if "transaction_date" in rows else [None] * len(rows),
+            rows["owner_name"],
+            rows["transaction_code"],
+            rows["shares"],
+            rows["value"],
+        )
+    ]
+
+
+def _isoformat(value: Any) -> Any:
+    if value is None or value != value:
+        return None
+    if hasattr(value, "date"):
+        return value.date().isoformat()
+    return str(value)[:10]
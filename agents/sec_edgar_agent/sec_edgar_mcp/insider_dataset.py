@@ -0,0 +1,515 @@
+"""
+Columnar store of SEC's quarterly insider transactions data sets (Forms 3, 4 and 5).
+
+SEC publishes each quarter's ownership filings as a zip of tab-separated files
+(https://www.sec.gov/data-research/sec-markets-data/insider-transactions-data-sets).
+``ingest_quarter`` joins a quarter's transactions with its submissions and reporting
+owners and writes one directory of ``.npy`` column files per ingest: numbers and dates as
+fixed-width arrays, strings as int32 codes into a per-column dictionary. Queries
+memory-map the columns and filter them with vectorized comparisons, so years of
+insider history are answered without any SEC traffic.
+
+Ingest archives from the command line:
+    python -m sec_edgar_mcp.insider_dataset 2024q1_form345.zip 2024q2_form345.zip
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+
+from .config import get_cache_dir
+from .insider_store import owner_name_key
+
+DATASET_FORMAT_VERSION = 1
+
+# Data set columns of NONDERIV_TRANS.tsv and DERIV_TRANS.tsv and the column each is stored as
+TRANSACTION_FIELDS = {
+    "ACCESSION_NUMBER": "accession_number",
+    "SECURITY_TITLE": "security_title",
+    "TRANS_DATE": "transaction_date",
+    "TRANS_CODE": "transaction_code",
+    "TRANS_SHARES": "shares",
+    "TRANS_PRICEPERSHARE": "price_per_share",
+    "TRANS_ACQUIRED_DISP_CD": "acquired_disposed",
+    "SHRS_OWND_FOLWNG_TRANS": "shares_owned_after",
+    "DIRECT_INDIRECT_OWNERSHIP": "ownership_type",
+}
+
+SUBMISSION_FIELDS = (
+    "ACCESSION_NUMBER",
+    "FILING_DATE",
+    "DOCUMENT_TYPE",
+    "ISSUERCIK",
+    "ISSUERNAME",
+    "ISSUERTRADINGSYMBOL",
+)
+OWNER_FIELDS = ("ACCESSION_NUMBER", "RPTOWNERCIK", "RPTOWNERNAME", "RPTOWNER_RELATIONSHIP", "RPTOWNER_TITLE")
+
+# Stored columns by kind; names match the ownership parser and insider store so the analytics apply unchanged
+STRING_COLUMNS = (
+    "accession_number",
+    "form_type",
+    "issuer_name",
+    "issuer_ticker",
+    "security_title",
+    "transaction_code",
+    "acquired_disposed",
+    "ownership_type",
+    "owner_name",
+    "owner_title",
+)
+INT_COLUMNS = ("issuer_cik", "owner_cik")
+FLOAT_COLUMNS = ("shares", "price_per_share", "shares_owned_after")
+DATE_COLUMNS = ("filing_date", "transaction_date")
+FLAG_COLUMNS = ("is_derivative", "is_director", "is_officer", "is_ten_percent_owner", "is_other")
+
+# Reporting-owner relationship flags and the word each appears as in RPTOWNER_RELATIONSHIP
+_RELATIONSHIPS = {
+    "is_director": "DIRECTOR",
+    "is_officer": "OFFICER",
+    "is_ten_percent_owner": "TENPERCENTOWNER",
+    "is_other": "OTHER",
+}
+
+
+def get_dataset_dir() -> str:
+    """Get the directory of the ingested data sets (``SEC_EDGAR_INSIDER_DATASET_DIR`` or the cache directory)."""
+    return os.getenv("SEC_EDGAR_INSIDER_DATASET_DIR") or os.path.join(
+        get_cache_dir(), f"insider_dataset.v{DATASET_FORMAT_VERSION}"
+    )
+
+
+def quarter_name(archive_path: str) -> str:
+    """Partition name of an archive: ``2024q1`` for ``2024q1_form345.zip``, otherwise the file stem."""
+    stem = os.path.splitext(os.path.basename(archive_path))[0]
+    match = re.match(r"(\d{4}q[1-4])", stem, re.IGNORECASE)
+    return match.group(1).lower() if match else stem
+
+
+def _read_tsv(archive: zipfile.ZipFile, filename: str, columns: Sequence[str]):
+    """Read the given columns of one data set file as strings, with empty fields as missing."""
+    import csv
+
+    import pandas as pd
+
+    # Archives have the files at the top level, but match by basename in case they were repacked in a folder
+    member = next((n for n in archive.namelist() if os.path.basename(n).upper() == filename.upper()), None)
+    if member is None:
+        raise ValueError(f"{filename} not found in {archive.filename}")
+    with archive.open(member) as f:
+        return pd.read_csv(
+            f,
+            sep="\t",
+            usecols=list(columns),
+            dtype=str,
+            keep_default_na=False,
+            na_values=[""],
+            quoting=csv.QUOTE_NONE,
+            encoding_errors="replace",
+        )
+
+
+def _parse_dates(values):
+    """Parse data set dates (``15-JAN-2024``, or ISO) to ``datetime64[D]`` with NaT for missing."""
+    import pandas as pd
+
+    parsed = pd.to_datetime(values, format="%d-%b-%Y", errors="coerce")
+    iso = pd.to_datetime(values.where(parsed.isna()), format="%Y-%m-%d", errors="coerce")
+    return parsed.fillna(iso).to_numpy(dtype="datetime64[D]")
+
+
+def _parse_ints(values):
+    import numpy as np
+    import pandas as pd
+
+    return pd.to_numeric(values, errors="coerce").fillna(0).to_numpy(dtype=np.int64)
+
+
+def _identifier(value: Optional[str], kind: str) -> Optional[str]:
+    """A query's issuer or owner with CIK zero padding dropped, rejecting ones that would match everything."""
+    if value is None:
+        return None
+    clean = value.strip()
+    if clean.isdigit():
+        clean = clean.lstrip("0")
+    elif not owner_name_key(clean):
+        clean = ""
+    if not clean:
+        raise ValueError(f"Invalid {kind} identifier '{value}': expected a CIK, ticker or name")
+    return clean
+
+
+def _save_strings(directory: str, name: str, values) -> None:
+    """Dictionary-encode a string column: int32 codes (-1 for missing) plus the list of distinct values."""
+    import numpy as np
+    import pandas as pd
+
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    np.save(os.path.join(directory, f"{name}.npy"), codes.astype(np.int32))
+    with open(os.path.join(directory, f"{name}.dict.json"), "w", encoding="utf-8") as f:
+        json.dump([str(value) for value in uniques], f, separators=(",", ":"))
+
+
+def ingest_quarter(archive_path: str, directory: Optional[str] = None) -> Dict[str, Any]:
+    """Load one quarterly data set archive into the columnar store, replacing that quarter if present.
+
+    Each non-derivative and derivative transaction becomes one row carrying its filing's
+    issuer and reporting owners: the first owner's CIK, all owner names and titles joined
+    with "; ", and each relationship flag set if any owner has it. Every reporting owner is
+    also stored in a separate owners table so multi-owner filings can be found by any owner.
+
+    Returns:
+        The manifest entry of the quarter
+    """
+    import numpy as np
+    import pandas as pd
+
+    directory = directory or get_dataset_dir()
+    os.makedirs(directory, exist_ok=True)
+    quarter = quarter_name(archive_path)
+
+    with zipfile.ZipFile(archive_path) as archive:
+        submissions = _read_tsv(archive, "SUBMISSION.tsv", SUBMISSION_FIELDS).drop_duplicates("ACCESSION_NUMBER")
+        owners = _read_tsv(archive, "REPORTINGOWNER.tsv", OWNER_FIELDS)
+        tables = []
+        for filename, is_derivative in (("NONDERIV_TRANS.tsv", False), ("DERIV_TRANS.tsv", True)):
+            table = _read_tsv(archive, filename, list(TRANSACTION_FIELDS)).rename(columns=TRANSACTION_FIELDS)
+            table["is_derivative"] = is_derivative
+            tables.append(table)
+    transactions = pd.concat(tables, ignore_index=True)
+
+    relationship = owners["RPTOWNER_RELATIONSHIP"].fillna("").str.upper().str.replace(" ", "", regex=False)
+    for flag, word in _RELATIONSHIPS.items():
+        owners[flag] = relationship.str.contains(word, regex=False)
+    first = owners.drop_duplicates("ACCESSION_NUMBER").set_index("ACCESSION_NUMBER")
+    by_filing = pd.DataFrame(
+        {
+            "owner_cik": first["RPTOWNERCIK"],
+            "owner_name": first["RPTOWNERNAME"],
+            "owner_title": first["RPTOWNER_TITLE"],
+        }
+    )
+    # Most filings have one reporting owner, so only the others need their names joined group by group
+    shared = owners[owners["ACCESSION_NUMBER"].duplicated(keep=False)]
+    if len(shared):
+        joined = shared.groupby("ACCESSION_NUMBER", sort=False)[["RPTOWNERNAME", "RPTOWNER_TITLE"]].agg(
+            lambda values: "; ".join(values.dropna()) or None
+        )
+        by_filing.loc[joined.index, "owner_name"] = joined["RPTOWNERNAME"]
+        by_filing.loc[joined.index, "owner_title"] = joined["RPTOWNER_TITLE"]
+    by_filing = by_filing.join(owners.groupby("ACCESSION_NUMBER", sort=False)[list(_RELATIONSHIPS)].max())
+    transactions = transactions.join(submissions.set_index("ACCESSION_NUMBER"), on="accession_number").join(
+        by_filing, on="accession_number"
+    )
+
+    # One accession dictionary shared by both tables, so owner matches translate to transaction codes directly
+    accessions = pd.Index(submissions["ACCESSION_NUMBER"].dropna().unique())
+
+    staging = tempfile.mkdtemp(dir=directory, prefix=f".tmp-{quarter}-")
+    try:
+        rows = os.path.join(staging, "transactions")
+        owner_rows = os.path.join(staging, "owners")
+        os.makedirs(rows)
+        os.makedirs(owner_rows)
+
+        source = {
+            "form_type": transactions["DOCUMENT_TYPE"],
+            "issuer_name": transactions["ISSUERNAME"],
+            "issuer_ticker": transactions["ISSUERTRADINGSYMBOL"].str.upper(),
+        }
+        np.save(
+            os.path.join(rows, "accession_number.npy"),
+            accessions.get_indexer(transactions["accession_number"]).astype(np.int32),
+        )
+        for name in STRING_COLUMNS:
+            if name != "accession_number":
+                _save_strings(rows, name, source.get(name, transactions.get(name)))
+        np.save(os.path.join(rows, "issuer_cik.npy"), _parse_ints(transactions["ISSUERCIK"]))
+        np.save(os.path.join(rows, "owner_cik.npy"), _parse_ints(transactions["owner_cik"]))
+        for name in FLOAT_COLUMNS:
+            values = pd.to_numeric(transactions[name], errors="coerce").to_numpy(dtype=np.float64)
+            np.save(os.path.join(rows, f"{name}.npy"), values)
+        np.save(os.path.join(rows, "filing_date.npy"), _parse_dates(transactions["FILING_DATE"]))
+        np.save(os.path.join(rows, "transaction_date.npy"), _parse_dates(transactions["transaction_date"]))
+        for name in FLAG_COLUMNS:
+            np.save(os.path.join(rows, f"{name}.npy"), transactions[name].fillna(False).to_numpy(dtype=bool))
+
+        np.save(
+            os.path.join(owner_rows, "accession_number.npy"),
+            accessions.get_indexer(owners["ACCESSION_NUMBER"]).astype(np.int32),
+        )
+        np.save(os.path.join(owner_rows, "owner_cik.npy"), _parse_ints(owners["RPTOWNERCIK"]))
+        _save_strings(owner_rows, "owner_name", owners["RPTOWNERNAME"])
+        with open(os.path.join(staging, "accession_number.dict.json"), "w", encoding="utf-8") as f:
+            json.dump(list(accessions), f, separators=(",", ":"))
+
+        # Each ingest gets its own directory, so readers still on the previous one never see its files change
+        ingested_at = time.time()
+        partition = f"{quarter}.{int(ingested_at * 1000)}"
+        os.rename(staging, os.path.join(directory, partition))
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    entry = {
+        "quarter": quarter,
+        "path": partition,
+        "source": os.path.basename(archive_path),
+        "filings": len(accessions),
+        "transactions": len(transactions),
+        "owners": len(owners),
+        "ingested_at": ingested_at,
+    }
+    manifest = _read_manifest(directory)
+    previous = manifest["quarters"].get(quarter)
+    manifest["quarters"][quarter] = entry
+    _write_manifest(directory, manifest)
+
+    # Readers switch partitions when they next read the manifest; only then can the old one go
+    if previous is not None:
+        shutil.rmtree(os.path.join(directory, _partition_path(previous)), ignore_errors=True)
+    return entry
+
+
+def _partition_path(entry: Dict[str, Any]) -> str:
+    """Directory of a quarter's manifest entry; quarters ingested before versioned directories use their name."""
+    return entry.get("path") or entry["quarter"]
+
+
+def _read_manifest(directory: str) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(directory, "manifest.json"), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == DATASET_FORMAT_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {"version": DATASET_FORMAT_VERSION, "quarters": {}}
+
+
+def _write_manifest(directory: str, manifest: Dict[str, Any]) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, separators=(",", ":"))
+        os.replace(tmp_path, os.path.join(directory, "manifest.json"))
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class _Partition:
+    """One ingested quarter; columns are memory-mapped on first use and dictionaries loaded once."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._columns: Dict[str, Any] = {}
+        self._dictionaries: Dict[str, Any] = {}
+        self._name_keys = None
+
+    def column(self, table: str, name: str):
+        import numpy as np
+
+        key = f"{table}/{name}"
+        if key not in self._columns:
+            self._columns[key] = np.load(os.path.join(self.path, table, f"{name}.npy"), mmap_mode="r")
+        return self._columns[key]
+
+    def dictionary(self, table: str, name: str):
+        """Distinct values of a string column with ``None`` appended, so code -1 decodes to ``None``."""
+        import numpy as np
+
+        key = f"{table}/{name}"
+        if key not in self._dictionaries:
+            path = os.path.join(self.path, f"{name}.dict.json")
+            if name != "accession_number":
+                path = os.path.join(self.path, table, f"{name}.dict.json")
+            with open(path, "r", encoding="utf-8") as f:
+                values = json.load(f)
+            self._dictionaries[key] = np.array(values + [None], dtype=object)
+        return self._dictionaries[key]
+
+    def codes(self, table: str, name: str, predicate) -> Any:
+        """Codes of the dictionary values of a string column that satisfy ``predicate``."""
+        import numpy as np
+
+        values = self.dictionary(table, name)[:-1]
+        return np.fromiter((i for i, value in enumerate(values) if predicate(value)), dtype=np.int32)
+
+    def owner_name_codes(self, name: str):
+        """Codes of the owner names starting with ``name`` after ``owner_name_key`` normalization.
+
+        The normalized names are sorted once per partition, so each lookup is a binary search.
+        """
+        import numpy as np
+
+        if self._name_keys is None:
+            names = self.dictionary("owners", "owner_name")[:-1]
+            keys = np.array([owner_name_key(value) for value in names], dtype=str)
+            order = np.argsort(keys, kind="stable")
+            self._name_keys = (keys[order], order.astype(np.int32))
+        keys, codes = self._name_keys
+        key = owner_name_key(name)
+        return codes[np.searchsorted(keys, key, side="left") : np.searchsorted(keys, key + "\uffff", side="left")]
+
+    def select(self, issuer, owner, transaction_codes, since, until, include_derivative):
+        """Row numbers of the transactions matching all filters."""
+        import numpy as np
+
+        mask = np.ones(len(self.column("transactions", "issuer_cik")), dtype=bool)
+
+        if issuer:
+            if issuer.isdigit():
+                mask &= self.column("transactions", "issuer_cik") == int(issuer)
+            else:
+                ticker = issuer.upper()
+                codes = self.codes("transactions", "issuer_ticker", lambda value: value == ticker)
+                mask &= np.isin(self.column("transactions", "issuer_ticker"), codes)
+
+        if owner:
+            # Match against every reporting owner, then keep the transactions of their filings
+            if owner.isdigit():
+                matches = self.column("owners", "owner_cik") == int(owner)
+            else:
+                matches = np.isin(self.column("owners", "owner_name"), self.owner_name_codes(owner))
+            accessions = np.unique(self.column("owners", "accession_number")[matches])
+            mask &= np.isin(self.column("transactions", "accession_number"), accessions)
+
+        if transaction_codes:
+            wanted = {code.upper() for code in transaction_codes}
+            codes = self.codes("transactions", "transaction_code", lambda value: value in wanted)
+            mask &= np.isin(self.column("transactions", "transaction_code"), codes)
+
+        if since is not None or until is not None:
+            transaction_dates = self.column("transactions", "transaction_date")
+            dates = np.where(
+                np.isnat(transaction_dates), self.column("transactions", "filing_date"), transaction_dates
+            )
+            if since is not None:
+                mask &= dates >= np.datetime64(since, "D")
+            if until is not None:
+                mask &= dates <= np.datetime64(until, "D")
+
+        if not include_derivative:
+            mask &= ~self.column("transactions", "is_derivative")
+
+        return np.flatnonzero(mask)
+
+    def rows(self, index) -> Dict[str, Any]:
+        """Decoded columns of the given rows."""
+        data: Dict[str, Any] = {}
+        for name in STRING_COLUMNS:
+            data[name] = self.dictionary("transactions", name)[self.column("transactions", name)[index]]
+        for name in INT_COLUMNS + FLOAT_COLUMNS + DATE_COLUMNS + FLAG_COLUMNS:
+            data[name] = self.column("transactions", name)[index]
+        return data
+
+
+class InsiderDataset:
+    """Read side of the ingested data sets: vectorized filters over every quarter's column files."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or get_dataset_dir()
+        self._lock = threading.Lock()
+        self._partitions: Dict[str, Any] = {}
+
+    def quarters(self) -> Dict[str, Dict[str, Any]]:
+        """Manifest entries of the ingested quarters, by quarter name."""
+        return _read_manifest(self.directory)["quarters"]
+
+    def _partition(self, quarter: str, entry: Dict[str, Any]) -> _Partition:
+        # Re-open a quarter that was ingested again since it was last mapped
+        with self._lock:
+            cached = self._partitions.get(quarter)
+            path = _partition_path(entry)
+            if cached is None or cached[0] != path:
+                cached = (path, _Partition(os.path.join(self.directory, path)))
+                self._partitions[quarter] = cached
+            return cached[1]
+
+    def query(
+        self,
+        issuer: Optional[str] = None,
+        owner: Optional[str] = None,
+        transaction_codes: Optional[Sequence[str]] = None,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        include_derivative: bool = True,
+        limit: Optional[int] = None,
+    ):
+        """Get matching transactions as a DataFrame, newest first.
+
+        Args:
+            issuer: Issuer CIK or ticker symbol
+            owner: Reporting owner CIK, or the start of their name as filed ("Last First")
+            transaction_codes: SEC transaction codes to keep, e.g. ``["P", "S"]``
+            since: Earliest transaction date (the filing date for rows without one)
+            until: Latest transaction date
+            include_derivative: Whether to include derivative transactions
+            limit: Maximum number of rows
+        """
+        import numpy as np
+        import pandas as pd
+
+        issuer = _identifier(issuer, "issuer")
+        owner = _identifier(owner, "owner")
+
+        frames = []
+        for quarter, entry in sorted(self.quarters().items()):
+            partition = self._partition(quarter, entry)
+            index = partition.select(issuer, owner, transaction_codes, since, until, include_derivative)
+            if len(index):
+                frames.append(pd.DataFrame(partition.rows(index)))
+        if not frames:
+            columns = STRING_COLUMNS + INT_COLUMNS + FLOAT_COLUMNS + DATE_COLUMNS + FLAG_COLUMNS
+            return pd.DataFrame({name: np.empty(0) for name in columns})
+
+        frame = pd.concat(frames, ignore_index=True)
+        frame["_date"] = frame["transaction_date"].fillna(frame["filing_date"])
+        frame = frame.sort_values(["_date", "accession_number"], ascending=[False, True], kind="stable")
+        frame = frame.drop(columns="_date").reset_index(drop=True)
+        return frame.head(limit) if limit is not None else frame
+
+
+_dataset: Optional[InsiderDataset] = None
+_dataset_lock = threading.Lock()
+
+
+def get_insider_dataset() -> InsiderDataset:
+    """Get the process-wide reader of the ingested insider data sets."""
+    global _dataset
+    if _dataset is None:
+        with _dataset_lock:
+            if _dataset is None:
+                _dataset = InsiderDataset()
+    return _dataset
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Ingest SEC insider transactions data set archives (Forms 3, 4, 5)")
+    parser.add_argument("archives", nargs="+", help="Quarterly data set zip files, e.g. 2024q1_form345.zip")
+    parser.add_argument(
+        "--directory", help="Store directory (default: SEC_EDGAR_INSIDER_DATASET_DIR or the cache directory)"
+    )
+    args = parser.parse_args(argv)
+
+    for archive in args.archives:
+        started = time.perf_counter()
+        entry = ingest_quarter(archive, args.directory)
+        print(
+            f"{entry['quarter']}: {entry['transactions']:,} transactions from {entry['filings']:,} filings "
+            f"in {time.perf_counter() - started:.1f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
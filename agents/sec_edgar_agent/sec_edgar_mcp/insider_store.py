@@ -0,0 +1,508 @@
+"""
+Persistent, incremental store of insider transactions parsed from Form 3/4/5 filings.
+
+Filed ownership documents never change, so each accession is downloaded and parsed
+once and its rows appended to a SQLite database in the cache directory. Tools then
+answer from indexed queries and only fetch the accessions the store has not seen.
+
+Every stored filing also adds one row per reporting owner to an inverted index from
+owner CIK and name to issuer and accession, so "what else has this insider traded"
+is an index lookup instead of a crawl across issuers.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .config import get_cache_dir
+from .ownership_parser import TRANSACTION_CODES, OwnershipDocument, parse_ownership_xml
+from .utils.circuit_breaker import get_circuit_breaker
+
+STORE_FORMAT_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ownership_filings (
+    accession_number TEXT PRIMARY KEY,
+    issuer_cik TEXT NOT NULL,
+    form_type TEXT,
+    filing_date TEXT,
+    period_of_report TEXT,
+    company_name TEXT,
+    url TEXT,
+    owner_cik TEXT,
+    owner_name TEXT,
+    owner_title TEXT,
+    is_director INTEGER,
+    is_officer INTEGER,
+    is_ten_percent_owner INTEGER,
+    is_other INTEGER,
+    parsed INTEGER NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS insider_transactions (
+    accession_number TEXT NOT NULL,
+    row_index INTEGER NOT NULL,
+    issuer_cik TEXT NOT NULL,
+    form_type TEXT,
+    filing_date TEXT,
+    transaction_date TEXT,
+    security_title TEXT,
+    transaction_code TEXT,
+    acquired_disposed TEXT,
+    shares REAL,
+    price_per_share REAL,
+    shares_owned_after REAL,
+    conversion_price REAL,
+    underlying_shares REAL,
+    ownership_type TEXT,
+    ownership_nature TEXT,
+    owner_cik TEXT,
+    owner_name TEXT,
+    owner_title TEXT,
+    is_derivative INTEGER,
+    is_holding INTEGER,
+    is_director INTEGER,
+    is_officer INTEGER,
+    is_ten_percent_owner INTEGER,
+    is_other INTEGER,
+    PRIMARY KEY (accession_number, row_index)
+);
+CREATE TABLE IF NOT EXISTS reporting_owners (
+    accession_number TEXT NOT NULL,
+    owner_index INTEGER NOT NULL,
+    owner_cik TEXT,
+    owner_name TEXT,
+    owner_name_key TEXT,
+    owner_title TEXT,
+    is_director INTEGER,
+    is_officer INTEGER,
+    is_ten_percent_owner INTEGER,
+    is_other INTEGER,
+    issuer_cik TEXT NOT NULL,
+    issuer_name TEXT,
+    issuer_ticker TEXT,
+    form_type TEXT,
+    filing_date TEXT,
+    PRIMARY KEY (accession_number, owner_index)
+);
+CREATE INDEX IF NOT EXISTS idx_ownership_filings_issuer ON ownership_filings (issuer_cik, filing_date);
+CREATE INDEX IF NOT EXISTS idx_insider_transactions_issuer ON insider_transactions (issuer_cik, transaction_date);
+CREATE INDEX IF NOT EXISTS idx_insider_transactions_owner ON insider_transactions (owner_cik, transaction_date);
+CREATE INDEX IF NOT EXISTS idx_insider_transactions_date ON insider_transactions (transaction_date);
+CREATE INDEX IF NOT EXISTS idx_reporting_owners_cik ON reporting_owners (owner_cik, filing_date);
+CREATE INDEX IF NOT EXISTS idx_reporting_owners_name ON reporting_owners (owner_name_key, filing_date);
+"""
+
+# Columns of insider_transactions filled from the parser's table, in insert order
+_ROW_COLUMNS = (
+    "form_type",
+    "filing_date",
+    "transaction_date",
+    "security_title",
+    "transaction_code",
+    "acquired_disposed",
+    "shares",
+    "price_per_share",
+    "shares_owned_after",
+    "conversion_price",
+    "underlying_shares",
+    "ownership_type",
+    "ownership_nature",
+    "owner_cik",
+    "owner_name",
+    "owner_title",
+    "is_derivative",
+    "is_holding",
+    "is_director",
+    "is_officer",
+    "is_ten_percent_owner",
+    "is_other",
+)
+
+_FLAG_COLUMNS = ("is_director", "is_officer", "is_ten_percent_owner", "is_other", "is_derivative", "is_holding")
+
+
+def _iso(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)[:10]
+
+
+def owner_name_key(name: str) -> str:
+    """Normalize an owner name for prefix lookups: upper case, punctuation dropped, single spaces.
+
+    Ownership filings list people as "Last First Middle", e.g. "COOK TIMOTHY D".
+    """
+    return " ".join("".join(c if c.isalnum() else " " for c in name.upper()).split())
+
+
+def _accession_list(accession_numbers: Sequence[str]) -> str:
+    """Encode accession numbers as one JSON parameter, read back with ``json_each``.
+
+    A single parameter avoids SQLite's limit on bound parameters for large windows.
+    """
+    return json.dumps(list(accession_numbers))
+
+
+class InsiderStore:
+    """SQLite store of ownership filings and their transaction rows, keyed by accession number.
+
+    Connections are per thread and the database runs in WAL mode, so request threads
+    and worker processes sharing the cache directory can read while one writes.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(get_cache_dir(), f"insider_transactions.v{STORE_FORMAT_VERSION}.sqlite3")
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def stored_accessions(self, accession_numbers: Sequence[str]) -> set:
+        """Get the subset of accession numbers already in the store."""
+        rows = self._connection().execute(
+            "SELECT accession_number FROM ownership_filings "
+            "WHERE accession_number IN (SELECT value FROM json_each(?))",
+            (_accession_list(accession_numbers),),
+        )
+        return {row[0] for row in rows}
+
+    def add(self, issuer_cik: str, filing: Any, document: Optional[OwnershipDocument]) -> None:
+        """Store one filing and its parsed rows; ``document`` is None for filings without ownership XML."""
+        owner = document.owner_summary() if document is not None else {}
+        filing_row = (
+            filing.accession_number,
+            str(issuer_cik),
+            filing.form,
+            _iso(filing.filing_date),
+            document.period_of_report if document is not None else None,
+            getattr(filing, "company", None),
+            getattr(filing, "url", None),
+            "; ".join(o["cik"] for o in document.owners if o["cik"]) if document is not None else None,
+            owner.get("name"),
+            owner.get("title"),
+            int(owner.get("is_director", False)),
+            int(owner.get("is_officer", False)),
+            int(owner.get("is_ten_percent_owner", False)),
+            int(owner.get("is_other", False)),
+            int(document is not None),
+            time.time(),
+        )
+
+        rows = []
+        if document is not None:
+            table = document.transactions
+            columns = [table.column(name) for name in _ROW_COLUMNS]
+            for position, index in enumerate(range(document.start, document.stop)):
+                record = [filing.accession_number, position, str(issuer_cik)]
+                for name, column in zip(_ROW_COLUMNS, columns):
+                    value = column[index]
+                    if name in ("filing_date", "transaction_date"):
+                        value = date.fromordinal(value).isoformat() if value else None
+                    elif isinstance(value, float) and value != value:
+                        value = None
+                    record.append(value)
+                rows.append(record)
+
+        owner_rows = []
+        if document is not None:
+            for index, reporting_owner in enumerate(document.owners):
+                owner_rows.append(
+                    (
+                        filing.accession_number,
+                        index,
+                        _normalize_cik(reporting_owner["cik"]),
+                        reporting_owner["name"],
+                        owner_name_key(reporting_owner["name"]),
+                        reporting_owner["title"],
+                        int(reporting_owner["is_director"]),
+                        int(reporting_owner["is_officer"]),
+                        int(reporting_owner["is_ten_percent_owner"]),
+                        int(reporting_owner["is_other"]),
+                        str(issuer_cik),
+                        document.issuer_name or getattr(filing, "company", None),
+                        document.issuer_ticker or None,
+                        filing.form,
+                        _iso(filing.filing_date),
+                    )
+                )
+
+        placeholders = ",".join("?" * (3 + len(_ROW_COLUMNS)))
+        with self._write_lock:
+            connection = self._connection()
+            with connection:
+                connection.execute(
+                    f"INSERT OR REPLACE INTO ownership_filings VALUES ({','.join('?' * len(filing_row))})", filing_row
+                )
+                connection.executemany(
+                    f"INSERT OR REPLACE INTO insider_transactions "
+                    f"(accession_number, row_index, issuer_cik, {', '.join(_ROW_COLUMNS)}) VALUES ({placeholders})",
+                    rows,
+                )
+                connection.executemany(
+                    f"INSERT OR REPLACE INTO reporting_owners VALUES ({','.join('?' * 15)})", owner_rows
+                )
+
+    def sync(self, issuer_cik: str, filings: Iterable[Any]) -> Dict[str, str]:
+        """Download and parse the filings the store has not seen yet.
+
+        Filings whose XML cannot be fetched are left out so they are retried next time;
+        filings that have no ownership XML are recorded so they are not fetched again.
+
+        Returns:
+            The filings that could not be fetched, as ``{accession number: error}``
+        """
+        filings = list(filings)
+        stored = self.stored_accessions([f.accession_number for f in filings])
+        failed: Dict[str, str] = {}
+        for filing in filings:
+            if filing.accession_number in stored:
+                continue
+            if not get_circuit_breaker().allows_requests():
+                # SEC is failing; report the rest as not fetched instead of queueing behind the open circuit
+                failed[filing.accession_number] = "SEC is unavailable; not fetched"
+                continue
+            try:
+                xml = filing.xml()
+            except Exception as e:
+                # Throttling, 5xx and connection errors were counted by the circuit breaker in edgartools' transport
+                failed[filing.accession_number] = str(e)
+                continue
+            try:
+                document = parse_ownership_xml(xml, filing.accession_number, filing.filing_date) if xml else None
+            except Exception:
+                document = None
+            self.add(issuer_cik, filing, document)
+        return failed
+
+    def filings(
+        self,
+        issuer_cik: str,
+        since: Optional[date] = None,
+        form_types: Optional[Sequence[str]] = None,
+        accession_numbers: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get stored filings of an issuer, newest first."""
+        query = "SELECT * FROM ownership_filings WHERE issuer_cik = ?"
+        params: List[Any] = [str(issuer_cik)]
+        if accession_numbers is not None:
+            if not accession_numbers:
+                return []
+            query += " AND accession_number IN (SELECT value FROM json_each(?))"
+            params.append(_accession_list(accession_numbers))
+        if since is not None:
+            query += " AND filing_date >= ?"
+            params.append(since.isoformat())
+        if form_types:
+            query += f" AND form_type IN ({','.join('?' * len(form_types))})"
+            params.extend(form_types)
+        query += " ORDER BY filing_date DESC, accession_number DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [_filing_record(row) for row in self._connection().execute(query, params)]
+
+    def transactions(
+        self,
+        issuer_cik: Optional[str] = None,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        owner_cik: Optional[str] = None,
+        accession_numbers: Optional[Sequence[str]] = None,
+        include_holdings: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get stored transaction rows, newest transaction first.
+
+        ``since`` and ``until`` bound the transaction date, falling back to the filing
+        date for rows without one.
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        if issuer_cik is not None:
+            clauses.append("issuer_cik = ?")
+            params.append(str(issuer_cik))
+        if owner_cik is not None:
+            clauses.append("owner_cik = ?")
+            params.append(owner_cik)
+        if since is not None:
+            clauses.append("COALESCE(transaction_date, filing_date) >= ?")
+            params.append(since.isoformat())
+        if until is not None:
+            clauses.append("COALESCE(transaction_date, filing_date) <= ?")
+            params.append(until.isoformat())
+        if accession_numbers is not None:
+            if not accession_numbers:
+                return []
+            clauses.append("accession_number IN (SELECT value FROM json_each(?))")
+            params.append(_accession_list(accession_numbers))
+        if not include_holdings:
+            clauses.append("is_holding = 0")
+
+        query = "SELECT * FROM insider_transactions"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY COALESCE(transaction_date, filing_date) DESC, accession_number, row_index"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [_transaction_record(row) for row in self._connection().execute(query, params)]
+
+    def transaction_frame(self, accession_numbers: Sequence[str], include_holdings: bool = False):
+        """Get the stored rows of the given filings as a pandas DataFrame for vectorized analysis."""
+        import pandas as pd
+
+        query = "SELECT * FROM insider_transactions WHERE accession_number IN (SELECT value FROM json_each(?))"
+        if not include_holdings:
+            query += " AND is_holding = 0"
+        return pd.read_sql_query(query, self._connection(), params=(_accession_list(accession_numbers),))
+
+    def owner_filings(
+        self,
+        owner_cik: Optional[str] = None,
+        owner_name: Optional[str] = None,
+        since: Optional[date] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get the indexed filings of a reporting owner across all issuers, newest first.
+
+        ``owner_cik`` matches exactly (leading zeros ignored); ``owner_name`` matches owner
+        names starting with it after ``owner_name_key`` normalization. Both are index range scans.
+        """
+        query, params = self._owner_query(owner_cik, owner_name, since)
+        query = f"SELECT * FROM reporting_owners WHERE {query} ORDER BY filing_date DESC, accession_number DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [_owner_record(row) for row in self._connection().execute(query, params)]
+
+    def owner_issuers(
+        self, owner_cik: Optional[str] = None, owner_name: Optional[str] = None, since: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """Get one summary per issuer a reporting owner has filed on, most recent activity first.
+
+        Each summary has the owner's filing count and date range at that issuer, their latest
+        title and roles, and the open-market purchase and sale counts and shares from the
+        stored transactions of those filings.
+        """
+        query, params = self._owner_query(owner_cik, owner_name, since)
+        rows = self._connection().execute(
+            f"""
+            WITH owned AS (SELECT * FROM reporting_owners WHERE {query}),
+            latest AS (
+                SELECT issuer_cik, owner_title, is_director, is_officer, is_ten_percent_owner, is_other,
+                       ROW_NUMBER() OVER (PARTITION BY issuer_cik ORDER BY filing_date DESC, accession_number DESC) AS n
+                FROM owned
+            ),
+            trades AS (
+                SELECT t.issuer_cik,
+                       SUM(t.transaction_code = 'P') AS open_market_purchases,
+                       SUM(t.transaction_code = 'S') AS open_market_sales,
+                       SUM(CASE WHEN t.transaction_code = 'P' THEN t.shares ELSE 0 END) AS shares_bought,
+                       SUM(CASE WHEN t.transaction_code = 'S' THEN t.shares ELSE 0 END) AS shares_sold
+                FROM insider_transactions t
+                WHERE t.is_holding = 0 AND t.accession_number IN (SELECT DISTINCT accession_number FROM owned)
+                GROUP BY t.issuer_cik
+            )
+            SELECT o.issuer_cik, MAX(o.issuer_name) AS issuer_name, MAX(o.issuer_ticker) AS issuer_ticker,
+                   COUNT(DISTINCT o.accession_number) AS filings,
+                   MIN(o.filing_date) AS first_filing_date, MAX(o.filing_date) AS last_filing_date,
+                   l.owner_title, l.is_director, l.is_officer, l.is_ten_percent_owner, l.is_other,
+                   COALESCE(t.open_market_purchases, 0) AS open_market_purchases,
+                   COALESCE(t.open_market_sales, 0) AS open_market_sales,
+                   COALESCE(t.shares_bought, 0) AS shares_bought,
+                   COALESCE(t.shares_sold, 0) AS shares_sold
+            FROM owned o
+            JOIN latest l ON l.issuer_cik = o.issuer_cik AND l.n = 1
+            LEFT JOIN trades t ON t.issuer_cik = o.issuer_cik
+            GROUP BY o.issuer_cik
+            ORDER BY last_filing_date DESC
+            """,
+            params,
+        )
+        return [_owner_record(row) for row in rows]
+
+    def _owner_query(
+        self, owner_cik: Optional[str], owner_name: Optional[str], since: Optional[date]
+    ) -> Tuple[str, List[Any]]:
+        """WHERE clause selecting one owner's rows of ``reporting_owners``."""
+        if owner_cik:
+            clauses = ["owner_cik = ?"]
+            params: List[Any] = [_normalize_cik(owner_cik)]
+        elif owner_name and owner_name_key(owner_name):
+            # Prefix match as a range so the name index is used
+            key = owner_name_key(owner_name)
+            clauses = ["owner_name_key >= ?", "owner_name_key < ?"]
+            params = [key, key + "\uffff"]
+        else:
+            raise ValueError("owner_cik or owner_name is required")
+        if since is not None:
+            clauses.append("filing_date >= ?")
+            params.append(since.isoformat())
+        return " AND ".join(clauses), params
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+def _normalize_cik(cik: Any) -> str:
+    return str(cik).strip().lstrip("0")
+
+
+def _owner_record(row: sqlite3.Row) -> Dict[str, Any]:
+    record = dict(row)
+    record.pop("owner_name_key", None)
+    for name in ("is_director", "is_officer", "is_ten_percent_owner", "is_other"):
+        if name in record:
+            record[name] = bool(record[name])
+    return record
+
+
+def _filing_record(row: sqlite3.Row) -> Dict[str, Any]:
+    record = dict(row)
+    for name in ("is_director", "is_officer", "is_ten_percent_owner", "is_other", "parsed"):
+        record[name] = bool(record[name])
+    return record
+
+
+def _transaction_record(row: sqlite3.Row) -> Dict[str, Any]:
+    record = dict(row)
+    for name in _FLAG_COLUMNS:
+        record[name] = bool(record[name])
+    record["transaction_type"] = TRANSACTION_CODES.get(record["transaction_code"] or "", "")
+    return record
+
+
+_store: Optional[InsiderStore] = None
+_store_lock = threading.Lock()
+
+
+def get_insider_store() -> InsiderStore:
+    """Get the process-wide insider transaction store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = InsiderStore()
+    return _store
@@ -0,0 +1,599 @@
+"""
+Streaming parser for inline XBRL (iXBRL) filings, producing a typed fact table.
+
+One regex scan over the document stops only at XBRL tags: ``xbrli:context`` and
+``xbrli:unit`` definitions and every ``ix:nonFraction`` / ``ix:nonNumeric`` fact, with
+``ix:continuation`` chains joined and ``ix:exclude`` content dropped. The surrounding
+HTML is never parsed. Input can be fed in chunks (for example straight from an HTTP
+response) and only the fact being read is buffered, so memory is bounded by the size of
+the fact table rather than the document.
+
+Numeric values follow the iXBRL rules instead of guessing from the displayed text: the
+``format`` transform (``ixt:num-dot-decimal``, ``ixt:num-comma-decimal``,
+``ixt:fixed-zero``/``zerodash``, ``ixt-sec:numwordsen``, ...) parses the text, ``scale``
+shifts the decimal point and ``sign="-"`` negates it. Parentheses are only presentation.
+"""
+
+import codecs
+import html
+import json
+import re
+from array import array
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .filing_index import fetch_filing_index, inline_xbrl_document
+from .submission_reader import read_submission
+from .utils.accession import normalize_accession_number
+from .utils.cache import FilingCache
+from .utils.sec_http import sec_get
+
+FACT_TABLE_VERSION = 1
+
+# Longest text kept per non-numeric fact (text blocks can hold whole notes)
+MAX_TEXT_LENGTH = 8192
+
+# Transform local names (ixt versions 1-4 and ixt-sec) grouped by how the text is read
+_ZERO_FORMATS = {"zerodash", "fixed-zero", "fixedzero", "numdash", "nocontent", "fixed-empty"}
+_COMMA_DECIMAL_FORMATS = {"numcommadecimal", "num-comma-decimal", "numdotcomma", "numspacecomma", "numcomma"}
+_UNIT_DECIMAL_FORMATS = {"numunitdecimal", "num-unit-decimal", "numunitdecimalin"}
+_WORD_FORMATS = {"numwordsen", "num-word-en", "numwordsno"}
+
+_NUMBER_WORDS = {
+    "no": 0, "none": 0, "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7,
+    "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12, "thirteen": 13, "fourteen": 14, "fifteen": 15,
+    "sixteen": 16, "seventeen": 17, "eighteen": 18, "nineteen": 19, "twenty": 20, "thirty": 30, "forty": 40,
+    "fifty": 50, "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90,
+}
+_NUMBER_SCALES = {"hundred": 100, "thousand": 1000, "million": 10**6, "billion": 10**9, "trillion": 10**12}
+
+# Axes (by local name) of each kind of segment breakdown
+SEGMENT_AXES = {
+    "geographic": ("StatementGeographicalAxis",),
+    "business": ("StatementBusinessSegmentsAxis",),
+    "product": ("ProductOrServiceAxis",),
+}
+
+_WHITESPACE = re.compile(r"\s+")
+_WORD_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+
+_cache: Optional[FilingCache] = None
+
+
+def _words_to_number(text: str) -> Optional[Decimal]:
+    total = current = 0
+    found = False
+    for word in re.findall(r"[a-z]+", text.lower()):
+        if word in _NUMBER_WORDS:
+            current += _NUMBER_WORDS[word]
+            found = True
+        elif word == "hundred":
+            current *= 100
+        elif word in _NUMBER_SCALES:
+            total += current * _NUMBER_SCALES[word]
+            current = 0
+    return Decimal(total + current) if found else None
+
+
+def parse_number(text: str, format_name: Optional[str] = None) -> Optional[Decimal]:
+    """Read the displayed text of an ``ix:nonFraction`` with its ``format`` transform, before scale and sign."""
+    transform = (format_name or "").rpartition(":")[2].lower()
+    text = text.strip()
+
+    if transform in _ZERO_FORMATS:
+        return Decimal(0)
+    if transform in _WORD_FORMATS:
+        return _words_to_number(text)
+    if transform in _UNIT_DECIMAL_FORMATS:
+        # "5 dollars 20 cents": whole units, then the fractional part
+        groups = re.findall(r"\d+", text)
+        if not groups:
+            return None
+        return Decimal(f"{''.join(groups[:-1]) or groups[0]}.{groups[-1]}") if len(groups) > 1 else Decimal(groups[0])
+    if transform in _COMMA_DECIMAL_FORMATS:
+        digits = re.sub(r"[^\d,]", "", text).replace(",", ".")
+    else:
+        digits = re.sub(r"[^\d.]", "", text)
+
+    if not digits.strip("."):
+        # A dash or empty cell without a zero transform is how some filers show zero
+        return Decimal(0) if text in ("-", "—", "–", "") else None
+    try:
+        return Decimal(digits)
+    except InvalidOperation:
+        return None
+
+
+class FactTable:
+    """Facts of one inline XBRL document in columns, with their contexts and units.
+
+    ``value`` holds numeric facts as float64 (NaN for text and nil facts) and ``text`` the
+    displayed text; ``exact`` keeps each numeric value as a decimal string so results can
+    be reported without floating-point rounding.
+    """
+
+    COLUMNS = ("name", "value", "exact", "text", "decimals", "scale", "context_id", "unit_id", "fact_id")
+
+    def __init__(self):
+        self.contexts: Dict[str, Dict[str, Any]] = {}
+        self.units: Dict[str, str] = {}
+        self.name: List[str] = []
+        self.value = array("d")
+        self.exact: List[Optional[str]] = []
+        self.text: List[Optional[str]] = []
+        self.decimals: List[Optional[str]] = []
+        self.scale = array("i")
+        self.context_id: List[str] = []
+        self.unit_id: List[Optional[str]] = []
+        self.fact_id: List[Optional[str]] = []
+        # Fact indexes by lower-cased name and local name, built on the first lookup
+        self._by_name: Optional[Tuple[int, Dict[str, List[int]]]] = None
+        # Contexts qualified by a single dimension, by axis, built on the first breakdown
+        self._by_axis: Optional[Tuple[int, Dict[str, Dict[str, str]]]] = None
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+    def append(self, name: str, value: Optional[Decimal], text: Optional[str], attrs: Dict[str, Any]) -> int:
+        scale = attrs.get("scale") or "0"
+        self.name.append(name)
+        self.value.append(float(value) if value is not None else float("nan"))
+        self.exact.append(_exact(value) if value is not None else None)
+        self.text.append(text)
+        self.decimals.append(attrs.get("decimals"))
+        self.scale.append(int(scale) if scale.lstrip("-").isdigit() else 0)
+        self.context_id.append(attrs.get("contextref") or "")
+        self.unit_id.append(attrs.get("unitref"))
+        self.fact_id.append(attrs.get("id"))
+        return len(self.name) - 1
+
+    def concepts(self) -> List[str]:
+        """Distinct fact names (``prefix:LocalName``) in document order."""
+        return list(dict.fromkeys(self.name))
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """One fact with its period, dimensions and unit resolved."""
+        context = self.contexts.get(self.context_id[index], {})
+        exact = self.exact[index]
+        return {
+            "concept": self.name[index],
+            "value": _number(exact) if exact is not None else self.text[index],
+            "exact_value": exact,
+            "raw_value": self.text[index] if exact is not None else None,
+            "is_numeric": exact is not None,
+            "unit": self.units.get(self.unit_id[index] or "", self.unit_id[index]),
+            "decimals": self.decimals[index],
+            "scale": self.scale[index],
+            "context": self.context_id[index],
+            "period_type": context.get("period_type"),
+            "period_start": context.get("start"),
+            "period_end": context.get("end"),
+            "dimensions": dict(context.get("dimensions", {})),
+            "fact_id": self.fact_id[index],
+        }
+
+    def matching(self, concept: str) -> List[int]:
+        """Indexes of the facts named ``concept``: an exact local name or ``prefix:name`` match, ignoring case."""
+        if self._by_name is None or self._by_name[0] != len(self):
+            by_name: Dict[str, List[int]] = {}
+            for i, name in enumerate(self.name):
+                by_name.setdefault(name.lower(), []).append(i)
+                if ":" in name:
+                    by_name.setdefault(name.rpartition(":")[2].lower(), []).append(i)
+            self._by_name = (len(self), by_name)
+        return list(self._by_name[1].get(concept.lower(), []))
+
+    def lookup(self, concept: str) -> Optional[Dict[str, Any]]:
+        """The fact a financial statement would show for ``concept``, or None.
+
+        Names are matched exactly first and then as a substring of the local name (so
+        ``Revenue`` still finds a company-specific ``RevenueNet``). Among the matches, facts
+        without dimensions come first, then the document's own period (the context of
+        ``dei:DocumentPeriodEndDate``), then the latest and longest period.
+        """
+        candidates = self.matching(concept)
+        if not candidates:
+            wanted = concept.rpartition(":")[2].lower()
+            candidates = [i for i, name in enumerate(self.name) if wanted in name.rpartition(":")[2].lower()]
+        if not candidates:
+            return None
+        document = self.contexts.get(self.document_context or "", {})
+
+        def rank(index: int) -> Tuple:
+            context = self.contexts.get(self.context_id[index], {})
+            end = context.get("end") or ""
+            start = context.get("start") or end
+            return (
+                bool(context.get("dimensions")),
+                self.exact[index] is None and self.text[index] is None,
+                end != document.get("end"),
+                start != document.get("start", start),
+                -_day_number(end),
+                start,
+            )
+
+        return self.record(min(candidates, key=rank))
+
+    def dimension_index(self) -> Dict[str, Dict[str, str]]:
+        """Contexts qualified by exactly one dimension: ``{axis: {context id: member}}``.
+
+        Built once per table; contexts with several dimensions (segment by product, say)
+        are cross-sections rather than a breakdown along one axis and are left out.
+        """
+        if self._by_axis is None or self._by_axis[0] != len(self.contexts):
+            by_axis: Dict[str, Dict[str, str]] = {}
+            for context_id, context in self.contexts.items():
+                dimensions = context.get("dimensions") or {}
+                if len(dimensions) == 1:
+                    ((axis, member),) = dimensions.items()
+                    by_axis.setdefault(axis, {})[context_id] = member
+            self._by_axis = (len(self.contexts), by_axis)
+        return self._by_axis[1]
+
+    def breakdown(self, concept: str, axes: Iterable[str]) -> Dict[str, Any]:
+        """Values of ``concept`` along one or more axes, per member and period end.
+
+        Axes match by local name (``StatementGeographicalAxis`` finds both the ``srt:`` and
+        ``us-gaap:`` axis). Where a member has several facts ending on the same date the
+        longest period wins, so annual values are not replaced by a quarter.
+
+        Returns:
+            ``members``: ``{axis: {member: {period end: value}}}``; ``total``: the same
+            concept without dimensions, ``{period end: value}``; and ``unit``
+        """
+        wanted = {axis.rpartition(":")[2].lower() for axis in axes}
+        index = {
+            axis: contexts
+            for axis, contexts in self.dimension_index().items()
+            if axis.rpartition(":")[2].lower() in wanted
+        }
+        members: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        total: Dict[str, Any] = {}
+        starts: Dict[Tuple[str, str, str], str] = {}
+        unit = None
+
+        for i in self.matching(concept):
+            exact = self.exact[i]
+            context_id = self.context_id[i]
+            context = self.contexts.get(context_id, {})
+            end = context.get("end")
+            if exact is None or not end:
+                continue
+            if context.get("dimensions"):
+                found = [(axis, contexts[context_id]) for axis, contexts in index.items() if context_id in contexts]
+                if not found:
+                    continue
+                axis, member = found[0]
+                values = members.setdefault(axis, {}).setdefault(member, {})
+            else:
+                axis = member = ""
+                values = total
+            start = context.get("start") or end
+            key = (axis, member, end)
+            if key in starts and starts[key] <= start:
+                continue
+            starts[key] = start
+            values[end] = _number(exact)
+            unit = unit or self.units.get(self.unit_id[i] or "", self.unit_id[i])
+
+        return {"members": members, "total": total, "unit": unit}
+
+    def period_fact(self, concept: str, end: str, shortest: bool = False) -> Optional[Dict[str, Any]]:
+        """The numeric fact of ``concept`` without dimensions for a period ending on ``end``, or None.
+
+        Of several durations ending that day the longest is taken (the fiscal year rather
+        than its fourth quarter), or with ``shortest`` the shortest (a 10-Q's quarter rather
+        than the year to date).
+        """
+        best = None
+        for i in self.matching(concept):
+            context = self.contexts.get(self.context_id[i], {})
+            if self.exact[i] is None or context.get("end") != end or context.get("dimensions"):
+                continue
+            start = context.get("start") or end
+            if best is None or (start > best[0] if shortest else start < best[0]):
+                best = (start, i)
+        return self.record(best[1]) if best is not None else None
+
+    @property
+    def document_context(self) -> Optional[str]:
+        for name in ("dei:DocumentPeriodEndDate", "dei:DocumentType"):
+            if name in self.name:
+                return self.context_id[self.name.index(name)]
+        return None
+
+    def to_dataframe(self):
+        """All facts as a pandas DataFrame with resolved periods, units and dimensions."""
+        import pandas as pd
+
+        return pd.DataFrame([self.record(i) for i in range(len(self))])
+
+    def to_parquet(self) -> bytes:
+        """Serialize the table as Parquet; contexts and units go in the file's key-value metadata."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns: Dict[str, Any] = {
+            column: pa.array(getattr(self, column), type=pa.int32() if column == "scale" else pa.string())
+            for column in self.COLUMNS
+            if column != "value"
+        }
+        table = pa.table(columns).replace_schema_metadata(
+            {"ixbrl_facts": json.dumps({"version": FACT_TABLE_VERSION, "contexts": self.contexts, "units": self.units})}
+        )
+        sink = pa.BufferOutputStream()
+        pq.write_table(table, sink)
+        return sink.getvalue().to_pybytes()
+
+    @classmethod
+    def from_parquet(cls, data: bytes) -> Optional["FactTable"]:
+        """Load a table written by ``to_parquet``, or None if it is from another format version."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        stored = pq.read_table(pa.BufferReader(data))
+        metadata = json.loads((stored.schema.metadata or {}).get(b"ixbrl_facts", b"{}"))
+        if metadata.get("version") != FACT_TABLE_VERSION:
+            return None
+
+        table = cls()
+        table.contexts = metadata["contexts"]
+        table.units = metadata["units"]
+        for column in cls.COLUMNS:
+            if column == "value":
+                continue
+            values = stored.column(column).to_pylist()
+            setattr(table, column, array("i", values) if column == "scale" else values)
+        # ``value`` is derived from the exact decimal strings rather than stored twice
+        table.value = array("d", (float(v) if v is not None else float("nan") for v in table.exact))
+        return table
+
+
+def _exact(value: Decimal) -> str:
+    """Plain decimal string without exponent or trailing zeros, e.g. ``391035000000`` or ``6.08``."""
+    text = format(value, "f")
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return "0" if text in ("-0", "") else text
+
+
+def member_label(member: str) -> str:
+    """Readable name of a dimension member, e.g. ``aapl:GreaterChinaSegmentMember`` -> ``Greater China Segment``."""
+    local = member.rpartition(":")[2]
+    if local.endswith("Member"):
+        local = local[: -len("Member")]
+    return _WORD_BOUNDARY.sub(" ", local).strip() or member
+
+
+def _day_number(date_text: str) -> int:
+    digits = date_text.replace("-", "")
+    return int(digits) if digits.isdigit() else 0
+
+
+def _number(exact: str) -> Union[int, float]:
+    return int(exact) if "." not in exact else float(exact)
+
+
+# XBRL tags the scanner stops at, under any namespace prefix
+_FACT_TAGS = {"nonfraction", "nonnumeric", "continuation"}
+_CAPTURE_TAGS = {"startdate", "enddate", "instant", "explicitmember", "typedmember", "measure"}
+_TAG = re.compile(
+    r"<(/?)(?:[A-Za-z][\w.-]*:)?(nonFraction|nonNumeric|continuation|exclude|context|startDate|endDate|instant"
+    r"|explicitMember|typedMember|unit|unitDenominator|measure)\b([^>]*)>",
+    re.IGNORECASE,
+)
+_ATTRIBUTE = re.compile(r"""([\w:.-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+_MARKUP = re.compile(r"<[^>]*>")
+
+# Raw text (markup included) kept per open fact before tags are stripped
+_MAX_RAW_LENGTH = 4 * MAX_TEXT_LENGTH
+
+
+class _InlineXbrlScanner:
+    """Collects contexts, units and facts from the XBRL tags of a document fed in chunks.
+
+    Only tags in ``_TAG`` are looked at; the HTML around them is skipped by the regex
+    scan and only kept (as raw text) while a fact is open.
+    """
+
+    def __init__(self, table: FactTable):
+        self.table = table
+        self._pending = ""
+        # Open facts and continuations, innermost last: [kind, attrs, raw text parts, raw length]
+        self._open: List[List[Any]] = []
+        self._excluded = 0
+        self._continuations: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._continued: Dict[int, str] = {}
+        self._capture: Optional[List[str]] = None
+        self._context: Optional[Dict[str, Any]] = None
+        self._dimension: Optional[str] = None
+        self._unit: Optional[Dict[str, Any]] = None
+
+    def feed(self, text: str) -> None:
+        text = self._pending + text
+        # Hold back a tag cut off at the end of the chunk
+        cut = text.rfind("<")
+        if cut < 0 or text.find(">", cut) >= 0:
+            cut = len(text)
+        self._pending = text[cut:]
+
+        position = 0
+        for match in _TAG.finditer(text, 0, cut):
+            if match.start() > position:
+                self._text(text[position : match.start()])
+            position = match.end()
+            closing, local, attributes = match.groups()
+            local = local.lower()
+            if closing:
+                self._end(local)
+            else:
+                self._start(local, attributes, attributes.endswith("/"))
+        if cut > position:
+            self._text(text[position:cut])
+
+    def close(self) -> None:
+        if self._pending:
+            self._text(self._pending)
+            self._pending = ""
+        for index, next_id in self._continued.items():
+            parts = [self.table.text[index] or ""]
+            seen = set()
+            while next_id and next_id in self._continuations and next_id not in seen:
+                seen.add(next_id)
+                text, next_id = self._continuations[next_id]
+                parts.append(text)
+            self.table.text[index] = " ".join(part for part in parts if part)[:MAX_TEXT_LENGTH]
+
+    def _text(self, data: str) -> None:
+        if self._capture is not None:
+            self._capture.append(data)
+        if self._excluded:
+            return
+        # Text counts toward every enclosing fact, so a nonNumeric block includes the facts nested in it
+        for frame in self._open:
+            if frame[3] < _MAX_RAW_LENGTH:
+                frame[2].append(data)
+                frame[3] += len(data)
+
+    def _start(self, local: str, attributes: str, empty: bool) -> None:
+        if local in _FACT_TAGS:
+            self._open.append([local, _attributes(attributes), [], 0])
+            if empty:
+                self._end(local)
+        elif local == "exclude":
+            self._excluded += not empty
+        elif local == "context":
+            self._context = {"id": _attributes(attributes).get("id"), "start": None, "end": None, "dimensions": {}}
+        elif local in ("startdate", "enddate", "instant", "measure"):
+            self._capture = []
+        elif local in ("explicitmember", "typedmember"):
+            self._dimension = _attributes(attributes).get("dimension")
+            self._capture = []
+        elif local == "unit":
+            self._unit = {"id": _attributes(attributes).get("id"), "numerator": [], "denominator": []}
+            self._unit["part"] = self._unit["numerator"]
+        elif local == "unitdenominator" and self._unit is not None:
+            self._unit["part"] = self._unit["denominator"]
+
+    def _end(self, local: str) -> None:
+        if local in _FACT_TAGS:
+            if self._open and self._open[-1][0] == local:
+                self._finish(*self._open.pop()[:3])
+        elif local == "exclude":
+            self._excluded = max(0, self._excluded - 1)
+        elif self._capture is not None and local in _CAPTURE_TAGS:
+            text = _clean("".join(self._capture))
+            self._capture = None
+            if local == "measure" and self._unit is not None:
+                self._unit["part"].append(text.rpartition(":")[2])
+            elif self._context is None:
+                return
+            elif local in ("explicitmember", "typedmember"):
+                self._context["dimensions"][self._dimension] = text
+            else:
+                self._context["start" if local == "startdate" else "end"] = text[:10]
+                self._context["period_type"] = "instant" if local == "instant" else "duration"
+        elif local == "context" and self._context is not None:
+            context = self._context
+            self.table.contexts[context.pop("id") or ""] = context
+            self._context = None
+        elif local == "unit" and self._unit is not None:
+            unit = self._unit
+            measure = "*".join(unit["numerator"])
+            if unit["denominator"]:
+                measure = f"{measure}/{'*'.join(unit['denominator'])}"
+            self.table.units[unit["id"] or ""] = measure
+            self._unit = None
+
+    def _finish(self, kind: str, attrs: Dict[str, str], parts: List[str]) -> None:
+        text = _clean("".join(parts))
+        if kind == "continuation":
+            self._continuations[attrs.get("id") or ""] = (text, attrs.get("continuedat"))
+            return
+
+        name = attrs.get("name") or ""
+        nil = attrs.get("xsi:nil", "").lower() == "true"
+        if kind == "nonfraction":
+            value = None if nil else parse_number(text, attrs.get("format"))
+            if value is not None:
+                value = value.scaleb(int(attrs.get("scale") or 0))
+                if attrs.get("sign") == "-":
+                    value = -value
+            self.table.append(name, value, text, attrs)
+        else:
+            index = self.table.append(name, None, None if nil else text[:MAX_TEXT_LENGTH], attrs)
+            if attrs.get("continuedat"):
+                self._continued[index] = attrs["continuedat"]
+
+
+def _attributes(text: str) -> Dict[str, str]:
+    attributes = {name.lower(): double or single for name, double, single in _ATTRIBUTE.findall(text)}
+    if "&" in text:
+        attributes = {name: html.unescape(value) for name, value in attributes.items()}
+    return attributes
+
+
+def _clean(text: str) -> str:
+    """Displayed text of a fragment: markup removed, entities decoded and whitespace collapsed."""
+    if "<" in text:
+        text = _MARKUP.sub(" ", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def parse_inline_xbrl(source: Union[str, bytes, Iterable[Union[str, bytes]]]) -> FactTable:
+    """Parse an inline XBRL document (or a ``.txt`` submission containing one) into a ``FactTable``.
+
+    Args:
+        source: The document as text or bytes, or an iterable of chunks such as
+            ``response.iter_content()``; bytes are decoded as UTF-8
+    """
+    table = FactTable()
+    scanner = _InlineXbrlScanner(table)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    chunks = [source] if isinstance(source, (str, bytes)) else source
+    for chunk in chunks:
+        scanner.feed(decoder.decode(chunk) if isinstance(chunk, bytes) else chunk)
+    scanner.feed(decoder.decode(b"", final=True))
+    scanner.close()
+    return table
+
+
+def fetch_filing_facts(cik: Any, accession_number: str) -> FactTable:
+    """Get the fact table of a filing, parsing its primary inline XBRL document as it downloads.
+
+    Only the primary document is fetched (see ``filing_index``); a filing whose folder
+    index lists no inline XBRL document has no facts to read and nothing is downloaded.
+    Filings without a JSON index read the ``.txt`` submission up to the end of its first
+    document. The table is cached per accession, so each filing is downloaded and parsed once.
+    """
+    global _cache
+    if _cache is None:
+        _cache = FilingCache()
+
+    accession_number = normalize_accession_number(accession_number)
+    name = f"ixbrl_facts.v{FACT_TABLE_VERSION}.parquet"
+    cached = _cache.get_bytes(accession_number, name)
+    table = FactTable.from_parquet(cached) if cached is not None else None
+    if table is not None:
+        return table
+
+    document = inline_xbrl_document(cik, accession_number)
+    if document is not None:
+        response = sec_get(document["url"], headers={"Accept-Encoding": "gzip, deflate"}, timeout=30, stream=True)
+        try:
+            response.raise_for_status()
+            table = parse_inline_xbrl(response.iter_content(chunk_size=256 * 1024))
+        finally:
+            response.close()
+    elif fetch_filing_index(cik, accession_number):
+        table = FactTable()
+    else:
+        # The inline XBRL is the primary document, the first of the submission; stop reading after it
+        documents = read_submission(cik, accession_number, main_only=True)["documents"]
+        table = parse_inline_xbrl(documents[0]["text"]) if documents else FactTable()
+
+    _cache.put_bytes(accession_number, name, table.to_parquet())
+    return table
@@ -0,0 +1,383 @@
+"""
+Streaming parser for Form 3/4/5 ownership documents with columnar output.
+"""
+
+import io
+import math
+from array import array
+from datetime import date
+from typing import IO, Any, Dict, Iterator, List, Optional, Union
+from xml.etree.ElementTree import iterparse
+
+# Transaction codes from the Form 4 instructions (General Instruction 8)
+TRANSACTION_CODES = {
+    "P": "Purchase",
+    "S": "Sale",
+    "A": "Grant/Award",
+    "D": "Disposition to Issuer",
+    "F": "Tax Withholding",
+    "I": "Discretionary Transaction",
+    "M": "Option Exercise",
+    "C": "Conversion",
+    "E": "Expiration of Short Derivative",
+    "H": "Expiration of Long Derivative",
+    "O": "Exercise of Out-of-the-Money Derivative",
+    "X": "Exercise of In-the-Money Derivative",
+    "G": "Gift",
+    "L": "Small Acquisition",
+    "W": "Inheritance",
+    "Z": "Voting Trust",
+    "J": "Other",
+    "K": "Equity Swap",
+    "U": "Tender of Shares",
+}
+
+# Rows of the non-derivative and derivative tables
+_ROW_TAGS = frozenset(
+    {"nonDerivativeTransaction", "nonDerivativeHolding", "derivativeTransaction", "derivativeHolding"}
+)
+
+# Reporting owner relationship elements and the row flag each sets
+_OWNER_FLAGS = {
+    "isDirector": "is_director",
+    "isOfficer": "is_officer",
+    "isTenPercentOwner": "is_ten_percent_owner",
+    "isOther": "is_other",
+}
+
+_NAN = float("nan")
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _parse_float(text: Optional[str]) -> float:
+    if not text:
+        return _NAN
+    try:
+        return float(text.replace(",", ""))
+    except ValueError:
+        return _NAN
+
+
+def _parse_date(text: Optional[str]) -> int:
+    """Parse a YYYY-MM-DD value (optionally followed by a UTC offset) to a date ordinal, 0 if missing."""
+    if not text or len(text) < 10:
+        return 0
+    try:
+        return date.fromisoformat(text[:10]).toordinal()
+    except ValueError:
+        return 0
+
+
+def _unwrap_sgml(content: bytes) -> bytes:
+    """Strip whitespace and the ``<XML>`` wrapper the submission text file puts around XML documents."""
+    content = content.strip()
+    if content[:5].upper() == b"<XML>":
+        content = content[5:].strip()
+    if content[-6:].upper() == b"</XML>":
+        content = content[:-6].strip()
+    return content
+
+
+def _parse_flag(text: Optional[str]) -> int:
+    return 1 if text and text.strip().lower() in ("1", "true", "y", "yes") else 0
+
+
+class OwnershipTransactions:
+    """Transactions and holdings from ownership documents, stored as typed columns.
+
+    Numeric columns are ``array('d')`` with NaN for missing values; dates are
+    ``array('l')`` of proleptic ordinals with 0 for missing; flags are ``array('b')``.
+    Rows from many filings can be appended to one instance, so a batch of Form 4s
+    is held in a handful of arrays instead of one DataFrame per filing.
+    """
+
+    FLOAT_COLUMNS = ("shares", "price_per_share", "shares_owned_after", "conversion_price", "underlying_shares")
+    DATE_COLUMNS = ("transaction_date", "filing_date")
+    FLAG_COLUMNS = ("is_derivative", "is_holding", "is_director", "is_officer", "is_ten_percent_owner", "is_other")
+    STRING_COLUMNS = (
+        "accession_number",
+        "form_type",
+        "security_title",
+        "transaction_code",
+        "acquired_disposed",
+        "ownership_type",
+        "ownership_nature",
+        "owner_cik",
+        "owner_name",
+        "owner_title",
+    )
+    COLUMNS = STRING_COLUMNS[:2] + DATE_COLUMNS + STRING_COLUMNS[2:] + FLOAT_COLUMNS + FLAG_COLUMNS
+
+    def __init__(self):
+        for name in self.FLOAT_COLUMNS:
+            setattr(self, name, array("d"))
+        for name in self.DATE_COLUMNS:
+            setattr(self, name, array("l"))
+        for name in self.FLAG_COLUMNS:
+            setattr(self, name, array("b"))
+        for name in self.STRING_COLUMNS:
+            setattr(self, name, [])
+
+    def __len__(self) -> int:
+        return len(self.accession_number)
+
+    def column(self, name: str) -> Union[array, List[str]]:
+        """Get one column by name."""
+        if name not in self.COLUMNS:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def append_row(self, values: Dict[str, Any]) -> None:
+        """Append one row; missing values become NaN, 0 or an empty string by column type."""
+        for name in self.FLOAT_COLUMNS:
+            getattr(self, name).append(values.get(name, _NAN))
+        for name in self.DATE_COLUMNS + self.FLAG_COLUMNS:
+            getattr(self, name).append(values.get(name, 0))
+        for name in self.STRING_COLUMNS:
+            getattr(self, name).append(values.get(name) or "")
+
+    def truncate(self, length: int) -> None:
+        """Drop rows from ``length`` onwards."""
+        for name in self.COLUMNS:
+            del getattr(self, name)[length:]
+
+    def extend(self, other: "OwnershipTransactions") -> None:
+        """Append all rows of another table."""
+        for name in self.COLUMNS:
+            getattr(self, name).extend(getattr(other, name))
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Get one row as JSON-ready values: ISO dates, None for missing numbers, booleans for flags."""
+        record: Dict[str, Any] = {}
+        for name in self.COLUMNS:
+            value = getattr(self, name)[index]
+            if name in self.DATE_COLUMNS:
+                value = date.fromordinal(value).isoformat() if value else None
+            elif name in self.FLOAT_COLUMNS:
+                value = None if math.isnan(value) else value
+            elif name in self.FLAG_COLUMNS:
+                value = bool(value)
+            record[name] = value
+        record["transaction_type"] = TRANSACTION_CODES.get(record["transaction_code"], "")
+        return record
+
+    def records(self, start: int = 0, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get a range of rows as dictionaries."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        return [self.row(i) for i in range(start, stop)]
+
+    def to_dataframe(self):
+        """Build a pandas DataFrame; numeric and date columns are wrapped without copying."""
+        import numpy as np
+        import pandas as pd
+
+        data: Dict[str, Any] = {}
+        for name in self.COLUMNS:
+            values = getattr(self, name)
+            if name in self.FLOAT_COLUMNS:
+                data[name] = np.frombuffer(values, dtype=np.float64) if len(values) else np.empty(0)
+            elif name in self.DATE_COLUMNS:
+                ordinals = np.frombuffer(values, dtype=np.dtype(f"i{values.itemsize}")) if len(values) else np.empty(0)
+                # Proleptic ordinal 719163 is 1970-01-01
+                days = np.where(ordinals > 0, ordinals - 719163, np.iinfo(np.int64).min)
+                data[name] = days.astype("datetime64[D]")
+            elif name in self.FLAG_COLUMNS:
+                data[name] = np.frombuffer(values, dtype=np.int8).astype(bool) if len(values) else np.empty(0, bool)
+            else:
+                data[name] = values
+        return pd.DataFrame(data, columns=list(self.COLUMNS))
+
+
+class OwnershipDocument:
+    """Header fields of one ownership document and the range of its rows in a transaction table."""
+
+    def __init__(self, accession_number: str, transactions: OwnershipTransactions):
+        self.accession_number = accession_number
+        self.transactions = transactions
+        self.document_type = ""
+        self.period_of_report: Optional[str] = None
+        self.issuer_cik = ""
+        self.issuer_name = ""
+        self.issuer_ticker = ""
+        self.owners: List[Dict[str, Any]] = []
+        self.start = len(transactions)
+        self.stop = self.start
+
+    @property
+    def owner_name(self) -> str:
+        return "; ".join(owner["name"] for owner in self.owners if owner["name"])
+
+    @property
+    def owner_title(self) -> str:
+        return "; ".join(owner["title"] for owner in self.owners if owner["title"])
+
+    def owner_flag(self, name: str) -> bool:
+        """Whether any reporting owner has a relationship flag, e.g. ``is_director``."""
+        return any(owner[name] for owner in self.owners)
+
+    def owner_summary(self) -> Dict[str, Any]:
+        return {
+            "name": self.owner_name,
+            "title": self.owner_title,
+            "is_director": self.owner_flag("is_director"),
+            "is_officer": self.owner_flag("is_officer"),
+            "is_ten_percent_owner": self.owner_flag("is_ten_percent_owner"),
+            "is_other": self.owner_flag("is_other"),
+        }
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Rows of this document as dictionaries."""
+        return self.transactions.records(self.start, self.stop)
+
+
+def parse_ownership_xml(
+    source: Union[str, bytes, IO[bytes]],
+    accession_number: str = "",
+    filing_date: Optional[Union[date, str]] = None,
+    into: Optional[OwnershipTransactions] = None,
+) -> OwnershipDocument:
+    """Stream a Form 3/4/5 ownership XML document into columnar rows.
+
+    Elements are cleared as soon as each row is complete, so memory stays flat
+    regardless of document size. Rows are appended to ``into`` when given, which
+    lets a batch of filings share one set of columns.
+
+    Args:
+        source: The XML as text, bytes or a binary file object
+        accession_number: Accession number recorded on every row
+        filing_date: Filing date recorded on every row
+        into: Existing table to append rows to
+
+    Returns:
+        The parsed document; its rows are ``transactions[start:stop]``
+    """
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    if isinstance(source, bytes):
+        source = io.BytesIO(_unwrap_sgml(source))
+
+    transactions = into if into is not None else OwnershipTransactions()
+    document = OwnershipDocument(accession_number, transactions)
+    filing_ordinal = _parse_date(filing_date.isoformat() if isinstance(filing_date, date) else filing_date)
+
+    try:
+        _stream_rows(source, document)
+    except Exception:
+        # Leave a shared table as it was before this document
+        transactions.truncate(document.start)
+        raise
+
+    # Rows come after the reporting owners in the schema, so owner fields are filled in at the end
+    owner_values = {
+        "owner_cik": "; ".join(o["cik"] for o in document.owners if o["cik"]),
+        "owner_name": document.owner_name,
+        "owner_title": document.owner_title,
+    }
+    owner_values.update((name, int(document.owner_flag(name))) for name in _OWNER_FLAGS.values())
+    document.stop = len(transactions)
+    for index in range(document.start, document.stop):
+        transactions.accession_number[index] = accession_number
+        transactions.form_type[index] = document.document_type
+        transactions.filing_date[index] = filing_ordinal
+        for name, value in owner_values.items():
+            transactions.column(name)[index] = value
+    return document
+
+
+def _stream_rows(source: IO[bytes], document: OwnershipDocument) -> None:
+    """Fill the document header and owners, and append its table rows to its transaction table."""
+    owner: Optional[Dict[str, Any]] = None
+    row: Optional[Dict[str, Any]] = None
+    # Local name of each open element, so a <value> can be attributed to its parent
+    path: List[str] = []
+
+    for event, element in iterparse(source, events=("start", "end")):
+        tag = _local_name(element.tag)
+
+        if event == "start":
+            path.append(tag)
+            if tag in _ROW_TAGS:
+                row = {"is_derivative": int(tag.startswith("derivative")), "is_holding": int(tag.endswith("Holding"))}
+            elif tag == "reportingOwner":
+                owner = {"cik": "", "name": "", "title": ""}
+                owner.update((flag, False) for flag in _OWNER_FLAGS.values())
+            continue
+
+        path.pop()
+        text = element.text.strip() if element.text else ""
+
+        if row is not None:
+            if tag in _ROW_TAGS:
+                _finish_row(document, row)
+                row = None
+                element.clear()
+            elif text:
+                field = path[-1] if tag == "value" else tag
+                row[field] = text
+            continue
+
+        if owner is not None:
+            if tag == "reportingOwner":
+                document.owners.append(owner)
+                owner = None
+                element.clear()
+            elif tag == "rptOwnerCik":
+                owner["cik"] = text
+            elif tag == "rptOwnerName":
+                owner["name"] = text
+            elif tag == "officerTitle":
+                owner["title"] = text
+            elif tag == "otherText" and not owner["title"]:
+                owner["title"] = text
+            elif tag in _OWNER_FLAGS:
+                owner[_OWNER_FLAGS[tag]] = bool(_parse_flag(text))
+            continue
+
+        if tag == "documentType":
+            document.document_type = text
+        elif tag == "periodOfReport":
+            document.period_of_report = text[:10] or None
+        elif tag == "issuerCik":
+            document.issuer_cik = text
+        elif tag == "issuerName":
+            document.issuer_name = text
+        elif tag == "issuerTradingSymbol":
+            document.issuer_ticker = text
+        elif tag in ("nonDerivativeTable", "derivativeTable", "footnotes"):
+            element.clear()
+
+
+def _finish_row(document: OwnershipDocument, row: Dict[str, Any]) -> None:
+    document.transactions.append_row(
+        {
+            "is_derivative": row["is_derivative"],
+            "is_holding": row["is_holding"],
+            "security_title": row.get("securityTitle"),
+            "transaction_date": _parse_date(row.get("transactionDate")),
+            "transaction_code": row.get("transactionCode"),
+            "acquired_disposed": row.get("transactionAcquiredDisposedCode"),
+            "shares": _parse_float(row.get("transactionShares")),
+            "price_per_share": _parse_float(row.get("transactionPricePerShare")),
+            "shares_owned_after": _parse_float(row.get("sharesOwnedFollowingTransaction")),
+            "conversion_price": _parse_float(row.get("conversionOrExercisePrice")),
+            "underlying_shares": _parse_float(row.get("underlyingSecurityShares")),
+            "ownership_type": row.get("directOrIndirectOwnership"),
+            "ownership_nature": row.get("natureOfOwnership"),
+        }
+    )
+
+
+def iter_ownership_documents(filings, into: Optional[OwnershipTransactions] = None) -> Iterator[OwnershipDocument]:
+    """Parse the ownership XML of each filing into one shared table, skipping filings without XML."""
+    transactions = into if into is not None else OwnershipTransactions()
+    for filing in filings:
+        try:
+            xml = filing.xml()
+        except Exception:
+            continue
+        if not xml:
+            continue
+        yield parse_ownership_xml(xml, filing.accession_number, filing.filing_date, into=transactions)
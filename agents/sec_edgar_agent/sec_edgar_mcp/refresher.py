@@ -0,0 +1,319 @@
+"""
+Background refresh of cached company data for watched CIKs.
+"""
+
+import heapq
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import get_cache_dir
+from .core.client import EdgarClient
+from .utils.sec_http import sec_get
+
+SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK{cik}.json"
+
+DEFAULT_REFRESH_INTERVAL = 300.0
+
+# Each poll is scheduled interval * (1 +/- jitter) after the previous one so watched companies spread out
+DEFAULT_JITTER = 0.2
+
+# Forms whose XBRL feeds companyfacts; other new filings (e.g. Form 4) only refresh submissions
+FACTS_FORMS = frozenset({"10-K", "10-K/A", "10-Q", "10-Q/A", "20-F", "20-F/A", "40-F", "40-F/A", "8-K", "6-K"})
+
+# Poll results published by the polling worker for the other workers, under SEC_EDGAR_CACHE_DIR
+STATE_FILENAME = "refresh_state.json"
+
+# Seconds between a following worker's checks of the published poll results
+FOLLOW_INTERVAL = 10.0
+
+
+def _state_path() -> str:
+    return os.path.join(get_cache_dir(), STATE_FILENAME)
+
+
+class Refresher:
+    """Polls the submissions JSON of watched companies and refreshes their cache entries.
+
+    Polls are conditional (``If-None-Match`` / ``If-Modified-Since``), so an unchanged
+    company costs a 304 and simply marks its cached data fresh. When the newest
+    accession number changes, the company's submissions and facts are reloaded in the
+    background; request paths keep serving the cached values meanwhile.
+
+    With ``state_path`` set, each result is also written there so ``RefreshFollower`` can
+    apply it to the in-memory caches of the other worker processes.
+    """
+
+    def __init__(
+        self,
+        identifiers: List[str],
+        client: Optional[EdgarClient] = None,
+        interval: float = DEFAULT_REFRESH_INTERVAL,
+        jitter: float = DEFAULT_JITTER,
+        state_path: Optional[str] = None,
+    ):
+        self.identifiers = identifiers
+        self.client = client or EdgarClient()
+        self.interval = interval
+        self.jitter = jitter
+        self.state_path = state_path
+        self.checks = 0
+        self.not_modified = 0
+        self.changed = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self._validators: Dict[str, Dict[str, Optional[str]]] = {}
+        self._published: Dict[str, Dict[str, Any]] = {}
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start polling on a background thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="sec-edgar-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling after the current check."""
+        self._stop.set()
+
+    def status(self) -> Dict[str, Any]:
+        """Get refresh counters and the newest known accession per watched CIK."""
+        with self._lock:
+            return {
+                "role": "poller",
+                "watched": len(self.identifiers),
+                "interval_seconds": self.interval,
+                "checks": self.checks,
+                "not_modified": self.not_modified,
+                "changed": self.changed,
+                "errors": self.errors,
+                "last_error": self.last_error,
+                "latest_accessions": {
+                    cik: validators.get("latest_accession") for cik, validators in self._validators.items()
+                },
+            }
+
+    def _next_delay(self) -> float:
+        return self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _run(self) -> None:
+        # Spread the first round over one interval instead of polling everything at once
+        schedule: List[Tuple[float, str]] = [
+            (time.time() + random.uniform(0, self.interval), identifier) for identifier in self.identifiers
+        ]
+        heapq.heapify(schedule)
+
+        while schedule and not self._stop.is_set():
+            due, identifier = schedule[0]
+            if self._stop.wait(max(0.0, due - time.time())):
+                break
+            heapq.heapreplace(schedule, (time.time() + self._next_delay(), identifier))
+            self.check(identifier)
+
+    def check(self, identifier: str) -> Optional[bool]:
+        """Poll one company. Returns True if it has new filings, False if not, None on error."""
+        try:
+            cik = self.client.resolve_cik(identifier)
+            validators = self._validators.setdefault(cik, {})
+
+            headers = {}
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+            response = sec_get(SUBMISSIONS_URL.format(cik=cik), headers=headers, timeout=30)
+            with self._lock:
+                self.checks += 1
+
+            if response.status_code == 304:
+                self.client.mark_company_fresh(cik)
+                self._publish(cik)
+                with self._lock:
+                    self.not_modified += 1
+                return False
+
+            response.raise_for_status()
+            recent = response.json().get("filings", {}).get("recent", {})
+            accessions = recent.get("accessionNumber") or []
+            latest = accessions[0] if accessions else None
+
+            previous = validators.get("latest_accession")
+            last_modified = response.headers.get("Last-Modified")
+            validators.update(etag=response.headers.get("ETag"), last_modified=last_modified, latest_accession=latest)
+
+            if previous is None:
+                # First poll: refresh only if SEC's copy changed after the company was cached
+                cached_at = self.client.company_cached_at(cik)
+                changed = cached_at is not None and _http_date(last_modified) > cached_at
+                new_forms = set(recent.get("form") or []) if changed else set()
+            else:
+                changed = previous != latest
+                count = accessions.index(previous) if previous in accessions else len(accessions)
+                new_forms = set((recent.get("form") or [])[:count])
+
+            if not changed:
+                self.client.mark_company_fresh(cik)
+                self._publish(cik)
+                return False
+
+            facts = bool(new_forms & FACTS_FORMS)
+            self.client.refresh_company(cik, facts=facts)
+            self._publish(cik, changed=True, facts=facts)
+            with self._lock:
+                self.changed += 1
+            return True
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+                self.last_error = f"{identifier}: {str(e)}"
+            return None
+
+    def _publish(self, cik: str, changed: bool = False, facts: bool = False) -> None:
+        """Record a poll result for the following workers: confirmed current, or changed (with or without facts)."""
+        if self.state_path is None:
+            return
+        now = time.time()
+        entry = self._published.setdefault(cik, {"checked_at": 0.0, "changed_at": 0.0, "facts_changed_at": 0.0})
+        entry["checked_at"] = now
+        if changed:
+            entry["changed_at"] = now
+            if facts:
+                entry["facts_changed_at"] = now
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.state_path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._published, f, separators=(",", ":"))
+            os.replace(tmp_path, self.state_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+class RefreshFollower:
+    """Applies the poll results published by the ``Refresher`` of another worker process.
+
+    Workers keep companies in process memory, so a 304 or a new filing seen by the polling
+    worker has to reach each worker's caches: confirmed companies are marked fresh and
+    changed ones reloaded in the background, without any SEC request of their own.
+    """
+
+    def __init__(
+        self,
+        identifiers: List[str],
+        state_path: str,
+        client: Optional[EdgarClient] = None,
+        interval: float = FOLLOW_INTERVAL,
+    ):
+        self.identifiers = identifiers
+        self.state_path = state_path
+        self.client = client or EdgarClient()
+        self.interval = interval
+        self.reads = 0
+        self.not_modified = 0
+        self.changed = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        # Results from before this worker started are already reflected in what it loads itself
+        self._applied: Dict[str, Dict[str, float]] = {}
+        self._started_at = time.time()
+        self._mtime: Optional[int] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start following on a background thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="sec-edgar-refresh-follower", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop following after the current read."""
+        self._stop.set()
+
+    def status(self) -> Dict[str, Any]:
+        """Get counters of the poll results applied in this worker."""
+        with self._lock:
+            return {
+                "role": "follower",
+                "watched": len(self.identifiers),
+                "reads": self.reads,
+                "not_modified": self.not_modified,
+                "changed": self.changed,
+                "errors": self.errors,
+                "last_error": self.last_error,
+            }
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.apply()
+
+    def apply(self) -> int:
+        """Apply results published since the last read. Returns the number of companies updated."""
+        try:
+            mtime = os.stat(self.state_path).st_mtime_ns
+            if mtime == self._mtime:
+                return 0
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                published = json.load(f)
+            self._mtime = mtime
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            with self._lock:
+                self.errors += 1
+                self.last_error = str(e)
+            return 0
+
+        updated = 0
+        for cik, entry in published.items():
+            applied = self._applied.setdefault(cik, dict.fromkeys(entry, self._started_at))
+            if entry["changed_at"] > applied["changed_at"]:
+                self.client.refresh_company(cik, facts=entry["facts_changed_at"] > applied["facts_changed_at"])
+                with self._lock:
+                    self.changed += 1
+            elif entry["checked_at"] > applied["checked_at"]:
+                self.client.mark_company_fresh(cik)
+                with self._lock:
+                    self.not_modified += 1
+            else:
+                continue
+            applied.update(entry)
+            updated += 1
+        with self._lock:
+            self.reads += 1
+        return updated
+
+
+def _http_date(value: Optional[str]) -> float:
+    """Parse an HTTP date header to a timestamp, treating missing or bad values as the epoch."""
+    try:
+        return parsedate_to_datetime(value).timestamp() if value else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def refresher_from_env(identifiers: List[str], follow: bool = False):
+    """Create a refresher for the watched companies unless SEC_EDGAR_REFRESH_INTERVAL is 0.
+
+    With ``follow`` (a worker that does not poll SEC itself) this is a ``RefreshFollower`` of
+    the results the polling worker publishes to SEC_EDGAR_CACHE_DIR.
+    """
+    interval = float(os.getenv("SEC_EDGAR_REFRESH_INTERVAL", DEFAULT_REFRESH_INTERVAL))
+    if not identifiers or interval <= 0:
+        return None
+    if follow:
+        return RefreshFollower(identifiers, _state_path(), interval=min(interval, FOLLOW_INTERVAL))
+    return Refresher(identifiers, interval=interval, state_path=_state_path())
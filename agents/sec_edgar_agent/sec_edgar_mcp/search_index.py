@@ -0,0 +1,165 @@
+"""
+BM25 retrieval over SEC filing chunks with a compact, array-backed inverted index.
+"""
+
+import json
+import math
+import re
+import struct
+from array import array
+from collections import Counter
+from heapq import nlargest
+from typing import Dict, Iterable, List, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+STOPWORDS = frozenset(
+    """
+    a an and are as at be been but by for from has have if in into is it its of on or our such
+    that the their there these they this to was were which will with we us you your not no may
+    """.split()
+)
+
+_MAGIC = b"BM25"
+_FORMAT_VERSION = 1
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split text into index terms, dropping stopwords and single characters."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if len(token) > 1 and token not in STOPWORDS]
+
+
+class BM25Index:
+    """Okapi BM25 index over a fixed set of passages.
+
+    Postings are stored in CSR layout: the postings of term ``t`` are
+    ``doc_ids[offsets[t]:offsets[t + 1]]`` with matching ``term_freqs``. All numeric
+    data lives in ``array`` buffers so an index for a large 10-K stays a few hundred KB
+    and round-trips to disk without per-posting objects.
+    """
+
+    def __init__(
+        self,
+        terms: List[str],
+        offsets: array,
+        doc_ids: array,
+        term_freqs: array,
+        doc_lengths: array,
+        spans: array,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        self.terms = terms
+        self.term_ids: Dict[str, int] = {term: term_id for term_id, term in enumerate(terms)}
+        self.offsets = offsets
+        self.doc_ids = doc_ids
+        self.term_freqs = term_freqs
+        self.doc_lengths = doc_lengths
+        self.spans = spans
+        self.k1 = k1
+        self.b = b
+        self.doc_count = len(doc_lengths)
+        self.avg_doc_length = (sum(doc_lengths) / self.doc_count) if self.doc_count else 0.0
+
+    @classmethod
+    def build(cls, passages: Iterable[Tuple[int, int, str]], k1: float = 1.2, b: float = 0.75) -> "BM25Index":
+        """Build an index from (start_offset, end_offset, text) passages."""
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        doc_lengths = array("I")
+        spans = array("I")
+
+        for doc_id, (start, end, text) in enumerate(passages):
+            tokens = tokenize(text)
+            doc_lengths.append(len(tokens))
+            spans.extend((start, end))
+            for term, freq in Counter(tokens).items():
+                postings.setdefault(term, []).append((doc_id, freq))
+
+        terms = sorted(postings)
+        offsets = array("I", [0])
+        doc_ids = array("I")
+        term_freqs = array("I")
+        for term in terms:
+            for doc_id, freq in postings[term]:
+                doc_ids.append(doc_id)
+                term_freqs.append(freq)
+            offsets.append(len(doc_ids))
+
+        return cls(terms, offsets, doc_ids, term_freqs, doc_lengths, spans, k1, b)
+
+    def search(self, query: str, k: int = 5) -> List[Tuple[int, float]]:
+        """Return the top-k (doc_id, score) pairs for a query, best first."""
+        if not self.doc_count:
+            return []
+
+        scores: Dict[int, float] = {}
+        k1, b = self.k1, self.b
+        avg_doc_length = self.avg_doc_length or 1.0
+
+        for term in set(tokenize(query)):
+            term_id = self.term_ids.get(term)
+            if term_id is None:
+                continue
+
+            start, end = self.offsets[term_id], self.offsets[term_id + 1]
+            doc_freq = end - start
+            idf = math.log(1 + (self.doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+
+            for i in range(start, end):
+                doc_id = self.doc_ids[i]
+                freq = self.term_freqs[i]
+                norm = k1 * (1 - b + b * self.doc_lengths[doc_id] / avg_doc_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * freq * (k1 + 1) / (freq + norm)
+
+        return nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+
+    def span(self, doc_id: int) -> Tuple[int, int]:
+        """Get the (start_offset, end_offset) of a passage in the source document."""
+        return self.spans[2 * doc_id], self.spans[2 * doc_id + 1]
+
+    def to_bytes(self) -> bytes:
+        """Serialize the index."""
+        header = json.dumps({"version": _FORMAT_VERSION, "terms": self.terms, "k1": self.k1, "b": self.b}).encode(
+            "utf-8"
+        )
+        parts = [_MAGIC, struct.pack("<I", len(header)), header]
+        for values in (self.offsets, self.doc_ids, self.term_freqs, self.doc_lengths, self.spans):
+            data = _little_endian(values).tobytes()
+            parts.append(struct.pack("<I", len(data)))
+            parts.append(data)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional["BM25Index"]:
+        """Deserialize an index, returning None for unknown or corrupt data."""
+        if data[:4] != _MAGIC:
+            return None
+
+        try:
+            (header_length,) = struct.unpack_from("<I", data, 4)
+            position = 8 + header_length
+            header = json.loads(data[8:position].decode("utf-8"))
+            if header.get("version") != _FORMAT_VERSION:
+                return None
+
+            arrays = []
+            for _ in range(5):
+                (length,) = struct.unpack_from("<I", data, position)
+                position += 4
+                values = array("I")
+                values.frombytes(data[position : position + length])
+                arrays.append(_little_endian(values))
+                position += length
+        except (struct.error, ValueError):
+            return None
+
+        return cls(header["terms"], *arrays, k1=header["k1"], b=header["b"])
+
+
+def _little_endian(values: array) -> array:
+    """Return the array in little-endian byte order (a no-op on little-endian hosts)."""
+    if struct.pack("=I", 1) == struct.pack("<I", 1):
+        return values
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped
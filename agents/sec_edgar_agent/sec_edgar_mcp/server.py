@@ -1,10 +1,23 @@
 import argparse
 import logging
 import os
+import sys
+import threading
+import time
+
+# Taken before third-party imports so startup diagnostics include them
+_import_started = time.perf_counter()
+
 from fastmcp import FastMCP
+from starlette.middleware import Middleware
 from starlette.requests import Request
-from starlette.responses import PlainTextResponse
-from .tools import CompanyTools, FilingsTools, FinancialTools, InsiderTools
+from starlette.responses import JSONResponse, PlainTextResponse
+from .tools import CompanyTools, DocumentTools, FilingsTools, FinancialTools, InsiderTools
+from .config import get_cache_dir
+from .utils import CompressionMiddleware, get_circuit_breaker, serve_stale_on_error
+from .utils.diagnostics import format_import_profile, import_profile, startup_report
+from .refresher import refresher_from_env
+from .warmup import warmup_from_env
 
 # Suppress INFO logs from edgar library
 logging.getLogger("edgar").setLevel(logging.WARNING)
@@ -41,11 +54,29 @@ CRITICAL: NEVER round numbers like "$37.0B" - always show exact values like "$37
 YOU ARE A FILING DATA EXTRACTION SERVICE, NOT A FINANCIAL ANALYST OR ADVISOR.
 """
 
-# Initialize tool classes
-company_tools = CompanyTools()
-filings_tools = FilingsTools()
-financial_tools = FinancialTools()
-insider_tools = InsiderTools()
+
+class _LazyTools:
+    """Constructs a tool class on first use, keeping server import and cold start cheap."""
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+        return getattr(self._instance, name)
+
+
+# Tool classes are built on the first call that needs them
+company_tools = _LazyTools(CompanyTools)
+filings_tools = _LazyTools(FilingsTools)
+document_tools = _LazyTools(DocumentTools)
+financial_tools = _LazyTools(FinancialTools)
+insider_tools = _LazyTools(InsiderTools)
 
 # Initialize MCP server
 mcp = FastMCP("SEC EDGAR MCP 🏢")
@@ -53,6 +84,7 @@ mcp = FastMCP("SEC EDGAR MCP 🏢")
 
 # Company Tools
 @mcp.tool
+@serve_stale_on_error
 def get_cik_by_ticker(ticker: str):
     """
     Get the CIK (Central Index Key) for a company based on its ticker symbol.
@@ -67,6 +99,7 @@ def get_cik_by_ticker(ticker: str):
 
 
 @mcp.tool
+@serve_stale_on_error
 def get_company_info(identifier: str):
     """
     Get detailed information about a company from SEC records.
@@ -87,6 +120,7 @@ def get_company_info(identifier: str):
 
 
 @mcp.tool
+@serve_stale_on_error
 def search_companies(query: str, limit: int = 10):
     """
     Search for companies by name.
@@ -102,6 +136,7 @@ def search_companies(query: str, limit: int = 10):
 
 
 @mcp.tool
+@serve_stale_on_error
 def get_company_facts(identifier: str):
     """
     Get company facts and key financial metrics.
@@ -117,7 +152,10 @@ def get_company_facts(identifier: str):
 
 # Filing Tools
 @mcp.tool
-def get_recent_filings(identifier: str = None, form_type: str = None, days: int = 30, limit: int = 50):
+@serve_stale_on_error
+def get_recent_filings(
+    identifier: str = None, form_type: str = None, days: int = 30, limit: int = 50, compact: bool = False
+):
     """
     Get recent SEC filings for a company or across all companies.
 
@@ -126,14 +164,16 @@ def get_recent_filings(identifier: str = None, form_type: str = None, days: int
         form_type: Specific form type to filter (e.g., "10-K", "10-Q", "8-K")
         days: Number of days to look back (default: 30)
         limit: Maximum number of filings to return (default: 50)
+        compact: Return filings as {"columns": [...], "rows": [[...]]} instead of one object per filing
 
     Returns:
         Dictionary containing list of recent filings
     """
-    return filings_tools.get_recent_filings(identifier, form_type, days, limit)
+    return filings_tools.get_recent_filings(identifier, form_type, days, limit, compact)
 
 
 @mcp.tool
+@serve_stale_on_error
 def get_filing_content(identifier: str, accession_number: str):
     """
     Get the content of a specific SEC filing.
@@ -149,6 +189,27 @@ def get_filing_content(identifier: str, accession_number: str):
 
 
 @mcp.tool
+@serve_stale_on_error
+def get_filing_header(identifier: str, accession_number: str):
+    """
+    Get a filing's metadata from its SEC header without downloading the filing itself.
+
+    Reads only the SEC-HEADER block (a few KB): filers, reporting owners, period of report,
+    acceptance time, 8-K items and the list of documents with their URLs. Use this instead
+    of get_filing_content when only metadata is needed.
+
+    Args:
+        identifier: Company ticker symbol or CIK number
+        accession_number: The accession number of the filing
+
+    Returns:
+        Dictionary containing the parsed filing header
+    """
+    return filings_tools.get_filing_header(identifier, accession_number)
+
+
+@mcp.tool
+@serve_stale_on_error
 def analyze_8k(identifier: str, accession_number: str):
     """
     Analyze an 8-K filing for specific events and items.
@@ -164,6 +225,7 @@ def analyze_8k(identifier: str, accession_number: str):
 
 
 @mcp.tool
+@serve_stale_on_error
 def get_filing_sections(identifier: str, accession_number: str, form_type: str):
     """
     Get specific sections from a filing (e.g., business description, risk factors, MD&A).
@@ -179,9 +241,108 @@ def get_filing_sections(identifier: str, accession_number: str, form_type: str):
     return filings_tools.get_filing_sections(identifier, accession_number, form_type)
 
 
+@mcp.tool
+@serve_stale_on_error
+def list_filing_sections(identifier: str, accession_number: str):
+    """
+    List the sections of a filing (e.g., Item 1 Business, Item 1A Risk Factors, Item 7 MD&A)
+    with their sizes and number of chunks. Use get_filing_section_chunk to read a section.
+
+    Args:
+        identifier: Company ticker symbol or CIK number
+        accession_number: The accession number of the filing
+
+    Returns:
+        Dictionary containing the section list with character/word counts and chunk counts
+    """
+    return document_tools.list_filing_sections(identifier, accession_number)
+
+
+@mcp.tool
+@serve_stale_on_error
+def get_filing_section_chunk(
+    identifier: str, accession_number: str, section: str, chunk_index: int = 0, chunk_size: int = 8000
+):
+    """
+    Get one chunk of a filing section. Sections are split into chunks of about chunk_size
+    characters; request the next chunk_index while has_more is true.
+
+    Args:
+        identifier: Company ticker symbol or CIK number
+        accession_number: The accession number of the filing
+        section: Section type (e.g., "item_1a", "1A") or index from list_filing_sections
+        chunk_index: Zero-based chunk number within the section (default: 0)
+        chunk_size: Approximate chunk size in characters (default: 8000)
+
+    Returns:
+        Dictionary containing the chunk text, its offsets in the document and chunk counts
+    """
+    return document_tools.get_filing_section_chunk(identifier, accession_number, section, chunk_index, chunk_size)
+
+
+@mcp.tool
+@serve_stale_on_error
+def search_filing(identifier: str, accession_number: str, query: str, k: int = 5):
+    """
+    Search within a filing and return only the most relevant passages (BM25 ranking).
+    USE THIS TOOL instead of get_filing_content when the user asks what a filing says
+    about a specific topic (e.g., "supply chain risk", "tariffs", "share repurchases").
+
+    CRITICAL INSTRUCTIONS FOR LLM RESPONSES:
+    - ONLY use text from the returned passages. NEVER add external information.
+    - ALWAYS include the filing reference information with clickable SEC URL.
+    - If no passage addresses the question, say "Not found in this filing" - DO NOT guess.
+
+    Args:
+        identifier: Company ticker symbol or CIK number
+        accession_number: The accession number of the filing
+        query: Keywords or question to search for
+        k: Number of passages to return (default: 5, max: 20)
+
+    Returns:
+        Dictionary containing ranked passages with scores, sections and character offsets
+    """
+    return document_tools.search_filing(identifier, accession_number, query, k)
+
+
+@mcp.tool
+@serve_stale_on_error
+def search_company_filings(
+    identifier: str, query: str, form_types: list = None, since_year: int = None, k: int = 10
+):
+    """
+    Search across all of a company's filings (e.g., every 10-K/10-Q since 2018 that mentions
+    tariffs) using a persistent full-text index. Filings not yet indexed are fetched and added
+    incrementally; if pending_filings is non-zero, call again to index the rest.
+
+    CRITICAL INSTRUCTIONS FOR LLM RESPONSES:
+    - ONLY use text from the returned passages. NEVER add external information.
+    - ALWAYS include the filing date, form type, accession number and SEC URL for each result.
+    - If no filing matches, say "Not found in the indexed filings" - DO NOT guess.
+
+    Args:
+        identifier: Company ticker symbol or CIK number
+        query: Keywords to search for
+        form_types: Form types to search (default: ["10-K", "10-Q"])
+        since_year: Only include filings filed on or after January 1 of this year (optional)
+        k: Maximum number of filings to return (default: 10, max: 100)
+
+    Returns:
+        Dictionary containing matching filings ranked by relevance with their best passage
+    """
+    return document_tools.search_company_filings(identifier, query, form_types, since_year, k)
+
+
 # Financial Tools
 @mcp.tool
-def get_financials(identifier: str, statement_type: str = "all"):
+@serve_stale_on_error
+def get_financials(
+    identifier: str,
+    statement_type: str = "all",
+    compact: bool = False,
+    line_items: list = None,
+    periods: list = None,
+):
     """
     Get financial statements for a company. USE THIS TOOL when users ask for:
     - Cash flow, cash flow statement, operating cash flow, investing cash flow, financing cash flow
@@ -201,30 +362,63 @@ def get_financials(identifier: str, statement_type: str = "all"):
     Args:
         identifier: Company ticker symbol or CIK number
         statement_type: Type of statement ("income", "balance", "cash", or "all")
+        compact: Return each statement as {"columns", "index", "rows"} arrays instead of a dict
+            keyed by line item (much smaller; recommended)
+        line_items: Only return line items whose label contains one of these strings
+            (e.g., ["Revenue", "Net income"]). Use when the user asks for specific numbers.
+        periods: Only return period columns containing one of these strings (e.g., ["2024"])
 
     Returns:
         Dictionary containing financial statement data extracted directly from SEC EDGAR filings,
         including filing_reference with source URLs and disclaimer.
     """
-    return financial_tools.get_financials(identifier, statement_type)
+    return financial_tools.get_financials(identifier, statement_type, compact, line_items, periods)
 
 
 @mcp.tool
-def get_segment_data(identifier: str, segment_type: str = "geographic"):
+@serve_stale_on_error
+def get_segment_data(identifier: str, segment_type: str = "geographic", concepts: list = None):
     """
-    Get revenue breakdown by segments (geographic, product, etc.).
+    Get revenue breakdown by segments (geographic, product, etc.) from the latest 10-K's XBRL facts.
 
     Args:
         identifier: Company ticker symbol or CIK number
-        segment_type: Type of segment analysis (default: "geographic")
+        segment_type: "geographic", "business" or "product", or an XBRL axis name such as
+            "srt:ProductOrServiceAxis" (default: "geographic")
+        concepts: XBRL concepts to break down (optional; default: revenue, operating income
+            and long-lived assets)
 
     Returns:
-        Dictionary containing segment revenue data
+        Dictionary containing, per metric, each segment member's values by fiscal period end
+        and the consolidated total; lists the filing's available axes when nothing matches
     """
-    return financial_tools.get_segment_data(identifier, segment_type)
+    return financial_tools.get_segment_data(identifier, segment_type, concepts)
 
 
 @mcp.tool
+@serve_stale_on_error
+def get_financials_history(identifier: str, periods: int = 8, form_family: str = "10-Q", line_items: list = None):
+    """
+    Get statement line items across a company's recent reports as one aligned table, e.g. revenue
+    and net income for the last 12 quarters.
+
+    Args:
+        identifier: Company ticker symbol or CIK number
+        periods: Number of most recent filings to read, one period each (default: 8, at most 40)
+        form_family: "10-Q" for quarters or "10-K" for fiscal years (default: "10-Q")
+        line_items: XBRL concepts to report, e.g. ["Revenues", "NetIncomeLoss"] (optional; default:
+            revenue, costs, profit, EPS, assets, liabilities, equity, cash and operating cash flow)
+
+    Returns:
+        Dictionary with the periods (end date, fiscal period, filing), the concept and unit of each
+        line item, and a panel of values with one row per period (newest first) and one column per
+        line item. Quarterly cash-flow values are year to date, as filed in the 10-Q.
+    """
+    return financial_tools.get_financials_history(identifier, periods, form_family, line_items)
+
+
+@mcp.tool
+@serve_stale_on_error
 def get_key_metrics(identifier: str, metrics: list = None):
     """
     Get key financial metrics for a company.
@@ -240,6 +434,7 @@ def get_key_metrics(identifier: str, metrics: list = None):
 
 
 @mcp.tool
+@serve_stale_on_error
 def compare_periods(identifier: str, metric: str, start_year: int, end_year: int):
     """
     Compare a financial metric across different time periods.
@@ -257,6 +452,7 @@ def compare_periods(identifier: str, metric: str, start_year: int, end_year: int
 
 
 @mcp.tool
+@serve_stale_on_error
 def discover_company_metrics(identifier: str, search_term: str = None):
     """
     Discover available financial metrics for a company.
@@ -272,6 +468,7 @@ def discover_company_metrics(identifier: str, search_term: str = None):
 
 
 @mcp.tool
+@serve_stale_on_error
 def get_xbrl_concepts(identifier: str, accession_number: str = None, concepts: list = None, form_type: str = "10-K"):
     """
     ADVANCED TOOL: Extract specific XBRL concepts from a filing.
@@ -302,6 +499,7 @@ def get_xbrl_concepts(identifier: str, accession_number: str = None, concepts: l
 
 
 @mcp.tool
+@serve_stale_on_error
 def discover_xbrl_concepts(
     identifier: str, accession_number: str = None, form_type: str = "10-K", namespace_filter: str = None
 ):
@@ -322,6 +520,7 @@ def discover_xbrl_concepts(
 
 # Insider Trading Tools
 @mcp.tool
+@serve_stale_on_error
 def get_insider_transactions(identifier: str, form_types: list = None, days: int = 90, limit: int = 50):
     """
     Get insider trading transactions for a company from SEC filings.
@@ -348,6 +547,7 @@ def get_insider_transactions(identifier: str, form_types: list = None, days: int
 
 
 @mcp.tool
+@serve_stale_on_error
 def get_insider_summary(identifier: str, days: int = 180):
     """
     Get a summary of insider trading activity for a company from SEC filings.
@@ -370,6 +570,7 @@ def get_insider_summary(identifier: str, days: int = 180):
 
 
 @mcp.tool
+@serve_stale_on_error
 def get_form4_details(identifier: str, accession_number: str):
     """
     Get detailed information from a specific Form 4 filing.
@@ -385,6 +586,7 @@ def get_form4_details(identifier: str, accession_number: str):
 
 
 @mcp.tool
+@serve_stale_on_error
 def analyze_form4_transactions(identifier: str, days: int = 90, limit: int = 50):
     """
     Analyze Form 4 filings and extract detailed transaction data including insider names,
@@ -414,18 +616,100 @@ def analyze_form4_transactions(identifier: str, days: int = 90, limit: int = 50)
 
 
 @mcp.tool
-def analyze_insider_sentiment(identifier: str, months: int = 6):
+@serve_stale_on_error
+def analyze_insider_sentiment(identifier: str, months: int = 6, period: str = "month"):
     """
     Analyze insider trading sentiment and trends over time.
 
+    The "series" field holds precomputed monthly or weekly buckets of open-market (P/S) buy/sell
+    counts, shares, dollar values and net shares/value, under "by_role" for "all" and each role (officer, director, ten_percent_owner).
+    Use these values directly instead of summing individual transactions.
+
     Args:
         identifier: Company ticker symbol or CIK number
         months: Number of months to analyze (default: 6)
+        period: Bucket size of the series, "month" or "week" (default: "month")
+
+    Returns:
+        Dictionary containing sentiment analysis, trends and the bucketed series
+    """
+    return insider_tools.analyze_insider_sentiment(identifier, months, period)
+
+
+@mcp.tool
+@serve_stale_on_error
+def analyze_insider_sentiment_batch(identifiers: list, months: int = 6, period: str = "month"):
+    """
+    Analyze insider trading sentiment for several companies in one call.
+
+    Returns the same analysis as analyze_insider_sentiment for each company, plus an overview of
+    window totals of open-market trades (net shares, net value, buy and sell counts) per company
+    for comparison.
+
+    Args:
+        identifiers: List of company ticker symbols or CIK numbers
+        months: Number of months to analyze (default: 6)
+        period: Bucket size of the series, "month" or "week" (default: "month")
+
+    Returns:
+        Dictionary with an overview and per-company results keyed by identifier
+    """
+    return insider_tools.analyze_insider_sentiment_batch(identifiers, months, period)
+
+
+@mcp.tool
+@serve_stale_on_error
+def get_reporting_owner_activity(owner: str, days: int = 730, limit: int = 50):
+    """
+    Find what else an insider has traded: a reporting owner's Form 3/4/5 filings across all issuers.
+
+    Answers from a local index of reporting owners built as the insider tools parse ownership filings,
+    so it only covers companies whose insider filings have been loaded before (for example with
+    get_insider_transactions or analyze_insider_sentiment).
+
+    Args:
+        owner: Reporting owner CIK, or the start of their name as filed ("Last First", e.g. "COOK TIMOTHY")
+        days: Number of days to look back, 0 for all stored filings (default: 730)
+        limit: Maximum number of filings to list (default: 50)
 
     Returns:
-        Dictionary containing sentiment analysis and trends
+        Dictionary with the matching owners, a summary per issuer (filings, roles, open-market trades)
+        and the most recent filings
     """
-    return insider_tools.analyze_insider_sentiment(identifier, months)
+    return insider_tools.get_reporting_owner_activity(owner, days, limit)
+
+
+@mcp.tool
+def query_insider_dataset(
+    issuer: str = None,
+    owner: str = None,
+    transaction_codes: list = None,
+    start_date: str = None,
+    end_date: str = None,
+    include_derivative: bool = True,
+    limit: int = 100,
+):
+    """
+    Query years of historical insider transactions across all issuers from SEC's quarterly insider data sets.
+
+    Answers from locally ingested data set archives with no live SEC requests, so it suits backtests and
+    long histories. Only the quarters that have been ingested are covered (listed in "quarters").
+
+    Args:
+        issuer: Issuer ticker symbol or CIK (optional)
+        owner: Reporting owner CIK, or the start of their name as filed ("Last First") (optional)
+        transaction_codes: SEC transaction codes to keep, e.g. ["P", "S"] for open-market buys and sales (optional)
+        start_date: Earliest transaction date, YYYY-MM-DD (optional)
+        end_date: Latest transaction date, YYYY-MM-DD (optional)
+        include_derivative: Include derivative transactions such as option exercises (default: True)
+        limit: Maximum number of transactions to list; the summary covers all matches (default: 100)
+
+    Returns:
+        Dictionary with buy/sell totals of all matching transactions and the most recent ones
+    """
+    return insider_tools.query_insider_dataset(
+        issuer, owner, transaction_codes, start_date, end_date, include_derivative, limit
+    )
 
 
 # Utility Tools
@@ -442,27 +726,45 @@ def get_recommended_tools(form_type: str):
     """
     recommendations = {
         "10-K": {
-            "tools": ["get_financials", "get_filing_sections", "get_segment_data", "get_key_metrics"],
+            "tools": [
+                "get_financials",
+                "list_filing_sections",
+                "get_filing_section_chunk",
+                "search_filing",
+                "get_segment_data",
+                "get_key_metrics",
+                "get_financials_history",
+            ],
             "description": "Annual report with comprehensive business and financial information",
             "tips": [
                 "Use get_financials to extract financial statements",
-                "Use get_filing_sections to read business description and risk factors",
+                "Use list_filing_sections and get_filing_section_chunk to read business description and risk factors",
+                "Use search_filing to find passages about a specific topic",
                 "Use get_segment_data for geographic/product revenue breakdown",
+                "Use get_financials_history with form_family='10-K' for several fiscal years in one call",
             ],
         },
         "10-Q": {
-            "tools": ["get_financials", "get_filing_sections", "compare_periods"],
+            "tools": [
+                "get_financials",
+                "get_financials_history",
+                "list_filing_sections",
+                "get_filing_section_chunk",
+                "compare_periods",
+            ],
             "description": "Quarterly report with unaudited financial statements",
             "tips": [
                 "Use get_financials for quarterly financial data",
+                "Use get_financials_history for line items over the last several quarters in one call",
                 "Use compare_periods to analyze quarter-over-quarter trends",
             ],
         },
         "8-K": {
-            "tools": ["analyze_8k", "get_filing_content"],
+            "tools": ["analyze_8k", "get_filing_content", "get_filing_header"],
             "description": "Current report for material events",
             "tips": [
                 "Use analyze_8k to identify specific events reported",
+                "Use get_filing_header for the reported items and exhibit list without downloading the filing",
                 "Check for press releases and material agreements",
             ],
         },
@@ -472,12 +774,18 @@ def get_recommended_tools(form_type: str):
                 "analyze_form4_transactions",
                 "get_form4_details",
                 "analyze_insider_sentiment",
+                "analyze_insider_sentiment_batch",
+                "get_reporting_owner_activity",
+                "query_insider_dataset",
             ],
             "description": "Statement of changes in beneficial ownership",
             "tips": [
                 "Use get_insider_transactions for recent trading activity overview",
                 "Use analyze_form4_transactions for detailed transaction analysis and tables",
                 "Use analyze_insider_sentiment to understand trading patterns",
+                "Use analyze_insider_sentiment_batch to compare insider activity across several companies",
+                "Use get_reporting_owner_activity to see an insider's filings at other companies",
+                "Use query_insider_dataset for multi-year insider history from the ingested SEC data sets",
             ],
         },
         "DEF 14A": {
@@ -495,34 +803,205 @@ def get_recommended_tools(form_type: str):
             "success": True,
             "form_type": form_type_upper,
             "message": "No specific recommendations available for this form type",
-            "general_tools": ["get_filing_content", "get_recent_filings"],
+            "general_tools": ["get_filing_header", "get_filing_content", "get_recent_filings"],
         }
 
 
+# Cache warmup and background refresh for the SEC_EDGAR_WATCHLIST companies, started with the HTTP server
+warmup = None
+refresher = None
+
+# Open lock file held by the one process polling SEC for watchlist changes in a cache directory
+_refresh_lock = None
+
+
+def _claim_refresher() -> bool:
+    """Whether this process polls SEC for watchlist changes, decided by an flock in SEC_EDGAR_CACHE_DIR.
+
+    Every worker of the multi-worker mode warms its own in-memory caches, but only the
+    first to take the lock polls SEC; the others apply the results it publishes, so adding
+    workers does not multiply the polling traffic. The lock is held until the process
+    exits, and a restarted worker can take it over.
+    """
+    global _refresh_lock
+    if _refresh_lock is not None:
+        return True
+    try:
+        import fcntl
+    except ImportError:
+        return True
+
+    lock_file = open(os.path.join(get_cache_dir(), "refresher.lock"), "a")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    _refresh_lock = lock_file
+    return True
+
+
+def _start_background_tasks():
+    global warmup, refresher
+    if warmup is None:
+        warmup = warmup_from_env()
+        if warmup is not None:
+            warmup.start()
+    if refresher is None and warmup is not None:
+        refresher = refresher_from_env(warmup.identifiers, follow=not _claim_refresher())
+        if refresher is not None:
+            refresher.start()
+
+
 # Health check endpoints
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request: Request) -> PlainTextResponse:
+    # Readiness gate: report unavailable until the watchlist caches are warm
+    if warmup is not None and not warmup.is_ready():
+        return PlainTextResponse("WARMING UP", status_code=503)
     return PlainTextResponse("OK")
 
+
+@mcp.custom_route("/health/warmup", methods=["GET"])
+async def warmup_status(request: Request) -> JSONResponse:
+    if warmup is None:
+        return JSONResponse({"status": "disabled", "ready": True})
+    return JSONResponse(warmup.progress())
+
+
+@mcp.custom_route("/health/refresh", methods=["GET"])
+async def refresh_status(request: Request) -> JSONResponse:
+    if refresher is None:
+        return JSONResponse({"status": "disabled"})
+    return JSONResponse(refresher.status())
+
+
+@mcp.custom_route("/health/upstream", methods=["GET"])
+async def upstream_status(request: Request) -> JSONResponse:
+    # Circuit breaker state for SEC traffic in this worker
+    return JSONResponse(get_circuit_breaker().status())
+
+
 @mcp.custom_route("/mcp/health", methods=["GET"])
 async def mcp_health_check(request: Request) -> PlainTextResponse:
     return PlainTextResponse("OK")
 
 
+_import_finished = time.perf_counter()
+
+
+def _http_middleware():
+    """Build the HTTP middleware stack from the SEC_EDGAR_* environment settings."""
+    if os.environ.get("SEC_EDGAR_COMPRESSION", "1").lower() in ("0", "false", "off"):
+        return []
+    return [
+        Middleware(
+            CompressionMiddleware,
+            minimum_size=int(os.environ.get("SEC_EDGAR_COMPRESSION_MIN_SIZE", 1024)),
+            gzip_level=int(os.environ.get("SEC_EDGAR_GZIP_LEVEL", 6)),
+            zstd_level=int(os.environ.get("SEC_EDGAR_ZSTD_LEVEL", 3)),
+        )
+    ]
+
+
+def create_app():
+    """ASGI app factory run in each worker process of the multi-worker HTTP mode.
+
+    Workers do not share MCP session state, so the app is stateless: any worker can
+    serve any request. On-disk caches live in the shared SEC_EDGAR_CACHE_DIR, while each
+    worker warms its own in-memory company caches; SEC requests draw from one file-backed
+    token bucket, so adding workers does not raise the request rate seen by SEC.
+    """
+    _start_background_tasks()
+    return mcp.http_app(
+        transport=os.environ.get("SEC_EDGAR_TRANSPORT", "http"),
+        middleware=_http_middleware(),
+        stateless_http=True,
+    )
+
+
 def main():
     """Main entry point for the MCP server."""
     parser = argparse.ArgumentParser(description="SEC EDGAR MCP Server - Access SEC filings and financial data")
     parser.add_argument("--transport", default="stdio", help="Transport method")
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to (default: 0.0.0.0)")
     parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8080)), help="Port to bind to (default: PORT env var or 8080)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("SEC_EDGAR_WORKERS", 1)),
+        help="Worker processes for HTTP transports (default: SEC_EDGAR_WORKERS env var or 1)",
+    )
+    parser.add_argument(
+        "--no-compression",
+        action="store_true",
+        default=os.environ.get("SEC_EDGAR_COMPRESSION", "1").lower() in ("0", "false", "off"),
+        help="Disable gzip/zstd response compression on HTTP transports",
+    )
+    parser.add_argument(
+        "--compression-min-size",
+        type=int,
+        default=int(os.environ.get("SEC_EDGAR_COMPRESSION_MIN_SIZE", 1024)),
+        help="Smallest response body in bytes that is compressed (default: 1024)",
+    )
+    parser.add_argument(
+        "--gzip-level",
+        type=int,
+        default=int(os.environ.get("SEC_EDGAR_GZIP_LEVEL", 6)),
+        help="gzip compression level 1-9 (default: 6)",
+    )
+    parser.add_argument(
+        "--zstd-level",
+        type=int,
+        default=int(os.environ.get("SEC_EDGAR_ZSTD_LEVEL", 3)),
+        help="zstd compression level 1-22 (default: 3)",
+    )
+    parser.add_argument(
+        "--profile-imports",
+        action="store_true",
+        help="Print an import-time profile of the server module and exit",
+    )
     args = parser.parse_args()
 
+    if args.profile_imports:
+        print(format_import_profile(import_profile()))
+        return
+
+    # Startup diagnostics go to stderr so they never mix with the stdio transport
+    report = startup_report(_import_started, _import_finished)
+    print(
+        f"Server module imported in {report['server_import_ms']} ms "
+        f"({report['process_cpu_ms']} ms process CPU so far); "
+        f"heavy modules loaded: {', '.join(report['heavy_modules_loaded']) or 'none'}",
+        file=sys.stderr,
+    )
+
+    # Worker processes read their settings from the environment they inherit
+    os.environ["SEC_EDGAR_TRANSPORT"] = args.transport
+    os.environ["SEC_EDGAR_COMPRESSION"] = "0" if args.no_compression else "1"
+    os.environ["SEC_EDGAR_COMPRESSION_MIN_SIZE"] = str(args.compression_min_size)
+    os.environ["SEC_EDGAR_GZIP_LEVEL"] = str(args.gzip_level)
+    os.environ["SEC_EDGAR_ZSTD_LEVEL"] = str(args.zstd_level)
+
     # Run the MCP server with the specified transport
-    if args.transport in ["streamable-http", "http"]:
-        mcp.run(transport=args.transport, host=args.host, port=args.port)
+    if args.transport in ["streamable-http", "http"] and args.workers > 1:
+        import uvicorn
+
+        uvicorn.run(
+            "sec_edgar_mcp.server:create_app",
+            factory=True,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            lifespan="on",
+            timeout_graceful_shutdown=2,
+        )
+    elif args.transport in ["streamable-http", "http"]:
+        _start_background_tasks()
+        mcp.run(transport=args.transport, host=args.host, port=args.port, middleware=_http_middleware())
     else:
         mcp.run(transport=args.transport)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,84 @@
+"""
+Per-accession cache of parsed financial statements in Parquet.
+
+Building a statement means parsing the filing's XBRL and rendering it with edgartools,
+which takes seconds; a filed report never changes, so each statement is stored once per
+accession as a Parquet file. Reads project to the requested period columns, so a lookup
+decodes only what it returns.
+
+Entry names carry ``STATEMENT_CACHE_VERSION`` and the installed edgartools version: a
+change to either the stored layout or the parser producing the statements starts a new
+set of entries instead of serving ones built by the old code.
+"""
+
+import io
+from importlib.metadata import PackageNotFoundError, version
+from typing import List, Optional
+
+from .utils.cache import FilingCache
+
+STATEMENT_CACHE_VERSION = 1
+
+STATEMENTS = ("income_statement", "balance_sheet", "cash_flow")
+
+
+def format_key() -> str:
+    """Version key of the cache entries, e.g. ``v1-edgartools-4.3.0``."""
+    try:
+        edgar_version = version("edgartools")
+    except PackageNotFoundError:
+        edgar_version = "unknown"
+    return f"v{STATEMENT_CACHE_VERSION}-edgartools-{edgar_version}"
+
+
+class StatementCache:
+    """Parsed income, balance and cash-flow statements per accession, stored as Parquet."""
+
+    def __init__(self, cache: Optional[FilingCache] = None):
+        self._cache = cache or FilingCache()
+        self._format_key = format_key()
+
+    def _name(self, statement: str) -> str:
+        return f"statements.{self._format_key}.{statement}.parquet"
+
+    def get(self, accession_number: str, statement: str, periods: Optional[List[str]] = None):
+        """Load a cached statement as a DataFrame, or None if it is not cached.
+
+        With ``periods`` only the columns whose name contains one of them (ignoring case)
+        are read, the same match ``get_financials`` applies.
+        """
+        import pyarrow.parquet as pq
+
+        data = self._cache.get_bytes(accession_number, self._name(statement))
+        if data is None:
+            return None
+
+        try:
+            columns = None
+            if periods:
+                schema = pq.read_schema(io.BytesIO(data))
+                index_columns = set((schema.pandas_metadata or {}).get("index_columns", []))
+                wanted = [str(period).lower() for period in periods]
+                columns = [
+                    name
+                    for name in schema.names
+                    if name not in index_columns and any(period in name.lower() for period in wanted)
+                ]
+            return pq.read_table(io.BytesIO(data), columns=columns, use_pandas_metadata=True).to_pandas()
+        except Exception:
+            # An unreadable entry is rebuilt rather than failing the request
+            return None
+
+    def put(self, accession_number: str, statement: str, frame) -> bool:
+        """Store a statement DataFrame; returns False if it cannot be written as Parquet."""
+        try:
+            frame = frame.copy()
+            frame.columns = [str(column) for column in frame.columns]
+            buffer = io.BytesIO()
+            frame.to_parquet(buffer, engine="pyarrow")
+        except Exception:
+            # Columns mixing numbers and text have no Parquet type; those statements are rebuilt each time
+            return False
+
+        self._cache.put_bytes(accession_number, self._name(statement), buffer.getvalue())
+        return True
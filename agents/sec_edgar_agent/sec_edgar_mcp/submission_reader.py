@@ -0,0 +1,115 @@
+"""
+Streaming reader for ``.txt`` submissions that yields each ``<DOCUMENT>`` as soon as it is complete.
+
+A submission is the SEC header followed by one ``<DOCUMENT>`` block per file, the primary
+document first and exhibits, XBRL files and uuencoded images and PDFs after it. Reading
+the response body as it arrives lets a caller start on the primary document once its
+``</DOCUMENT>`` has been seen, and closing the connection at that point skips the
+download of everything after it.
+"""
+
+import re
+from typing import Any, Dict, Iterable, Iterator, List
+
+from .filing_index import filing_folder_url
+from .utils.accession import normalize_accession_number
+from .utils.sec_http import sec_get
+
+START = b"<DOCUMENT>"
+END = b"</DOCUMENT>"
+
+_FIELD = re.compile(r"^<(TYPE|SEQUENCE|FILENAME|DESCRIPTION)>(.*)$", re.MULTILINE)
+_TEXT = re.compile(r"<TEXT>\r?\n?(.*?)(?:</TEXT>|\Z)", re.DOTALL)
+
+
+def parse_document(block: str) -> Dict[str, Any]:
+    """Split one ``<DOCUMENT>`` block into its fields (type, sequence, filename, description) and ``text``."""
+    text_match = _TEXT.search(block)
+    head = block[: text_match.start()] if text_match else block
+    document: Dict[str, Any] = {"type": None, "sequence": None, "filename": None, "description": None}
+    for name, value in _FIELD.findall(head):
+        document[name.lower()] = value.strip()
+    document["text"] = text_match.group(1) if text_match else ""
+    return document
+
+
+class DocumentSplitter:
+    """Incremental splitter of a submission's bytes into parsed ``<DOCUMENT>`` blocks.
+
+    Only the document being read is buffered; the SEC header before the first document is
+    dropped as it streams past. The search for the end tag resumes where the previous
+    chunk's search stopped, so each byte is scanned once however large the document.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        # Position of the current document's start tag (-1 between documents) and how far its end tag was searched
+        self._start = -1
+        self._scanned = 0
+
+    @property
+    def in_document(self) -> bool:
+        """Whether a document has started that is not complete yet."""
+        return self._start >= 0
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        """Add the next chunk; returns the documents it completed."""
+        buffer = self._buffer
+        buffer.extend(chunk)
+        documents = []
+        while True:
+            if self._start < 0:
+                self._start = buffer.find(START)
+                if self._start < 0:
+                    # Keep just enough to find a start tag cut across chunks
+                    del buffer[: max(0, len(buffer) - len(START))]
+                    break
+                self._scanned = self._start + len(START)
+            # An end tag cut across chunks starts at most len(END) - 1 bytes before the searched part
+            end = buffer.find(END, max(self._scanned - len(END) + 1, self._start + len(START)))
+            if end < 0:
+                self._scanned = len(buffer)
+                break
+            block = bytes(buffer[self._start + len(START) : end])
+            del buffer[: end + len(END)]
+            self._start = -1
+            documents.append(parse_document(block.decode("utf-8", errors="replace")))
+        return documents
+
+
+def iter_documents(chunks: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    """Yield the documents of a submission fed in byte chunks, each as soon as its end tag arrives."""
+    splitter = DocumentSplitter()
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+
+
+def read_submission(cik: Any, accession_number: str, main_only: bool = True) -> Dict[str, Any]:
+    """Stream a filing's ``.txt`` submission and return its documents.
+
+    With ``main_only`` the connection is closed as soon as another document starts after
+    the first (primary) one, without reading the exhibits.
+
+    Returns:
+        ``documents`` (list of parsed documents), ``bytes_read`` and ``complete`` (whether
+        the whole submission was read, i.e. no document was skipped)
+    """
+    accession_number = normalize_accession_number(accession_number)
+    url = f"{filing_folder_url(cik, accession_number)}{accession_number}.txt"
+    response = sec_get(url, headers={"Accept-Encoding": "gzip, deflate"}, timeout=30, stream=True)
+    splitter = DocumentSplitter()
+    documents: List[Dict[str, Any]] = []
+    bytes_read = 0
+    complete = True
+    try:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            bytes_read += len(chunk)
+            documents.extend(splitter.feed(chunk))
+            if main_only and documents and (len(documents) > 1 or splitter.in_document):
+                complete = False
+                break
+    finally:
+        response.close()
+
+    return {"documents": documents[:1] if main_only else documents, "bytes_read": bytes_read, "complete": complete}
@@ -1,7 +1,8 @@
 from .company import CompanyTools
+from .documents import DocumentTools
 from .filings import FilingsTools
 from .financial import FinancialTools
 from .insider import InsiderTools
 from .types import ToolResponse
 
-__all__ = ["CompanyTools", "FilingsTools", "FinancialTools", "InsiderTools", "ToolResponse"]
+__all__ = ["CompanyTools", "DocumentTools", "FilingsTools", "FinancialTools", "InsiderTools", "ToolResponse"]
@@ -67,7 +67,7 @@ class CompanyTools:
             company = self.client.get_company(identifier)
 
             # Get company facts using edgar-tools
-            facts = company.get_facts()
+            facts = self.client.get_company_facts(company)
 
             if not facts:
                 return {"success": False, "error": "No facts available for this company"}
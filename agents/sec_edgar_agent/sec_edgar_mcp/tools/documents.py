@@ -0,0 +1,362 @@
+import bisect
+import os
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+from ..core.client import EdgarClient
+from ..config import get_cache_dir, initialize_config
+from ..document_parser import SECDocumentParser
+from ..fulltext_index import FullTextIndex
+from ..search_index import BM25Index
+from ..utils.accession import normalize_accession_number
+from ..utils.cache import FilingCache
+from ..utils.exceptions import CompanyNotFoundError, FilingNotFoundError
+from .types import ToolResponse
+
+# Bump when the text extraction or section patterns change so stale indexes are rebuilt
+SECTION_INDEX_VERSION = 2
+
+DEFAULT_CHUNK_SIZE = 8000
+DEFAULT_OVERLAP_SIZE = 200
+
+# Retrieval passages are kept small so the top-k results cost few prompt tokens
+SEARCH_PASSAGE_SIZE = 1500
+SEARCH_PASSAGE_OVERLAP = 150
+MAX_SEARCH_RESULTS = 20
+
+# Bump when the tokenizer or passage splitting changes. Search indexes store character spans into the
+# document text, so their cache names also carry the text version and passage sizes they were built with.
+SEARCH_INDEX_VERSION = 1
+SEARCH_INDEX_KEY = f"v{SEARCH_INDEX_VERSION}-text{SECTION_INDEX_VERSION}-{SEARCH_PASSAGE_SIZE}-{SEARCH_PASSAGE_OVERLAP}"
+
+# Upper bound on filings fetched and added to a company index by a single request
+MAX_NEW_FILINGS_PER_REQUEST = 25
+
+
+class DocumentTools:
+    """Tools for section- and chunk-level access to filing documents."""
+
+    def __init__(self):
+        self.client = EdgarClient()
+        self.parser = SECDocumentParser(initialize_config())
+        self.cache = FilingCache()
+        self._search_indexes: "OrderedDict[str, BM25Index]" = OrderedDict()
+        self._max_search_indexes = 16
+        self._company_indexes: Dict[str, FullTextIndex] = {}
+
+    def list_filing_sections(self, identifier: str, accession_number: str) -> ToolResponse:
+        """List the sections of a filing with their sizes and chunk counts."""
+        try:
+            cik = self.client.resolve_cik(identifier)
+            accession_number = normalize_accession_number(accession_number)
+            _, section_index = self.load_document(cik, accession_number)
+
+            sections = section_index["sections"]
+            total_chars = sum(section["char_count"] for section in sections)
+
+            return {
+                "success": True,
+                "cik": cik,
+                "accession_number": accession_number,
+                "total_sections": len(sections),
+                "total_chars": total_chars,
+                "document_chars": section_index["document_chars"],
+                "chunk_size": section_index["chunk_size"],
+                "sections": [
+                    {
+                        "index": section["index"],
+                        "name": section["name"],
+                        "type": section["type"],
+                        "char_count": section["char_count"],
+                        "word_count": section["word_count"],
+                        "chunk_count": section["chunk_count"],
+                        "percentage": round((section["char_count"] / total_chars) * 100, 1) if total_chars > 0 else 0,
+                    }
+                    for section in sections
+                ],
+                "filing_reference": self._filing_reference(cik, accession_number),
+            }
+        except (CompanyNotFoundError, FilingNotFoundError) as e:
+            return {"success": False, "error": str(e)}
+        except Exception as e:
+            return {"success": False, "error": f"Failed to list filing sections: {str(e)}"}
+
+    def get_filing_section_chunk(
+        self,
+        identifier: str,
+        accession_number: str,
+        section: Union[str, int],
+        chunk_index: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ToolResponse:
+        """Get one chunk of a filing section."""
+        try:
+            if chunk_size <= 0:
+                return {"success": False, "error": "chunk_size must be positive"}
+            cik = self.client.resolve_cik(identifier)
+            accession_number = normalize_accession_number(accession_number)
+            text, section_index = self.load_document(cik, accession_number)
+
+            entry = self._find_section(section_index["sections"], section)
+            if entry is None:
+                return {
+                    "success": False,
+                    "error": f"Section '{section}' not found in filing {accession_number}",
+                    "available_sections": sorted({s["type"] for s in section_index["sections"]}),
+                }
+
+            chunks = self.parser.chunk_section(text, entry, chunk_size, DEFAULT_OVERLAP_SIZE)
+            if not 0 <= chunk_index < len(chunks):
+                return {
+                    "success": False,
+                    "error": f"Chunk {chunk_index} out of range for section '{entry['type']}' ({len(chunks)} chunks)",
+                }
+
+            chunk = chunks[chunk_index]
+            return {
+                "success": True,
+                "cik": cik,
+                "accession_number": accession_number,
+                "section": {"index": entry["index"], "name": entry["name"], "type": entry["type"]},
+                "chunk_index": chunk_index,
+                "total_chunks": len(chunks),
+                "has_more": chunk_index + 1 < len(chunks),
+                "start_offset": chunk.metadata["start_pos"],
+                "end_offset": chunk.metadata["end_pos"],
+                "content": chunk.content,
+                "filing_reference": self._filing_reference(cik, accession_number),
+            }
+        except (CompanyNotFoundError, FilingNotFoundError) as e:
+            return {"success": False, "error": str(e)}
+        except Exception as e:
+            return {"success": False, "error": f"Failed to get filing section chunk: {str(e)}"}
+
+    def search_filing(self, identifier: str, accession_number: str, query: str, k: int = 5) -> ToolResponse:
+        """Search a filing with BM25 and return the top-k matching passages."""
+        try:
+            if not query or not query.strip():
+                return {"success": False, "error": "Query must not be empty"}
+
+            cik = self.client.resolve_cik(identifier)
+            accession_number = normalize_accession_number(accession_number)
+            text, section_index = self.load_document(cik, accession_number)
+            index = self.load_search_index(text, accession_number)
+
+            sections = section_index["sections"]
+            section_starts = [section["start"] for section in sections]
+
+            passages = []
+            for rank, (doc_id, score) in enumerate(index.search(query, max(1, min(k, MAX_SEARCH_RESULTS))), start=1):
+                start, end = index.span(doc_id)
+                position = bisect.bisect_right(section_starts, start) - 1
+                section = sections[position] if position >= 0 else None
+                passages.append(
+                    {
+                        "rank": rank,
+                        "score": round(score, 4),
+                        "section": {"name": section["name"], "type": section["type"]} if section else None,
+                        "start_offset": start,
+                        "end_offset": end,
+                        "content": text[start:end].strip(),
+                    }
+                )
+
+            return {
+                "success": True,
+                "cik": cik,
+                "accession_number": accession_number,
+                "query": query,
+                "passages": passages,
+                "count": len(passages),
+                "total_passages": index.doc_count,
+                "filing_reference": self._filing_reference(cik, accession_number),
+            }
+        except (CompanyNotFoundError, FilingNotFoundError) as e:
+            return {"success": False, "error": str(e)}
+        except Exception as e:
+            return {"success": False, "error": f"Failed to search filing: {str(e)}"}
+
+    def search_company_filings(
+        self,
+        identifier: str,
+        query: str,
+        form_types: Optional[List[str]] = None,
+        since_year: Optional[int] = None,
+        k: int = 10,
+    ) -> ToolResponse:
+        """Search all of a company's periodic filings through its persistent full-text index."""
+        try:
+            if not query or not query.strip():
+                return {"success": False, "error": "Query must not be empty"}
+
+            if not form_types:
+                form_types = ["10-K", "10-Q"]
+            since = date(since_year, 1, 1) if since_year else None
+
+            company = self.client.get_company(identifier)
+            cik = str(int(company.cik)).zfill(10)
+            index = self.company_index(cik)
+
+            # Only filings that are not in the index yet are fetched and parsed
+            indexed = index.indexed_accessions()
+            missing = []
+            for filing in company.get_filings(form=form_types):
+                filing_date = self._as_date(filing.filing_date)
+                if since and filing_date and filing_date < since:
+                    continue
+                if filing.accession_number not in indexed:
+                    missing.append((filing.accession_number, filing.form, filing_date))
+
+            added = self.index_filings(cik, missing[:MAX_NEW_FILINGS_PER_REQUEST])
+            pending = max(len(missing) - MAX_NEW_FILINGS_PER_REQUEST, 0)
+
+            results = []
+            for hit in index.search(query, form_types, since, max(1, min(k, 100))):
+                accession_number = hit["accession_number"]
+                text, _ = self.load_document(cik, accession_number)
+                passage = hit["passages"][0]
+                results.append(
+                    {
+                        "accession_number": accession_number,
+                        "form_type": hit["form"],
+                        "filing_date": hit["filing_date"],
+                        "score": round(hit["score"], 4),
+                        "matching_passages": hit["matching_passages"],
+                        "best_passage": {
+                            "start_offset": passage["start_offset"],
+                            "end_offset": passage["end_offset"],
+                            "content": text[passage["start_offset"] : passage["end_offset"]].strip(),
+                        },
+                        "sec_url": self._filing_reference(cik, accession_number)["sec_url"],
+                    }
+                )
+
+            return {
+                "success": True,
+                "cik": cik,
+                "name": company.name,
+                "query": query,
+                "form_types": form_types,
+                "since_year": since_year,
+                "results": results,
+                "count": len(results),
+                "indexed_filings": len(index.indexed_accessions()),
+                "newly_indexed_filings": added,
+                "pending_filings": pending,
+                "filing_reference": {
+                    "data_source": "SEC EDGAR filings, searched through a local full-text index of the filing text",
+                    "verification_note": "Each result includes a direct SEC URL for independent verification",
+                },
+            }
+        except (CompanyNotFoundError, FilingNotFoundError) as e:
+            return {"success": False, "error": str(e)}
+        except Exception as e:
+            return {"success": False, "error": f"Failed to search company filings: {str(e)}"}
+
+    def company_index(self, cik: str) -> FullTextIndex:
+        """Get the persistent full-text index of a company."""
+        index = self._company_indexes.get(cik)
+        if index is None:
+            index = FullTextIndex(os.path.join(get_cache_dir(), "fulltext", SEARCH_INDEX_KEY, cik))
+            self._company_indexes[cik] = index
+        return index
+
+    def index_filings(self, cik: str, filings: List[Tuple[str, str, Optional[date]]]) -> int:
+        """Add (accession_number, form, filing_date) filings to a company index in one segment."""
+        batch = []
+        for accession_number, form, filing_date in filings:
+            try:
+                text, _ = self.load_document(cik, accession_number)
+            except FilingNotFoundError:
+                continue
+            bounds = self.parser.chunk_bounds(text, SEARCH_PASSAGE_SIZE, SEARCH_PASSAGE_OVERLAP)
+            batch.append(
+                {
+                    "accession_number": accession_number,
+                    "form": form,
+                    "filing_date": filing_date.isoformat() if filing_date else "",
+                    "passages": [(start, end, text[start:end]) for start, end in bounds],
+                }
+            )
+
+        return self.company_index(cik).add_filings(batch) if batch else 0
+
+    def load_search_index(self, text: str, accession_number: str) -> BM25Index:
+        """Load the BM25 index of a filing, building and persisting it on first use."""
+        index = self._search_indexes.get(accession_number)
+        if index is None:
+            data = self.cache.get_bytes(accession_number, f"bm25.{SEARCH_INDEX_KEY}.bin")
+            index = BM25Index.from_bytes(data) if data else None
+
+            if index is None:
+                bounds = self.parser.chunk_bounds(text, SEARCH_PASSAGE_SIZE, SEARCH_PASSAGE_OVERLAP)
+                index = BM25Index.build((start, end, text[start:end]) for start, end in bounds)
+                self.cache.put_bytes(accession_number, f"bm25.{SEARCH_INDEX_KEY}.bin", index.to_bytes())
+
+            self._search_indexes[accession_number] = index
+            while len(self._search_indexes) > self._max_search_indexes:
+                self._search_indexes.popitem(last=False)
+
+        self._search_indexes.move_to_end(accession_number)
+        return index
+
+    def load_document(self, cik: str, accession_number: str) -> Tuple[str, Dict[str, Any]]:
+        """Load the main document text and its section index, fetching and parsing only once per accession."""
+        text = self.cache.get_text(accession_number, "document.txt")
+        section_index = self.cache.get_json(accession_number, "sections.json")
+
+        if text is not None and section_index is not None and section_index.get("version") == SECTION_INDEX_VERSION:
+            return text, section_index
+
+        try:
+            content = self.parser.fetch_primary_document(str(int(cik)), accession_number)
+        except Exception as e:
+            raise FilingNotFoundError(f"Filing {accession_number} not found: {str(e)}")
+
+        text = self.parser.extract_filing_text(content)
+        section_index = {
+            "version": SECTION_INDEX_VERSION,
+            "cik": cik,
+            "accession_number": accession_number,
+            "document_chars": len(text),
+            "chunk_size": DEFAULT_CHUNK_SIZE,
+            "sections": self.parser.build_section_index(text, DEFAULT_CHUNK_SIZE, DEFAULT_OVERLAP_SIZE),
+        }
+
+        self.cache.put_text(accession_number, "document.txt", text)
+        self.cache.put_json(accession_number, "sections.json", section_index)
+
+        return text, section_index
+
+    def _find_section(self, sections: List[Dict[str, Any]], section: Union[str, int]) -> Optional[Dict[str, Any]]:
+        """Find a section by position or type, preferring the largest match for repeated types."""
+        if isinstance(section, int) or (isinstance(section, str) and section.isdigit()):
+            position = int(section)
+            return sections[position] if 0 <= position < len(sections) else None
+
+        # Accept "item_1a", "Item 1A" and "1a"
+        section_type = section.strip().lower().replace(" ", "_")
+        if not section_type.startswith("item_"):
+            section_type = f"item_{section_type}"
+
+        # Table-of-contents entries match the same patterns, so pick the largest occurrence
+        matches = [s for s in sections if s["type"] == section_type]
+        return max(matches, key=lambda s: s["char_count"]) if matches else None
+
+    def _as_date(self, value: Any) -> Optional[date]:
+        """Convert an edgartools filing date (date, datetime or ISO string) to a date."""
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        if isinstance(value, str) and value:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).date()
+        return None
+
+    def _filing_reference(self, cik: str, accession_number: str) -> Dict[str, Any]:
+        """Build the filing reference block returned with section data."""
+        return {
+            "accession_number": accession_number,
+            "sec_url": f"https://www.sec.gov/Archives/edgar/data/{int(cik)}/{accession_number.replace('-', '')}/{accession_number}.txt",
+            "data_source": f"SEC EDGAR Filing {accession_number}, extracted directly from the filing text",
+        }
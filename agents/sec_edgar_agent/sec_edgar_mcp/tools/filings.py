@@ -1,8 +1,8 @@
 from typing import Dict, Union, List, Optional, Any
 from datetime import datetime
-from edgar import get_filings
 from ..core.client import EdgarClient
-from ..core.models import FilingInfo
+from ..core.models import FilingInfo, serialize_records
+from ..filing_header import fetch_filing_header
 from ..utils.exceptions import FilingNotFoundError
 from .types import ToolResponse
 
@@ -19,8 +19,13 @@ class FilingsTools:
         form_type: Optional[Union[str, List[str]]] = None,
         days: int = 30,
         limit: int = 50,
+        compact: bool = False,
     ) -> ToolResponse:
-        """Get recent filings for a company or across all companies."""
+        """Get recent filings for a company or across all companies.
+
+        With ``compact`` the filings are returned as ``{"columns": [...], "rows": [[...]]}``
+        so field names are sent once instead of once per filing.
+        """
         try:
             if identifier:
                 # Company-specific filings
@@ -28,7 +33,7 @@ class FilingsTools:
                 filings = company.get_filings(form=form_type)
             else:
                 # Global filings using edgar-tools get_filings()
-                filings = get_filings(form=form_type, count=limit)
+                filings = self.client.edgar.get_filings(form=form_type, count=limit)
 
             # Limit results
             filings_list = []
@@ -49,19 +54,24 @@ class FilingsTools:
                 if isinstance(period_of_report, str):
                     period_of_report = datetime.fromisoformat(period_of_report.replace("Z", "+00:00"))
 
-                filing_info = FilingInfo(
-                    accession_number=filing.accession_number,
-                    filing_date=filing_date,
-                    form_type=filing.form,
-                    company_name=filing.company,
-                    cik=filing.cik,
-                    file_number=getattr(filing, "file_number", None),
-                    acceptance_datetime=acceptance_datetime,
-                    period_of_report=period_of_report,
+                filings_list.append(
+                    FilingInfo(
+                        accession_number=filing.accession_number,
+                        filing_date=filing_date,
+                        form_type=filing.form,
+                        company_name=filing.company,
+                        cik=filing.cik,
+                        file_number=getattr(filing, "file_number", None),
+                        acceptance_datetime=acceptance_datetime,
+                        period_of_report=period_of_report,
+                    )
                 )
-                filings_list.append(filing_info.to_dict())
 
-            return {"success": True, "filings": filings_list, "count": len(filings_list)}
+            return {
+                "success": True,
+                "filings": serialize_records(filings_list, orient="rows" if compact else "records"),
+                "count": len(filings_list),
+            }
         except Exception as e:
             return {"success": False, "error": f"Failed to get recent filings: {str(e)}"}
 
@@ -114,6 +124,16 @@ class FilingsTools:
         except Exception as e:
             return {"success": False, "error": f"Failed to get filing content: {str(e)}"}
 
+    def get_filing_header(self, identifier: str, accession_number: str) -> ToolResponse:
+        """Get a filing's metadata from its SEC header only, without downloading its documents."""
+        try:
+            company = self.client.get_company(identifier)
+            header = fetch_filing_header(company.cik, accession_number)
+
+            return {"success": True, "cik": company.cik, "name": company.name, "header": header}
+        except Exception as e:
+            return {"success": False, "error": f"Failed to get filing header: {str(e)}"}
+
     def analyze_8k(self, identifier: str, accession_number: str) -> ToolResponse:
         """Analyze an 8-K filing for specific events."""
         try:
@@ -1,65 +1,98 @@
-from typing import List, Optional
-import requests
-from ..core.client import EdgarClient
-from ..config import initialize_config
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from ..core.client import PERIODIC, EdgarClient
+from ..ixbrl_parser import SEGMENT_AXES, fetch_filing_facts, member_label
+from ..statement_cache import StatementCache
 from .types import ToolResponse
 
+# Statement types of get_financials and the key each statement is returned (and cached) under
+STATEMENT_TYPES = {"income": "income_statement", "balance": "balance_sheet", "cash": "cash_flow"}
+
+# Concepts tried for each segment metric, in order; the first with a breakdown is reported
+SEGMENT_METRICS = {
+    "revenue": [
+        "RevenueFromContractWithCustomerExcludingAssessedTax",
+        "Revenues",
+        "RevenueFromContractWithCustomerIncludingAssessedTax",
+        "SalesRevenueNet",
+    ],
+    "operating_income": ["OperatingIncomeLoss"],
+    "long_lived_assets": ["NoncurrentAssets", "LongLivedAssets", "PropertyPlantAndEquipmentNet"],
+}
+
+# Line items of get_financials_history and the concepts tried for each, in order
+HISTORY_LINE_ITEMS = {
+    "revenue": [
+        "RevenueFromContractWithCustomerExcludingAssessedTax",
+        "Revenues",
+        "RevenueFromContractWithCustomerIncludingAssessedTax",
+        "SalesRevenueNet",
+    ],
+    "cost_of_revenue": ["CostOfGoodsAndServicesSold", "CostOfRevenue"],
+    "gross_profit": ["GrossProfit"],
+    "operating_income": ["OperatingIncomeLoss"],
+    "net_income": ["NetIncomeLoss", "ProfitLoss"],
+    "eps_diluted": ["EarningsPerShareDiluted"],
+    "total_assets": ["Assets"],
+    "total_liabilities": ["Liabilities"],
+    "stockholders_equity": ["StockholdersEquity"],
+    "cash": ["CashAndCashEquivalentsAtCarryingValue"],
+    "operating_cash_flow": ["NetCashProvidedByUsedInOperatingActivities"],
+}
+
+# Most filings get_financials_history reads, and how many it fetches and parses at once
+MAX_HISTORY_PERIODS = 40
+HISTORY_CONCURRENCY = 4
+
 
 class FinancialTools:
     """Tools for financial data and XBRL operations."""
 
     def __init__(self):
         self.client = EdgarClient()
+        self.statements = StatementCache()
+
+    def get_financials(
+        self,
+        identifier: str,
+        statement_type: str = "all",
+        compact: bool = False,
+        line_items: Optional[List[str]] = None,
+        periods: Optional[List[str]] = None,
+    ) -> ToolResponse:
+        """Get financial statements for a company by parsing XBRL data from filings.
 
-    def get_financials(self, identifier: str, statement_type: str = "all") -> ToolResponse:
-        """Get financial statements for a company by parsing XBRL data from filings."""
+        ``line_items`` and ``periods`` restrict each statement to matching rows and columns
+        (case-insensitive substring match). With ``compact`` statements are returned as
+        ``{"columns", "index", "rows"}`` arrays instead of a dict keyed by line item.
+        """
         try:
             company = self.client.get_company(identifier)
 
-            # First try to get the latest 10-K or 10-Q
-            latest_10k = None
-            latest_10q = None
-
-            try:
-                filings_10k = company.get_filings(form="10-K")
-                latest_10k = filings_10k.latest()
-            except Exception:
-                pass
-
-            try:
-                filings_10q = company.get_filings(form="10-Q")
-                latest_10q = filings_10q.latest()
-            except Exception:
-                pass
-
-            # Use the most recent filing
-            if latest_10q and latest_10k:
-                # Compare dates
-                if hasattr(latest_10q, "filing_date") and hasattr(latest_10k, "filing_date"):
-                    if latest_10q.filing_date > latest_10k.filing_date:
-                        latest_filing = latest_10q
-                        form_type = "10-Q"
-                    else:
-                        latest_filing = latest_10k
-                        form_type = "10-K"
-                else:
-                    latest_filing = latest_10q
-                    form_type = "10-Q"
-            elif latest_10q:
-                latest_filing = latest_10q
-                form_type = "10-Q"
-            elif latest_10k:
-                latest_filing = latest_10k
-                form_type = "10-K"
-            else:
+            # The latest 10-K or 10-Q, whichever is more recent
+            latest_filing = self.client.latest_filing(company, PERIODIC)
+            if latest_filing is None:
                 return {"success": False, "error": "No 10-K or 10-Q filings found"}
-
-            # Try to get financials using the Financials.extract method
+            form_type = "10-Q" if latest_filing.form.startswith("10-Q") else "10-K"
+
+            # A filed report never changes: serve statements parsed by an earlier call when all are cached
+            requested = [name for kind, name in STATEMENT_TYPES.items() if statement_type in (kind, "all")]
+            cached = {name: self.statements.get(latest_filing.accession_number, name, periods) for name in requested}
+            if requested and all(frame is not None for frame in cached.values()):
+                result = self._financials_result(company, latest_filing, form_type)
+                for name, frame in cached.items():
+                    result["statements"][name] = self._statement_payload(frame, compact, line_items, periods)
+                result["cached_statements"] = True
+                return result
+
+            # Build financials from the filing's XBRL, parsed once and cached per accession
             financials = None
+            xbrl = None
             try:
                 from edgar.financials import Financials
 
-                financials = Financials.extract(latest_filing)
+                xbrl = self.client.get_filing_xbrl(latest_filing)
+                financials = Financials(xbrl) if xbrl is not None else None
             except Exception:
                 # Fallback to company methods
                 try:
@@ -81,43 +114,15 @@ class FinancialTools:
                     },
                 }
 
-            result = {
-                "success": True,
-                "cik": company.cik,
-                "name": company.name,
-                "form_type": form_type,
-                "statements": {},
-                "filing_reference": {
-                    "filing_date": latest_filing.filing_date.isoformat()
-                    if hasattr(latest_filing.filing_date, "isoformat")
-                    else str(latest_filing.filing_date),
-                    "accession_number": latest_filing.accession_number,
-                    "form_type": form_type,
-                    "sec_url": f"https://www.sec.gov/Archives/edgar/data/{company.cik}/{latest_filing.accession_number.replace('-', '')}/{latest_filing.accession_number}.txt",
-                    "filing_url": latest_filing.url if hasattr(latest_filing, "url") else None,
-                    "data_source": f"SEC EDGAR Filing {latest_filing.accession_number}, extracted directly from XBRL data",
-                    "disclaimer": "All data extracted directly from SEC EDGAR filing with exact precision. No estimates, calculations, or rounding applied.",
-                    "verification_note": "Users can verify all data independently at the provided SEC URL",
-                },
-            }
-
-            # Get XBRL data from the filing for direct access
-            xbrl = None
-            try:
-                xbrl = latest_filing.xbrl()
-            except Exception:
-                pass
+            result = self._financials_result(company, latest_filing, form_type)
 
             # Extract financial statements - these are parsed from XBRL
             if statement_type in ["income", "all"]:
                 try:
                     income = financials.income_statement()
                     if income is not None and hasattr(income, "to_dict"):
-                        result["statements"]["income_statement"] = {
-                            "data": income.to_dict(orient="index"),
-                            "columns": list(income.columns),
-                            "index": list(income.index),
-                        }
+                        self.statements.put(latest_filing.accession_number, "income_statement", income)
+                        result["statements"]["income_statement"] = self._statement_payload(income, compact, line_items, periods)
                     else:
                         # Try to get income statement from XBRL directly
                         if xbrl and hasattr(xbrl, "get_statement_by_type"):
@@ -135,7 +140,7 @@ class FinancialTools:
                             income_concepts = self._discover_statement_concepts(xbrl, latest_filing, "income")
                             if income_concepts:
                                 result["statements"]["income_statement"] = {
-                                    "data": income_concepts,
+                                    "data": self._project_concepts(income_concepts, line_items),
                                     "source": "xbrl_concepts_dynamic",
                                 }
                 except Exception as e:
@@ -145,11 +150,8 @@ class FinancialTools:
                 try:
                     balance = financials.balance_sheet()
                     if balance is not None and hasattr(balance, "to_dict"):
-                        result["statements"]["balance_sheet"] = {
-                            "data": balance.to_dict(orient="index"),
-                            "columns": list(balance.columns),
-                            "index": list(balance.index),
-                        }
+                        self.statements.put(latest_filing.accession_number, "balance_sheet", balance)
+                        result["statements"]["balance_sheet"] = self._statement_payload(balance, compact, line_items, periods)
                     else:
                         # Try to get balance sheet from XBRL directly
                         if xbrl and hasattr(xbrl, "get_statement_by_type"):
@@ -165,7 +167,7 @@ class FinancialTools:
                             balance_concepts = self._discover_statement_concepts(xbrl, latest_filing, "balance")
                             if balance_concepts:
                                 result["statements"]["balance_sheet"] = {
-                                    "data": balance_concepts,
+                                    "data": self._project_concepts(balance_concepts, line_items),
                                     "source": "xbrl_concepts_dynamic",
                                 }
                 except Exception as e:
@@ -175,11 +177,8 @@ class FinancialTools:
                 try:
                     cash = financials.cashflow_statement()
                     if cash is not None and hasattr(cash, "to_dict"):
-                        result["statements"]["cash_flow"] = {
-                            "data": cash.to_dict(orient="index"),
-                            "columns": list(cash.columns),
-                            "index": list(cash.index),
-                        }
+                        self.statements.put(latest_filing.accession_number, "cash_flow", cash)
+                        result["statements"]["cash_flow"] = self._statement_payload(cash, compact, line_items, periods)
                     else:
                         # Try to get cash flow from XBRL directly
                         if xbrl and hasattr(xbrl, "get_statement_by_type"):
@@ -196,7 +195,7 @@ class FinancialTools:
 
                             if cash_concepts:
                                 result["statements"]["cash_flow"] = {
-                                    "data": cash_concepts,
+                                    "data": self._project_concepts(cash_concepts, line_items),
                                     "source": "xbrl_concepts_dynamic",
                                 }
                 except Exception as e:
@@ -212,6 +211,56 @@ class FinancialTools:
         except Exception as e:
             return {"success": False, "error": f"Failed to get financials: {str(e)}"}
 
+    def _financials_result(self, company, latest_filing, form_type):
+        """Response skeleton of ``get_financials`` with the filing reference."""
+        return {
+            "success": True,
+            "cik": company.cik,
+            "name": company.name,
+            "form_type": form_type,
+            "statements": {},
+            "filing_reference": {
+                "filing_date": latest_filing.filing_date.isoformat()
+                if hasattr(latest_filing.filing_date, "isoformat")
+                else str(latest_filing.filing_date),
+                "accession_number": latest_filing.accession_number,
+                "form_type": form_type,
+                "sec_url": f"https://www.sec.gov/Archives/edgar/data/{company.cik}/{latest_filing.accession_number.replace('-', '')}/{latest_filing.accession_number}.txt",
+                "filing_url": latest_filing.url if hasattr(latest_filing, "url") else None,
+                "data_source": f"SEC EDGAR Filing {latest_filing.accession_number}, extracted directly from XBRL data",
+                "disclaimer": "All data extracted directly from SEC EDGAR filing with exact precision. No estimates, calculations, or rounding applied.",
+                "verification_note": "Users can verify all data independently at the provided SEC URL",
+            },
+        }
+
+    def _statement_payload(self, statement, compact=False, line_items=None, periods=None):
+        """Project a statement DataFrame to the requested line items and periods and encode it."""
+        if line_items:
+            wanted = [item.lower() for item in line_items]
+            statement = statement[[any(item in str(label).lower() for item in wanted) for label in statement.index]]
+        if periods:
+            wanted = [str(period).lower() for period in periods]
+            statement = statement.loc[
+                :, [any(period in str(column).lower() for period in wanted) for column in statement.columns]
+            ]
+
+        columns = [str(column) for column in statement.columns]
+        index = [str(label) for label in statement.index]
+
+        if compact:
+            # NaN is not valid JSON; send missing cells as null
+            values = statement.astype(object).where(statement.notna(), None)
+            return {"columns": columns, "index": index, "rows": values.to_numpy().tolist(), "encoding": "compact"}
+
+        return {"data": statement.to_dict(orient="index"), "columns": columns, "index": index}
+
+    def _project_concepts(self, concepts, line_items=None):
+        """Restrict dynamically discovered concepts to the requested line items."""
+        if not line_items:
+            return concepts
+        wanted = [item.lower() for item in line_items]
+        return {name: value for name, value in concepts.items() if any(item in name.lower() for item in wanted)}
+
     def _extract_income_statement(self, xbrl_data):
         """Extract income statement items from XBRL data."""
         income_concepts = [
@@ -312,46 +361,188 @@ class FinancialTools:
         else:
             return str(statement)
 
-    def get_segment_data(self, identifier: str, segment_type: str = "geographic") -> ToolResponse:
-        """Get segment revenue breakdown."""
+    def get_segment_data(
+        self, identifier: str, segment_type: str = "geographic", concepts: Optional[List[str]] = None
+    ) -> ToolResponse:
+        """Get segment revenue breakdown from the dimension-qualified XBRL facts of the latest 10-K.
+
+        ``segment_type`` is ``geographic``, ``business`` or ``product``, or the name of any
+        XBRL axis. Each metric (revenue, operating income and long-lived assets by default,
+        or each of ``concepts``) is reported per member and fiscal period, largest member
+        first, with the consolidated total for reference.
+        """
         try:
             company = self.client.get_company(identifier)
 
             # Get the latest 10-K
-            filing = company.get_filings(form="10-K").latest()
+            filing = self.client.latest_filing(company, "10-K")
             if not filing:
                 return {"success": False, "error": "No 10-K filings found"}
 
-            # Get the filing object
-            tenk = filing.obj()
+            facts = self._filing_facts(filing)
+            axes = SEGMENT_AXES.get(segment_type.lower(), (segment_type,))
+            metrics = {concept: [concept] for concept in concepts} if concepts else SEGMENT_METRICS
 
             segments = {}
+            for metric, candidates in metrics.items():
+                for concept in candidates:
+                    breakdown = facts.breakdown(concept, axes)
+                    if not breakdown["members"]:
+                        continue
+                    rows = [
+                        {
+                            "axis": axis,
+                            "member": member,
+                            "label": member_label(member),
+                            "values": dict(sorted(values.items(), reverse=True)),
+                        }
+                        for axis, by_member in breakdown["members"].items()
+                        for member, values in by_member.items()
+                    ]
+                    periods = sorted({end for row in rows for end in row["values"]}, reverse=True)
+                    rows.sort(key=lambda row: -abs(row["values"].get(periods[0]) or 0))
+                    segments[metric] = {
+                        "concept": concept,
+                        "unit": breakdown["unit"],
+                        "periods": periods,
+                        "segments": rows,
+                        "total": {end: breakdown["total"][end] for end in periods if end in breakdown["total"]},
+                    }
+                    break
 
-            # Try to extract segment data from financials
-            try:
-                financials = company.get_financials()
-                if financials and hasattr(financials, "get_segment_data"):
-                    segment_data = financials.get_segment_data(segment_type)
-                    if segment_data:
-                        segments = segment_data.to_dict(orient="records")
-            except Exception:
-                pass
-
-            # If no segment data from financials, try to extract from filing text
-            if not segments and hasattr(tenk, "segments"):
-                segments = {"from_filing": True, "data": str(tenk.segments)[:10000]}
-
-            return {
+            result = {
                 "success": True,
                 "cik": company.cik,
                 "name": company.name,
                 "segment_type": segment_type,
                 "segments": segments,
                 "filing_date": filing.filing_date.isoformat(),
+                "accession_number": filing.accession_number,
             }
+            if not segments:
+                result["available_axes"] = sorted(facts.dimension_index())
+            return result
         except Exception as e:
             return {"success": False, "error": f"Failed to get segment data: {str(e)}"}
 
+    def get_financials_history(
+        self, identifier: str, periods: int = 8, form_family: str = "10-Q", line_items: Optional[List[str]] = None
+    ) -> ToolResponse:
+        """Get statement line items from a company's last ``periods`` reports as one period x line item panel.
+
+        Each filing contributes the period it reports: the quarter for 10-Qs (cash-flow items
+        are year to date, as filed) and the fiscal year for annual reports. Filings are read
+        in parallel from their inline XBRL facts, which are cached per accession, so a longer
+        or repeated history only fetches the filings not read before. ``line_items`` are XBRL
+        concepts to report instead of the default statement lines.
+        """
+        try:
+            import numpy as np
+
+            periods = max(1, min(int(periods), MAX_HISTORY_PERIODS))
+            company = self.client.get_company(identifier)
+
+            # Amendments would repeat a period, often with only part of the statements
+            filings = company.get_filings(form=form_family, amendments=False)
+            filings = [filings.get_filing_at(i) for i in range(min(periods, len(filings)))]
+            if not filings:
+                return {"success": False, "error": f"No {form_family} filings found"}
+
+            items = {concept: [concept] for concept in line_items} if line_items else HISTORY_LINE_ITEMS
+            quarterly = form_family.upper().startswith("10-Q")
+
+            def extract(filing) -> Dict[str, Any]:
+                try:
+                    facts = self._filing_facts(filing)
+                    end = facts.contexts.get(facts.document_context or "", {}).get("end")
+                    if not end:
+                        return {"filing": filing, "error": "No inline XBRL document period found"}
+                    values = {}
+                    for item, candidates in items.items():
+                        for concept in candidates:
+                            fact = facts.period_fact(concept, end, shortest=quarterly)
+                            if fact is not None:
+                                values[item] = fact
+                                break
+                    return {
+                        "filing": filing,
+                        "end": end,
+                        "values": values,
+                        "fiscal_year": _dei_text(facts, "dei:DocumentFiscalYearFocus"),
+                        "fiscal_period": _dei_text(facts, "dei:DocumentFiscalPeriodFocus"),
+                    }
+                except Exception as e:
+                    return {"filing": filing, "error": str(e)}
+
+            with ThreadPoolExecutor(max_workers=max(1, min(HISTORY_CONCURRENCY, len(filings)))) as pool:
+                extracted = list(pool.map(extract, filings))
+
+            # One row per period end, from the latest filing reporting it, newest period first
+            by_end: Dict[str, Dict[str, Any]] = {}
+            for row in extracted:
+                if "end" in row:
+                    by_end.setdefault(row["end"], row)
+            ends = sorted(by_end, reverse=True)
+            columns = list(items)
+            panel = np.full((len(ends), len(columns)), np.nan)
+            for r, end in enumerate(ends):
+                for c, item in enumerate(columns):
+                    fact = by_end[end]["values"].get(item)
+                    if fact is not None:
+                        panel[r, c] = fact["value"]
+
+            found = ~np.isnan(panel).all(axis=0)
+            panel = panel[:, found]
+            reported = [item for item, keep in zip(columns, found) if keep]
+            # NaN is not valid JSON; send missing cells as null and whole numbers as integers
+            rows = [
+                [None if np.isnan(value) else int(value) if value.is_integer() else float(value) for value in row]
+                for row in panel.tolist()
+            ]
+
+            line_item_info = {}
+            for item in reported:
+                facts = [by_end[end]["values"][item] for end in ends if item in by_end[end]["values"]]
+                line_item_info[item] = {
+                    "concepts": list(dict.fromkeys(fact["concept"] for fact in facts)),
+                    "unit": facts[0]["unit"],
+                }
+
+            result = {
+                "success": True,
+                "cik": company.cik,
+                "name": company.name,
+                "form_family": form_family,
+                "periods": [
+                    {
+                        "period_end": end,
+                        "period_start": next(
+                            (fact["period_start"] for fact in by_end[end]["values"].values() if fact["period_start"]),
+                            None,
+                        ),
+                        "fiscal_year": by_end[end]["fiscal_year"],
+                        "fiscal_period": by_end[end]["fiscal_period"],
+                        "form": by_end[end]["filing"].form,
+                        "filing_date": str(by_end[end]["filing"].filing_date),
+                        "accession_number": by_end[end]["filing"].accession_number,
+                    }
+                    for end in ends
+                ],
+                "line_items": line_item_info,
+                "panel": {"columns": reported, "index": ends, "rows": rows, "encoding": "compact"},
+                "missing_line_items": [item for item, keep in zip(columns, found) if not keep],
+            }
+            errors = [
+                {"accession_number": row["filing"].accession_number, "error": row["error"]}
+                for row in extracted
+                if "error" in row
+            ]
+            if errors:
+                result["errors"] = errors
+            return result
+        except Exception as e:
+            return {"success": False, "error": f"Failed to get financials history: {str(e)}"}
+
     def get_key_metrics(self, identifier: str, metrics: Optional[List[str]] = None) -> ToolResponse:
         """Get key financial metrics."""
         try:
@@ -371,7 +562,7 @@ class FinancialTools:
                 ]
 
             # Get company facts
-            facts = company.get_facts()
+            facts = self.client.get_company_facts(company)
 
             if not facts:
                 return {"success": False, "error": "No facts data available for this company"}
@@ -422,7 +613,7 @@ class FinancialTools:
         """Compare a financial metric across periods."""
         try:
             company = self.client.get_company(identifier)
-            facts = company.get_facts()
+            facts = self.client.get_company_facts(company)
 
             # Get the metric data
             fact_data = facts.get_fact(metric)
@@ -490,7 +681,7 @@ class FinancialTools:
         """Discover available metrics for a company."""
         try:
             company = self.client.get_company(identifier)
-            facts = company.get_facts()
+            facts = self.client.get_company_facts(company)
 
             if not facts:
                 return {"success": False, "error": "No facts available for this company"}
@@ -574,13 +765,12 @@ class FinancialTools:
                     return {"success": False, "error": f"Filing with accession number {accession_number} not found"}
             else:
                 # Get latest filing of specified type
-                filings = company.get_filings(form=form_type)
-                filing = filings.latest()
+                filing = self.client.latest_filing(company, form_type)
                 if not filing:
                     return {"success": False, "error": f"No {form_type} filings found"}
 
             # Get XBRL data
-            xbrl = filing.xbrl()
+            xbrl = self.client.get_filing_xbrl(filing)
 
             if not xbrl:
                 return {"success": False, "error": "No XBRL data found in filing"}
@@ -627,37 +817,42 @@ class FinancialTools:
             return {"success": False, "error": f"Failed to get XBRL concepts: {str(e)}"}
 
     def _get_xbrl_concept(self, xbrl, filing, concept_name):
-        """Get a specific concept from XBRL data using direct filing content extraction."""
+        """Get a specific concept from the filing's inline XBRL facts."""
         try:
-            # Get raw filing content for direct parsing
-            user_agent = initialize_config()
-            filing_content = self._fetch_filing_content(filing.cik, filing.accession_number, user_agent)
-
-            if not filing_content:
-                return self._get_xbrl_concept_fallback(xbrl, concept_name)
-
-            # Extract the concept using direct regex parsing
-            extracted_value = self._extract_xbrl_concept_value(filing_content, concept_name)
+            fact = self._filing_facts(filing).lookup(concept_name)
+            if fact is not None:
+                return self._concept_record(fact, concept_name)
 
-            if extracted_value:
-                return {
-                    "value": extracted_value.get("value"),
-                    "unit": "USD" if isinstance(extracted_value.get("value"), (int, float)) else None,
-                    "context": extracted_value.get("context_ref"),
-                    "period": extracted_value.get("period"),
-                    "concept": concept_name,
-                    "raw_value": extracted_value.get("raw_value"),
-                    "scale": extracted_value.get("scale"),
-                    "source": extracted_value.get("source"),
-                }
-
-            # If direct extraction failed, try fallback
+            # Not tagged inline (or not an inline XBRL filing); try edgartools
             return self._get_xbrl_concept_fallback(xbrl, concept_name)
 
         except Exception:
             # Fallback to old method on any error
             return self._get_xbrl_concept_fallback(xbrl, concept_name)
 
+    def _filing_facts(self, filing):
+        """Fact table of a filing, parsed once per accession and cached."""
+        return fetch_filing_facts(filing.cik, filing.accession_number)
+
+    @staticmethod
+    def _concept_record(fact, concept_name):
+        return {
+            "value": fact["value"],
+            "unit": fact["unit"],
+            "context": fact["context"],
+            "period": fact["period_end"],
+            "period_start": fact["period_start"],
+            "period_type": fact["period_type"],
+            "dimensions": fact["dimensions"],
+            "concept": concept_name,
+            "xbrl_concept": fact["concept"],
+            "raw_value": fact["raw_value"],
+            "exact_value": fact["exact_value"],
+            "decimals": fact["decimals"],
+            "scale": fact["scale"],
+            "source": "xbrl_direct_extraction" if fact["is_numeric"] else "xbrl_text_extraction",
+        }
+
     def _get_xbrl_concept_fallback(self, xbrl, concept_name):
         """Fallback method using edgartools API (may return placeholder values)."""
         # Try to get the concept using the query method
@@ -707,16 +902,11 @@ class FinancialTools:
         return None
 
     def _discover_statement_concepts(self, xbrl, filing, statement_type):
-        """Extract financial concepts directly from XBRL filing content using regex patterns."""
+        """Extract financial concepts directly from the filing's inline XBRL facts."""
         discovered_concepts = {}
 
         try:
-            # Get the raw filing content
-            user_agent = initialize_config()
-            filing_content = self._fetch_filing_content(filing.cik, filing.accession_number, user_agent)
-
-            if not filing_content:
-                return discovered_concepts
+            facts = self._filing_facts(filing)
 
             # Define concept patterns for different statement types
             concept_patterns = {
@@ -753,129 +943,15 @@ class FinancialTools:
             concepts_to_find = concept_patterns.get(statement_type, [])
 
             for concept in concepts_to_find:
-                extracted_value = self._extract_xbrl_concept_value(filing_content, concept)
-                if extracted_value:
-                    discovered_concepts[concept] = extracted_value
+                fact = facts.lookup(concept)
+                if fact is not None:
+                    discovered_concepts[concept] = self._concept_record(fact, concept)
 
         except Exception as e:
             discovered_concepts["extraction_error"] = str(e)
 
         return discovered_concepts
 
-    def _fetch_filing_content(self, cik, accession_number, user_agent):
-        """Fetch raw filing content from SEC EDGAR."""
-        try:
-            # Normalize CIK
-            normalized_cik = str(int(cik))
-            clean_accession = accession_number.replace("-", "")
-
-            # Build URL for the .txt file (contains XBRL)
-            url = f"https://www.sec.gov/Archives/edgar/data/{normalized_cik}/{clean_accession}/{accession_number}.txt"
-
-            headers = {
-                "User-Agent": user_agent,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            }
-
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            return response.text
-
-        except Exception:
-            return None
-
-    def _extract_xbrl_concept_value(self, filing_content, concept):
-        """Extract XBRL concept value using regex patterns like the old server."""
-        import re
-
-        try:
-            # Pattern to find XBRL facts - flexible search for any tag containing the concept name
-            patterns = [
-                # Exact matches first (highest priority)
-                rf'<ix:nonFraction[^>]*name="[^"]*:{re.escape(concept)}"[^>]*>([^<]+)</ix:nonFraction>',
-                rf'<ix:nonFraction[^>]*name="{re.escape(concept)}"[^>]*>([^<]+)</ix:nonFraction>',
-                # Flexible substring matches - any tag name containing the concept
-                rf'<ix:nonFraction[^>]*name="[^"]*{re.escape(concept)}[^"]*"[^>]*>([^<]+)</ix:nonFraction>',
-                # Same for nonNumeric tags
-                rf'<ix:nonNumeric[^>]*name="[^"]*:{re.escape(concept)}"[^>]*>([^<]+)</ix:nonNumeric>',
-                rf'<ix:nonNumeric[^>]*name="{re.escape(concept)}"[^>]*>([^<]+)</ix:nonNumeric>',
-                rf'<ix:nonNumeric[^>]*name="[^"]*{re.escape(concept)}[^"]*"[^>]*>([^<]+)</ix:nonNumeric>',
-            ]
-
-            for pattern in patterns:
-                matches = re.finditer(pattern, filing_content, re.IGNORECASE | re.DOTALL)
-
-                for match in matches:
-                    value_text = match.group(1).strip()
-
-                    # Skip empty or placeholder values
-                    if not value_text or value_text in ["--", "—", "--06-30"]:
-                        continue
-
-                    # Try to extract numeric value
-                    try:
-                        # Remove commas and convert to number
-                        numeric_text = re.sub(r"[,$()]", "", value_text)
-
-                        # Handle negative values in parentheses
-                        if "(" in value_text and ")" in value_text:
-                            numeric_text = "-" + numeric_text
-
-                        numeric_value = float(numeric_text)
-
-                        # Extract scale attribute if present
-                        scale_match = re.search(r'scale="(-?\d+)"', match.group(0))
-                        scale = int(scale_match.group(1)) if scale_match else 0
-
-                        # Apply scale
-                        actual_value = numeric_value * (10**scale)
-
-                        # Extract context and period info
-                        context_ref_match = re.search(r'contextRef="([^"]+)"', match.group(0))
-                        context_ref = context_ref_match.group(1) if context_ref_match else None
-
-                        # Find the context to get period info
-                        period = None
-                        if context_ref:
-                            context_pattern = (
-                                rf'<xbrli:context[^>]*id="{re.escape(context_ref)}"[^>]*>(.*?)</xbrli:context>'
-                            )
-                            context_match = re.search(context_pattern, filing_content, re.DOTALL)
-                            if context_match:
-                                # Extract end date
-                                date_match = re.search(
-                                    r"<xbrli:endDate>([^<]+)</xbrli:endDate>", context_match.group(1)
-                                )
-                                if not date_match:
-                                    date_match = re.search(
-                                        r"<xbrli:instant>([^<]+)</xbrli:instant>", context_match.group(1)
-                                    )
-                                period = date_match.group(1) if date_match else None
-
-                        return {
-                            "value": actual_value,
-                            "raw_value": value_text,
-                            "period": period,
-                            "context_ref": context_ref,
-                            "scale": scale,
-                            "source": "xbrl_direct_extraction",
-                        }
-
-                    except (ValueError, TypeError):
-                        # If not numeric, return as text
-                        return {
-                            "value": value_text,
-                            "raw_value": value_text,
-                            "period": None,
-                            "context_ref": None,
-                            "source": "xbrl_text_extraction",
-                        }
-
-            return None
-
-        except Exception:
-            return None
-
     def _get_all_financial_concepts(self, xbrl, filing):
         """Extract all major financial concepts from XBRL."""
         major_concepts = [
@@ -947,13 +1023,12 @@ class FinancialTools:
                     return {"success": False, "error": f"Filing with accession number {accession_number} not found"}
             else:
                 # Get latest filing of specified type
-                filings = company.get_filings(form=form_type)
-                filing = filings.latest()
+                filing = self.client.latest_filing(company, form_type)
                 if not filing:
                     return {"success": False, "error": f"No {form_type} filings found"}
 
             # Get XBRL data
-            xbrl = filing.xbrl()
+            xbrl = self.client.get_filing_xbrl(filing)
 
             if not xbrl:
                 return {"success": False, "error": "No XBRL data found in filing"}
@@ -1035,3 +1110,9 @@ class FinancialTools:
 
         except Exception as e:
             return {"success": False, "error": f"Failed to discover XBRL concepts: {str(e)}"}
+
+
+def _dei_text(facts, name: str) -> Optional[str]:
+    """Text of a document and entity information fact such as ``dei:DocumentFiscalPeriodFocus``, or None."""
+    matches = facts.matching(name)
+    return facts.text[matches[0]] if matches else None
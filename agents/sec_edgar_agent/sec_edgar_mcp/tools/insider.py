@@ -1,15 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta, date
 from ..core.client import EdgarClient
+from ..filing_header import fetch_filing_header
+from ..insider_analytics import PERIODS, sentiment_series, summarize_insider_activity
+from ..insider_store import get_insider_store
+from ..ownership_parser import TRANSACTION_CODES
 from ..utils.exceptions import FilingNotFoundError
 from .types import ToolResponse
 
+# Companies analyzed in parallel by the batch sentiment tool; SEC requests still share one rate limit
+BATCH_CONCURRENCY = 4
+
 
 class InsiderTools:
     """Tools for insider trading data (Forms 3, 4, 5) - simplified version."""
 
     def __init__(self):
         self.client = EdgarClient()
+        self.store = get_insider_store()
+
+    def _stored_filings(
+        self, company, form_types: List[str], days: int, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get the company's insider filings from the last ``days`` days from the local store, newest first.
+
+        Only filings the store has not seen yet are downloaded and parsed. Filings whose
+        ownership XML could not be fetched are still listed, unparsed, with a ``fetch_error``.
+        """
+        cutoff_date = datetime.now() - timedelta(days=days)
+
+        recent_filings = []
+        for filing in company.get_filings(form=form_types):
+            if limit is not None and len(recent_filings) >= limit:
+                break
+            filing_date = _as_datetime(filing.filing_date)
+            if filing_date is not None and filing_date >= cutoff_date:
+                recent_filings.append(filing)
+
+        failed = self.store.sync(company.cik, recent_filings)
+        stored = {
+            record["accession_number"]: record
+            for record in self.store.filings(
+                company.cik, accession_numbers=[filing.accession_number for filing in recent_filings]
+            )
+        }
+        return [
+            stored.get(filing.accession_number)
+            or _unstored_filing(company.cik, filing, failed.get(filing.accession_number, "not stored"))
+            for filing in recent_filings
+        ]
+
+    def _stored_transactions(self, filings: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the stored transaction and holding rows of filings, grouped by accession number."""
+        grouped: Dict[str, List[Dict[str, Any]]] = {filing["accession_number"]: [] for filing in filings}
+        rows = self.store.transactions(accession_numbers=list(grouped), include_holdings=True)
+        for row in sorted(rows, key=lambda r: r["row_index"]):
+            grouped[row["accession_number"]].append(row)
+        return grouped
 
     def get_insider_transactions(
         self, identifier: str, form_types: Optional[List[str]] = None, days: int = 90, limit: int = 50
@@ -22,66 +70,36 @@ class InsiderTools:
             if not form_types:
                 form_types = ["3", "4", "5"]
 
-            # Get insider filings
-            filings = company.get_filings(form=form_types)
+            # Get insider filings, parsing only those not yet in the store
+            filings = self._stored_filings(company, form_types, days, limit)
+            rows_by_filing = self._stored_transactions(filings)
 
             transactions = []
-            count = 0
-
             for filing in filings:
-                if count >= limit:
-                    break
-
-                # Check date filter
-                filing_date = filing.filing_date
-
-                # Convert to datetime object for comparison
-                if isinstance(filing_date, str):
-                    filing_date = datetime.fromisoformat(filing_date.replace("Z", "+00:00"))
-                elif isinstance(filing_date, date) and not isinstance(filing_date, datetime):
-                    # It's a date object, convert to datetime
-                    filing_date = datetime.combine(filing_date, datetime.min.time())
-
-                # Ensure we have a datetime object
-                if not isinstance(filing_date, datetime):
-                    continue
-
-                if (datetime.now() - filing_date).days > days:
-                    continue
-
-                try:
-                    # Basic transaction info from filing with proper SEC URL
-                    transaction_info = {
-                        "filing_date": filing.filing_date.isoformat(),
-                        "form_type": filing.form,
-                        "accession_number": filing.accession_number,
-                        "company_name": filing.company,
-                        "cik": filing.cik,
-                        "url": filing.url,
-                        "sec_url": f"https://www.sec.gov/Archives/edgar/data/{filing.cik}/{filing.accession_number.replace('-', '')}/{filing.accession_number}.txt",
-                        "data_source": f"SEC EDGAR Filing {filing.accession_number}, extracted directly from insider filing data",
-                    }
-
-                    # Try to get more details if available
-                    try:
-                        ownership = filing.obj()
-                        if ownership:
-                            # Extract basic ownership info
-                            if hasattr(ownership, "owner_name"):
-                                transaction_info["owner_name"] = ownership.owner_name
-                            if hasattr(ownership, "owner_title"):
-                                transaction_info["owner_title"] = ownership.owner_title
-                            if hasattr(ownership, "is_director"):
-                                transaction_info["is_director"] = ownership.is_director
-                            if hasattr(ownership, "is_officer"):
-                                transaction_info["is_officer"] = ownership.is_officer
-                    except Exception:
-                        pass
-
-                    transactions.append(transaction_info)
-                    count += 1
-                except Exception:
-                    continue
+                accession_number = filing["accession_number"]
+                # Basic transaction info from filing with proper SEC URL
+                transaction_info = {
+                    "filing_date": filing["filing_date"],
+                    "form_type": filing["form_type"],
+                    "accession_number": accession_number,
+                    "company_name": filing["company_name"],
+                    "cik": company.cik,
+                    "url": filing["url"],
+                    "sec_url": f"https://www.sec.gov/Archives/edgar/data/{company.cik}/{accession_number.replace('-', '')}/{accession_number}.txt",
+                    "data_source": f"SEC EDGAR Filing {accession_number}, extracted directly from insider filing data",
+                }
+
+                # Add owner details and transaction rows from the ownership XML
+                if filing["parsed"]:
+                    transaction_info["owner_name"] = filing["owner_name"]
+                    transaction_info["owner_title"] = filing["owner_title"]
+                    transaction_info["is_director"] = filing["is_director"]
+                    transaction_info["is_officer"] = filing["is_officer"]
+                    transaction_info["transactions"] = _transaction_rows(rows_by_filing[accession_number])
+                elif filing.get("fetch_error"):
+                    transaction_info["parsing_error"] = f"Could not fetch ownership XML: {filing['fetch_error']}"
+
+                transactions.append(transaction_info)
 
             return {
                 "success": True,
@@ -106,63 +124,25 @@ class InsiderTools:
         try:
             company = self.client.get_company(identifier)
 
-            # Get all insider filings
-            filings = company.get_filings(form=["3", "4", "5"])
+            # Get all insider filings, parsing only those not yet in the store
+            filings = self._stored_filings(company, ["3", "4", "5"], days)
 
             summary: Dict[str, Any] = {
-                "total_filings": 0,
-                "form_3_count": 0,
-                "form_4_count": 0,
-                "form_5_count": 0,
-                "recent_filings": [],
-                "insiders": set(),
+                "total_filings": len(filings),
+                "unfetched_filings": sum(1 for f in filings if f.get("fetch_error")),
+                "form_3_count": sum(1 for f in filings if f["form_type"] == "3"),
+                "form_4_count": sum(1 for f in filings if f["form_type"] == "4"),
+                "form_5_count": sum(1 for f in filings if f["form_type"] == "5"),
+                "recent_filings": [
+                    {"date": f["filing_date"], "form": f["form_type"], "accession": f["accession_number"]}
+                    for f in filings[:10]
+                ],
             }
 
-            cutoff_date = datetime.now() - timedelta(days=days)
-
-            for filing in filings:
-                # Convert filing_date to datetime for comparison
-                filing_date = filing.filing_date
-                if isinstance(filing_date, str):
-                    filing_date = datetime.fromisoformat(filing_date.replace("Z", "+00:00"))
-                elif isinstance(filing_date, date) and not isinstance(filing_date, datetime):
-                    filing_date = datetime.combine(filing_date, datetime.min.time())
-
-                if not isinstance(filing_date, datetime):
-                    continue
-
-                if filing_date < cutoff_date:
-                    continue
-
-                summary["total_filings"] += 1
-
-                if filing.form == "3":
-                    summary["form_3_count"] += 1
-                elif filing.form == "4":
-                    summary["form_4_count"] += 1
-                elif filing.form == "5":
-                    summary["form_5_count"] += 1
-
-                # Add to recent filings
-                if len(summary["recent_filings"]) < 10:
-                    summary["recent_filings"].append(
-                        {
-                            "date": filing.filing_date.isoformat(),
-                            "form": filing.form,
-                            "accession": filing.accession_number,
-                        }
-                    )
-
-                # Try to get insider name
-                try:
-                    ownership = filing.obj()
-                    if ownership and hasattr(ownership, "owner_name"):
-                        summary["insiders"].add(ownership.owner_name)
-                except Exception:
-                    pass
-
-            summary["unique_insiders"] = len(summary["insiders"])
-            summary["insiders"] = list(summary["insiders"]) if isinstance(summary["insiders"], set) else []
+            # Insider names from the stored ownership documents
+            insiders = {name for f in filings if f["owner_name"] for name in f["owner_name"].split("; ")}
+            summary["unique_insiders"] = len(insiders)
+            summary["insiders"] = list(insiders)
 
             return {"success": True, "cik": company.cik, "name": company.name, "period_days": days, "summary": summary}
         except Exception as e:
@@ -189,22 +169,22 @@ class InsiderTools:
                 "company_name": filing.company,
                 "cik": filing.cik,
                 "url": filing.url,
-                "content_preview": filing.text()[:1000] if hasattr(filing, "text") else None,
+                # Header metadata and document list, a few KB instead of the full submission text
+                "header": fetch_filing_header(company.cik, filing.accession_number),
             }
 
-            # Try to get structured data
-            try:
-                form4 = filing.obj()
-                if form4:
-                    details["owner"] = {
-                        "name": getattr(form4, "owner_name", ""),
-                        "title": getattr(form4, "owner_title", ""),
-                        "is_director": getattr(form4, "is_director", False),
-                        "is_officer": getattr(form4, "is_officer", False),
-                        "is_ten_percent_owner": getattr(form4, "is_ten_percent_owner", False),
-                    }
-            except Exception:
-                pass
+            # Structured data from the ownership XML, parsed once and kept in the store
+            failed = self.store.sync(company.cik, [filing])
+            if failed:
+                details["parsing_error"] = f"Could not fetch ownership XML: {failed[filing.accession_number]}"
+            stored = self.store.filings(company.cik, accession_numbers=[filing.accession_number])
+            if stored and stored[0]["parsed"]:
+                form4 = stored[0]
+                rows = self._stored_transactions(stored)[filing.accession_number]
+                details["owner"] = _owner_summary(form4)
+                details["period_of_report"] = form4["period_of_report"]
+                details["transactions"] = _transaction_rows(rows)
+                details["holdings"] = _holding_rows(rows)
 
             return {"success": True, "form4_details": details}
         except Exception as e:
@@ -215,120 +195,53 @@ class InsiderTools:
         try:
             company = self.client.get_company(identifier)
 
-            # Get Form 4 filings
-            filings = company.get_filings(form="4")
+            # Get Form 4 filings, parsing only those not yet in the store
+            filings = self._stored_filings(company, ["4"], days, limit)
+            rows_by_filing = self._stored_transactions(filings)
 
             detailed_transactions = []
-
-            count = 0
             for filing in filings:
-                if count >= limit:
-                    break
-
-                # Check date filter
-                filing_date = filing.filing_date
-                if isinstance(filing_date, str):
-                    filing_date = datetime.fromisoformat(filing_date.replace("Z", "+00:00"))
-                elif isinstance(filing_date, date) and not isinstance(filing_date, datetime):
-                    filing_date = datetime.combine(filing_date, datetime.min.time())
-
-                if not isinstance(filing_date, datetime):
-                    continue
+                accession_number = filing["accession_number"]
+                sec_url = f"https://www.sec.gov/Archives/edgar/data/{company.cik}/{accession_number.replace('-', '')}/{accession_number}.txt"
 
-                if (datetime.now() - filing_date).days > days:
+                if not filing["parsed"]:
+                    # If we couldn't parse this filing, add basic info
+                    detailed_transactions.append(
+                        {
+                            "filing_date": filing["filing_date"],
+                            "form_type": filing["form_type"],
+                            "accession_number": accession_number,
+                            "sec_url": sec_url,
+                            "data_source": f"SEC EDGAR Filing {accession_number}, basic filing data only",
+                            "parsing_error": f"Could not fetch ownership XML: {filing['fetch_error']}"
+                            if filing.get("fetch_error")
+                            else "Could not extract detailed data: no parseable ownership XML",
+                        }
+                    )
                     continue
 
-                try:
-                    # Get detailed Form 4 data
-                    form4 = filing.obj()
-
-                    transaction_detail = {
-                        "filing_date": filing.filing_date.isoformat(),
-                        "form_type": filing.form,
-                        "accession_number": filing.accession_number,
-                        "sec_url": f"https://www.sec.gov/Archives/edgar/data/{filing.cik}/{filing.accession_number.replace('-', '')}/{filing.accession_number}.txt",
-                        "data_source": f"SEC EDGAR Filing {filing.accession_number}, extracted directly from Form 4 XBRL data",
-                    }
-
-                    if form4:
-                        # Extract owner information
-                        if hasattr(form4, "owner_name"):
-                            transaction_detail["owner_name"] = form4.owner_name
-                        if hasattr(form4, "owner_title"):
-                            transaction_detail["owner_title"] = form4.owner_title
-                        if hasattr(form4, "is_director"):
-                            transaction_detail["is_director"] = form4.is_director
-                        if hasattr(form4, "is_officer"):
-                            transaction_detail["is_officer"] = form4.is_officer
-                        if hasattr(form4, "is_ten_percent_owner"):
-                            transaction_detail["is_ten_percent_owner"] = form4.is_ten_percent_owner
-
-                        # Extract transaction data
-                        if hasattr(form4, "transactions") and form4.transactions:
-                            transactions = []
-                            for tx in form4.transactions:
-                                tx_data = {}
-                                if hasattr(tx, "transaction_date"):
-                                    tx_data["transaction_date"] = str(tx.transaction_date)
-                                if hasattr(tx, "transaction_code"):
-                                    tx_data["transaction_code"] = tx.transaction_code
-                                if hasattr(tx, "shares"):
-                                    tx_data["shares"] = float(tx.shares) if tx.shares else None
-                                if hasattr(tx, "price_per_share"):
-                                    tx_data["price_per_share"] = (
-                                        float(tx.price_per_share) if tx.price_per_share else None
-                                    )
-                                if hasattr(tx, "transaction_amount"):
-                                    tx_data["transaction_amount"] = (
-                                        float(tx.transaction_amount) if tx.transaction_amount else None
-                                    )
-                                if hasattr(tx, "shares_owned_after"):
-                                    tx_data["shares_owned_after"] = (
-                                        float(tx.shares_owned_after) if tx.shares_owned_after else None
-                                    )
-                                if hasattr(tx, "acquisition_or_disposition"):
-                                    tx_data["acquisition_or_disposition"] = tx.acquisition_or_disposition
-
-                                if tx_data:  # Only add if we got some data
-                                    transactions.append(tx_data)
-
-                            if transactions:
-                                transaction_detail["transactions"] = transactions
-
-                        # Extract holdings data
-                        if hasattr(form4, "holdings") and form4.holdings:
-                            holdings = []
-                            for holding in form4.holdings:
-                                holding_data = {}
-                                if hasattr(holding, "shares_owned"):
-                                    holding_data["shares_owned"] = (
-                                        float(holding.shares_owned) if holding.shares_owned else None
-                                    )
-                                if hasattr(holding, "ownership_nature"):
-                                    holding_data["ownership_nature"] = holding.ownership_nature
-
-                                if holding_data:
-                                    holdings.append(holding_data)
-
-                            if holdings:
-                                transaction_detail["holdings"] = holdings
-
-                    detailed_transactions.append(transaction_detail)
-                    count += 1
-
-                except Exception as e:
-                    # If we can't parse this filing, add basic info
-                    transaction_detail = {
-                        "filing_date": filing.filing_date.isoformat(),
-                        "form_type": filing.form,
-                        "accession_number": filing.accession_number,
-                        "sec_url": f"https://www.sec.gov/Archives/edgar/data/{filing.cik}/{filing.accession_number.replace('-', '')}/{filing.accession_number}.txt",
-                        "data_source": f"SEC EDGAR Filing {filing.accession_number}, basic filing data only",
-                        "parsing_error": f"Could not extract detailed data: {str(e)}",
-                    }
-                    detailed_transactions.append(transaction_detail)
-                    count += 1
-                    continue
+                transaction_detail = {
+                    "filing_date": filing["filing_date"],
+                    "form_type": filing["form_type"],
+                    "accession_number": accession_number,
+                    "sec_url": sec_url,
+                    "data_source": f"SEC EDGAR Filing {accession_number}, extracted directly from Form 4 XML data",
+                    "owner_name": filing["owner_name"],
+                    "owner_title": filing["owner_title"],
+                    "is_director": filing["is_director"],
+                    "is_officer": filing["is_officer"],
+                    "is_ten_percent_owner": filing["is_ten_percent_owner"],
+                }
+
+                transactions = _transaction_rows(rows_by_filing[accession_number])
+                if transactions:
+                    transaction_detail["transactions"] = transactions
+
+                holdings = _holding_rows(rows_by_filing[accession_number])
+                if holdings:
+                    transaction_detail["holdings"] = holdings
+
+                detailed_transactions.append(transaction_detail)
 
             return {
                 "success": True,
@@ -348,46 +261,293 @@ class InsiderTools:
         except Exception as e:
             return {"success": False, "error": f"Failed to analyze Form 4 transactions: {str(e)}"}
 
-    def analyze_insider_sentiment(self, identifier: str, months: int = 6) -> ToolResponse:
-        """Analyze insider trading sentiment - simplified version."""
+    def analyze_insider_sentiment(self, identifier: str, months: int = 6, period: str = "month") -> ToolResponse:
+        """Analyze insider trading sentiment with a time series of buys and sells by role."""
         try:
-            company = self.client.get_company(identifier)
+            if period not in PERIODS:
+                raise ValueError(f"period must be one of {', '.join(PERIODS)}")
 
-            # Get insider filings
-            days = months * 30
-            filings = company.get_filings(form=["4"])
+            company = self.client.get_company(identifier)
+            analysis = self._sentiment(company, months, period)
 
-            cutoff_date = datetime.now() - timedelta(days=days)
+            return {"success": True, "cik": company.cik, "name": company.name, "analysis": analysis}
+        except Exception as e:
+            return {"success": False, "error": f"Failed to analyze insider sentiment: {str(e)}"}
 
-            # Filter filings with proper datetime comparison
-            recent_filings = []
-            for f in filings:
-                filing_date = f.filing_date
-                if isinstance(filing_date, str):
-                    filing_date = datetime.fromisoformat(filing_date.replace("Z", "+00:00"))
-                elif isinstance(filing_date, date) and not isinstance(filing_date, datetime):
-                    filing_date = datetime.combine(filing_date, datetime.min.time())
+    def analyze_insider_sentiment_batch(
+        self, identifiers: List[str], months: int = 6, period: str = "month"
+    ) -> ToolResponse:
+        """Analyze insider trading sentiment for several companies in one call."""
+        try:
+            if period not in PERIODS:
+                raise ValueError(f"period must be one of {', '.join(PERIODS)}")
+            identifiers = list(dict.fromkeys(identifiers))
 
-                if isinstance(filing_date, datetime) and filing_date >= cutoff_date:
-                    recent_filings.append(f)
+            def analyze(identifier: str) -> Dict[str, Any]:
+                try:
+                    company = self.client.get_company(identifier)
+                    analysis = self._sentiment(company, months, period)
+                    return {"success": True, "cik": company.cik, "name": company.name, "analysis": analysis}
+                except Exception as e:
+                    return {"success": False, "error": f"Failed to analyze insider sentiment: {str(e)}"}
+
+            with ThreadPoolExecutor(max_workers=max(1, min(BATCH_CONCURRENCY, len(identifiers)))) as pool:
+                results = dict(zip(identifiers, pool.map(analyze, identifiers)))
+
+            # Window totals per company, for ranking without reading every series
+            overview = {}
+            for identifier, result in results.items():
+                if result["success"]:
+                    totals = result["analysis"]["series"]["by_role"].get("all", {})
+                    overview[identifier] = {
+                        "net_shares": sum(totals.get("net_shares", [])),
+                        "net_value": round(sum(totals.get("net_value", [])), 2),
+                        "buy_transactions": sum(totals.get("buy_transactions", [])),
+                        "sell_transactions": sum(totals.get("sell_transactions", [])),
+                    }
 
-            analysis: Dict[str, Any] = {
+            return {
+                "success": True,
                 "period_months": months,
-                "total_form4_filings": len(recent_filings),
-                "filing_frequency": "high"
-                if len(recent_filings) > 10
-                else "low"
-                if len(recent_filings) < 3
-                else "moderate",
-                "recent_filings": [],
+                "period": period,
+                "count": len(results),
+                "overview": overview,
+                "results": results,
+            }
+        except Exception as e:
+            return {"success": False, "error": f"Failed to analyze insider sentiment: {str(e)}"}
+
+    def get_reporting_owner_activity(self, owner: str, days: int = 730, limit: int = 50) -> ToolResponse:
+        """Get a reporting owner's insider filings across all issuers from the reporting-owner index."""
+        try:
+            owner = owner.strip()
+            by_cik = owner.isdigit()
+            since = (datetime.now() - timedelta(days=days)).date() if days else None
+            lookup = {"owner_cik": owner} if by_cik else {"owner_name": owner}
+
+            filings = self.store.owner_filings(since=since, limit=limit, **lookup)
+            issuers = self.store.owner_issuers(since=since, **lookup)
+
+            # A name prefix can match several people; list them so the caller can narrow down by CIK
+            owners: Dict[str, Dict[str, Any]] = {}
+            for filing in filings:
+                key = filing["owner_cik"] or filing["owner_name"]
+                owners.setdefault(key, {"cik": filing["owner_cik"], "name": filing["owner_name"]})
+
+            return {
+                "success": True,
+                "owner": owner,
+                "match": "cik" if by_cik else "name_prefix",
+                "period_days": days,
+                "owners": list(owners.values()),
+                "issuer_count": len(issuers),
+                "issuers": issuers,
+                "filings": [
+                    {
+                        "accession_number": filing["accession_number"],
+                        "filing_date": filing["filing_date"],
+                        "form_type": filing["form_type"],
+                        "issuer_cik": filing["issuer_cik"],
+                        "issuer_name": filing["issuer_name"],
+                        "issuer_ticker": filing["issuer_ticker"],
+                        "owner_cik": filing["owner_cik"],
+                        "owner_name": filing["owner_name"],
+                        "owner_title": filing["owner_title"],
+                    }
+                    for filing in filings
+                ],
+                "note": "Covers ownership filings already stored by the insider tools; "
+                "load a company's filings with get_insider_transactions to add it to the index",
             }
+        except Exception as e:
+            return {"success": False, "error": f"Failed to get reporting owner activity: {str(e)}"}
+
+    def query_insider_dataset(
+        self,
+        issuer: Optional[str] = None,
+        owner: Optional[str] = None,
+        transaction_codes: Optional[List[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        include_derivative: bool = True,
+        limit: int = 100,
+    ) -> ToolResponse:
+        """Query historical insider transactions from the ingested SEC insider data sets, without SEC requests."""
+        # Imported here so running ``python -m sec_edgar_mcp.insider_dataset`` does not import that module twice
+        from ..insider_dataset import get_insider_dataset
 
-            # Add recent filing details
-            for filing in recent_filings[:10]:
-                analysis["recent_filings"].append(
-                    {"date": filing.filing_date.isoformat(), "accession": filing.accession_number, "url": filing.url}
+        try:
+            dataset = get_insider_dataset()
+            quarters = dataset.quarters()
+            if not quarters:
+                raise ValueError(
+                    "no insider data sets have been ingested; run python -m sec_edgar_mcp.insider_dataset <archives>"
                 )
+            if not issuer and not owner and not (start_date and end_date):
+                raise ValueError("give an issuer, an owner, or both start_date and end_date")
+
+            frame = dataset.query(
+                issuer=issuer,
+                owner=owner,
+                transaction_codes=transaction_codes,
+                since=date.fromisoformat(start_date) if start_date else None,
+                until=date.fromisoformat(end_date) if end_date else None,
+                include_derivative=include_derivative,
+            )
+            summary = summarize_insider_activity(frame)
+            # Wide queries can match thousands of insiders; keep the most active by dollar value
+            by_value = sorted(
+                summary["by_insider"].items(),
+                key=lambda item: item[1]["value_bought"] + item[1]["value_sold"],
+                reverse=True,
+            )
+            summary["by_insider"] = dict(by_value[:limit])
 
-            return {"success": True, "cik": company.cik, "name": company.name, "analysis": analysis}
+            return {
+                "success": True,
+                "issuer": issuer,
+                "owner": owner,
+                "quarters": sorted(quarters),
+                "total_matches": len(frame),
+                "summary": summary,
+                "transactions": _dataset_rows(frame.head(limit)),
+                "source": "SEC insider transactions data sets (Forms 3, 4, 5)",
+            }
         except Exception as e:
-            return {"success": False, "error": f"Failed to analyze insider sentiment: {str(e)}"}
+            return {"success": False, "error": f"Failed to query insider data sets: {str(e)}"}
+
+    def _sentiment(self, company, months: int, period: str) -> Dict[str, Any]:
+        """Filing counts, open-market totals and the bucketed series for one company's Form 4s."""
+        # Get Form 4 filings, parsing only those not yet in the store
+        days = months * 30
+        recent_filings = self._stored_filings(company, ["4"], days)
+
+        # All transactions of the window in one frame from the store
+        frame = self.store.transaction_frame([f["accession_number"] for f in recent_filings])
+        purchases = frame[frame["transaction_code"] == "P"]
+        sales = frame[frame["transaction_code"] == "S"]
+
+        analysis: Dict[str, Any] = {
+            "period_months": months,
+            "total_form4_filings": len(recent_filings),
+            "filing_frequency": "high"
+            if len(recent_filings) > 10
+            else "low"
+            if len(recent_filings) < 3
+            else "moderate",
+            "open_market_purchases": len(purchases),
+            "open_market_sales": len(sales),
+            "net_open_market_shares": float(purchases["shares"].sum() - sales["shares"].sum()),
+            "series": sentiment_series(frame, period),
+            "recent_filings": [],
+        }
+
+        # Add recent filing details
+        for filing in recent_filings[:10]:
+            analysis["recent_filings"].append(
+                {"date": filing["filing_date"], "accession": filing["accession_number"], "url": filing["url"]}
+            )
+        return analysis
+
+
+def _as_datetime(value: Any) -> Optional[datetime]:
+    """Convert a filing date (string, date or datetime) to a datetime for comparison."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    return None
+
+
+def _unstored_filing(issuer_cik: Any, filing: Any, error: str) -> Dict[str, Any]:
+    """A listed filing that is not in the store, shaped like a stored filing record without parsed data."""
+    return {
+        "accession_number": filing.accession_number,
+        "issuer_cik": str(issuer_cik),
+        "form_type": filing.form,
+        "filing_date": str(filing.filing_date)[:10],
+        "period_of_report": None,
+        "company_name": getattr(filing, "company", None),
+        "url": getattr(filing, "url", None),
+        "owner_cik": None,
+        "owner_name": None,
+        "owner_title": None,
+        "is_director": False,
+        "is_officer": False,
+        "is_ten_percent_owner": False,
+        "is_other": False,
+        "parsed": False,
+        "stored_at": None,
+        "fetch_error": error,
+    }
+
+
+def _owner_summary(filing: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "name": filing["owner_name"],
+        "title": filing["owner_title"],
+        "is_director": filing["is_director"],
+        "is_officer": filing["is_officer"],
+        "is_ten_percent_owner": filing["is_ten_percent_owner"],
+        "is_other": filing["is_other"],
+    }
+
+
+def _transaction_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Transaction rows of one ownership document in the shape the insider tools return."""
+    return [
+        {
+            "transaction_date": row["transaction_date"],
+            "security_title": row["security_title"],
+            "transaction_code": row["transaction_code"],
+            "transaction_type": row["transaction_type"],
+            "acquisition_or_disposition": row["acquired_disposed"],
+            "shares": row["shares"],
+            "price_per_share": row["price_per_share"],
+            "transaction_amount": row["shares"] * row["price_per_share"]
+            if row["shares"] is not None and row["price_per_share"] is not None
+            else None,
+            "shares_owned_after": row["shares_owned_after"],
+            "ownership_type": row["ownership_type"],
+            "is_derivative": row["is_derivative"],
+        }
+        for row in rows
+        if not row["is_holding"]
+    ]
+
+
+def _holding_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Holding rows (positions reported without a transaction) of one ownership document."""
+    return [
+        {
+            "security_title": row["security_title"],
+            "shares_owned": row["shares_owned_after"],
+            "ownership_type": row["ownership_type"],
+            "ownership_nature": row["ownership_nature"],
+            "is_derivative": row["is_derivative"],
+        }
+        for row in rows
+        if row["is_holding"]
+    ]
+
+
+def _dataset_rows(frame) -> List[Dict[str, Any]]:
+    """Rows of an insider data set query in the shape the insider tools return."""
+    rows = []
+    for record in frame.to_dict(orient="records"):
+        for name in ("filing_date", "transaction_date"):
+            value = record[name]
+            record[name] = value.date().isoformat() if value == value and value is not None else None
+        for name in ("shares", "price_per_share", "shares_owned_after"):
+            if record[name] != record[name]:
+                record[name] = None
+        record["transaction_type"] = TRANSACTION_CODES.get(record["transaction_code"] or "", "")
+        record["transaction_amount"] = (
+            record["shares"] * record["price_per_share"]
+            if record["shares"] is not None and record["price_per_share"] is not None
+            else None
+        )
+        rows.append(record)
+    return rows
@@ -1,7 +1,9 @@
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from ..core.client import EdgarClient
-from ..core.models import TransactionInfo
+from ..core.models import TransactionInfo, serialize_records
+from ..insider_analytics import summarize_insider_activity
+from ..insider_store import get_insider_store
 from ..utils.exceptions import FilingNotFoundError
 from .types import ToolResponse
 
@@ -26,7 +28,8 @@ class InsiderTools:
             # Get insider filings
             filings = company.get_filings(form=form_types)
 
-            transactions = []
+            records = []
+            filing_refs = []
             count = 0
 
             for filing in filings:
@@ -46,34 +49,41 @@ class InsiderTools:
                         transactions_list = ownership.transactions
                         if transactions_list:
                             for transaction_data in transactions_list:
-                                transaction = TransactionInfo(
-                                    transaction_date=getattr(transaction_data, "transaction_date", filing.filing_date),
-                                    security_title=getattr(transaction_data, "security_title", "Common Stock"),
-                                    transaction_type=getattr(transaction_data, "transaction_type", ""),
-                                    shares=float(getattr(transaction_data, "shares", 0)),
-                                    price_per_share=float(getattr(transaction_data, "price_per_share", 0))
-                                    if getattr(transaction_data, "price_per_share", None)
-                                    else None,
-                                    total_value=float(getattr(transaction_data, "total_value", 0))
-                                    if getattr(transaction_data, "total_value", None)
-                                    else None,
-                                    ownership_type=getattr(transaction_data, "ownership_type", "Direct"),
-                                    owner_name=getattr(ownership, "owner_name", ""),
-                                    owner_title=getattr(ownership, "owner_title", ""),
+                                records.append(
+                                    TransactionInfo(
+                                        transaction_date=getattr(
+                                            transaction_data, "transaction_date", filing.filing_date
+                                        ),
+                                        security_title=getattr(transaction_data, "security_title", "Common Stock"),
+                                        transaction_type=getattr(transaction_data, "transaction_type", ""),
+                                        shares=float(getattr(transaction_data, "shares", 0)),
+                                        price_per_share=float(getattr(transaction_data, "price_per_share", 0))
+                                        if getattr(transaction_data, "price_per_share", None)
+                                        else None,
+                                        total_value=float(getattr(transaction_data, "total_value", 0))
+                                        if getattr(transaction_data, "total_value", None)
+                                        else None,
+                                        ownership_type=getattr(transaction_data, "ownership_type", "Direct"),
+                                        owner_name=getattr(ownership, "owner_name", ""),
+                                        owner_title=getattr(ownership, "owner_title", ""),
+                                    )
+                                )
+                                filing_refs.append(
+                                    (filing.filing_date.isoformat(), filing.form, filing.accession_number)
                                 )
-
-                                transaction_dict = transaction.to_dict()
-                                transaction_dict["filing_date"] = filing.filing_date.isoformat()
-                                transaction_dict["form_type"] = filing.form
-                                transaction_dict["accession_number"] = filing.accession_number
-
-                                transactions.append(transaction_dict)
 
                     count += 1
                 except Exception:
                     # Skip filings that can't be parsed
                     continue
 
+            # Serialize all transactions in one pass, then attach their filing references
+            transactions = serialize_records(records)
+            for transaction_dict, (filing_date, form_type, accession_number) in zip(transactions, filing_refs):
+                transaction_dict["filing_date"] = filing_date
+                transaction_dict["form_type"] = form_type
+                transaction_dict["accession_number"] = accession_number
+
             # Sort by transaction date
             transactions.sort(key=lambda x: x["transaction_date"], reverse=True)
 
@@ -94,95 +104,15 @@ class InsiderTools:
         try:
             company = self.client.get_company(identifier)
 
-            # Get all insider filings
-            filings = company.get_filings(form=["3", "4", "5"])
-
-            # Initialize summary data
-            summary: Dict[str, Any] = {
-                "total_transactions": 0,
-                "buy_transactions": 0,
-                "sell_transactions": 0,
-                "total_shares_bought": 0,
-                "total_shares_sold": 0,
-                "total_value_bought": 0,
-                "total_value_sold": 0,
-                "unique_insiders": set(),
-                "by_insider": {},
-                "recent_activity": [],
-            }
-
-            cutoff_date = datetime.now() - timedelta(days=days)
-
-            for filing in filings:
-                if filing.filing_date < cutoff_date:
-                    continue
-
-                try:
-                    ownership = filing.obj()
-                    df = ownership.to_dataframe()
-
-                    if not df.empty:
-                        owner_name = getattr(ownership, "owner_name", "Unknown")
-                        summary["unique_insiders"].add(owner_name)
-
-                        if owner_name not in summary["by_insider"]:
-                            summary["by_insider"][owner_name] = {
-                                "transactions": 0,
-                                "shares_bought": 0,
-                                "shares_sold": 0,
-                                "value_bought": 0,
-                                "value_sold": 0,
-                            }
-
-                        for _, row in df.iterrows():
-                            summary["total_transactions"] += 1
-                            summary["by_insider"][owner_name]["transactions"] += 1
-
-                            shares = float(row.get("shares", 0))
-                            value = float(row.get("total_value", 0)) if row.get("total_value") else 0
-                            transaction_type = row.get("transaction_type", "").upper()
-
-                            # Categorize transaction
-                            if any(keyword in transaction_type for keyword in ["BUY", "PURCHASE", "ACQUIRE", "GRANT"]):
-                                summary["buy_transactions"] += 1
-                                summary["total_shares_bought"] += shares
-                                summary["total_value_bought"] += value
-                                summary["by_insider"][owner_name]["shares_bought"] += shares
-                                summary["by_insider"][owner_name]["value_bought"] += value
-                            elif any(keyword in transaction_type for keyword in ["SELL", "SALE", "DISPOSE"]):
-                                summary["sell_transactions"] += 1
-                                summary["total_shares_sold"] += shares
-                                summary["total_value_sold"] += value
-                                summary["by_insider"][owner_name]["shares_sold"] += shares
-                                summary["by_insider"][owner_name]["value_sold"] += value
-
-                            # Add to recent activity
-                            if len(summary["recent_activity"]) < 10:
-                                summary["recent_activity"].append(
-                                    {
-                                        "date": row.get("transaction_date", filing.filing_date).isoformat()
-                                        if hasattr(row.get("transaction_date", filing.filing_date), "isoformat")
-                                        else str(row.get("transaction_date", filing.filing_date)),
-                                        "insider": owner_name,
-                                        "type": transaction_type,
-                                        "shares": shares,
-                                        "value": value,
-                                    }
-                                )
-                except Exception:
-                    continue
+            # Get all insider filings in the window (filing dates are dates, not datetimes)
+            cutoff_date = (datetime.now() - timedelta(days=days)).date()
+            filings = [f for f in company.get_filings(form=["3", "4", "5"]) if f.filing_date >= cutoff_date]
 
-            # Convert set to count
-            summary["unique_insiders"] = len(summary["unique_insiders"])
-
-            # Calculate net activity
-            summary["net_shares"] = int(summary["total_shares_bought"]) - int(summary["total_shares_sold"])
-            summary["net_value"] = float(summary["total_value_bought"]) - float(summary["total_value_sold"])
-            summary["buy_sell_ratio"] = (
-                int(summary["buy_transactions"]) / int(summary["sell_transactions"])
-                if int(summary["sell_transactions"]) > 0
-                else float("inf")
-            )
+            # Parse new filings once, then aggregate all their transactions in one vectorized pass
+            store = get_insider_store()
+            store.sync(company.cik, filings)
+            frame = store.transaction_frame([f.accession_number for f in filings])
+            summary = summarize_insider_activity(frame)
 
             return {"success": True, "cik": company.cik, "name": company.name, "period_days": days, "summary": summary}
         except Exception as e:
@@ -1,16 +1,40 @@
 try:
-    from .cache import TickerCache
+    from .accession import normalize_accession_number
+    from .cache import TickerCache, FilingCache, MemoryCache
+    from .compression import CompressionMiddleware
     from .constants import SEC_USER_AGENT
-    from .exceptions import SECEdgarMCPError, CompanyNotFoundError, FilingNotFoundError
+    from .rate_limit import SharedRateLimiter, get_rate_limiter
+    from .sec_http import sec_get, install_edgar_rate_limiter
+    from .circuit_breaker import CircuitBreaker, get_circuit_breaker
+    from .stale_results import serve_stale_on_error
+    from .exceptions import SECEdgarMCPError, CompanyNotFoundError, FilingNotFoundError, UpstreamUnavailableError
 except ImportError:
-    from cache import TickerCache
+    from accession import normalize_accession_number
+    from cache import TickerCache, FilingCache, MemoryCache
+    from compression import CompressionMiddleware
     from constants import SEC_USER_AGENT
-    from exceptions import SECEdgarMCPError, CompanyNotFoundError, FilingNotFoundError
+    from rate_limit import SharedRateLimiter, get_rate_limiter
+    from sec_http import sec_get, install_edgar_rate_limiter
+    from circuit_breaker import CircuitBreaker, get_circuit_breaker
+    from stale_results import serve_stale_on_error
+    from exceptions import SECEdgarMCPError, CompanyNotFoundError, FilingNotFoundError, UpstreamUnavailableError
 
 __all__ = [
     "TickerCache",
+    "FilingCache",
+    "MemoryCache",
+    "CompressionMiddleware",
+    "normalize_accession_number",
     "SEC_USER_AGENT",
+    "SharedRateLimiter",
+    "get_rate_limiter",
+    "sec_get",
+    "install_edgar_rate_limiter",
+    "CircuitBreaker",
+    "get_circuit_breaker",
+    "serve_stale_on_error",
     "SECEdgarMCPError",
     "CompanyNotFoundError",
     "FilingNotFoundError",
+    "UpstreamUnavailableError",
 ]
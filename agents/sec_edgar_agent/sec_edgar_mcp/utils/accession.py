@@ -0,0 +1,10 @@
+def normalize_accession_number(accession_number: str) -> str:
+    """Normalize an accession number to the dashed 0000000000-00-000000 form.
+
+    Raises ``ValueError`` for anything that is not 18 digits (with or without dashes), so
+    a tool argument can never name a path outside the per-accession cache directories.
+    """
+    clean = str(accession_number).strip().replace("-", "")
+    if len(clean) != 18 or not clean.isdigit():
+        raise ValueError(f"Invalid accession number '{accession_number}': expected 0000000000-00-000000")
+    return f"{clean[:10]}-{clean[10:12]}-{clean[12:]}"
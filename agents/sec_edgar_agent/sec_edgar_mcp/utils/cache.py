@@ -1,10 +1,24 @@
-import requests
+import json
 import os
-from typing import Dict, Optional
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 try:
+    from .accession import normalize_accession_number
     from .exceptions import APIError
+    from .sec_http import sec_get
+    from ..config import get_cache_dir
 except ImportError:
+    from accession import normalize_accession_number
     from exceptions import APIError
+    from sec_http import sec_get
+    from config import get_cache_dir
+
+# How long the on-disk copy of the ticker mapping is reused before it is downloaded again
+TICKER_MAPPING_MAX_AGE = 24 * 60 * 60
 
 
 class TickerCache:
@@ -23,14 +37,17 @@ class TickerCache:
         return self._cache.get(ticker_upper)
 
     def _load_cache(self) -> None:
-        """Load ticker to CIK mapping from SEC."""
+        """Load ticker to CIK mapping, from the shared cache directory when it is fresh or else from SEC."""
         try:
-            url = "https://www.sec.gov/files/company_tickers_exchange.json"
-            headers = {"User-Agent": self._user_agent}
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
+            data = self._read_mapping_file()
+            if data is None:
+                url = "https://www.sec.gov/files/company_tickers_exchange.json"
+                headers = {"User-Agent": self._user_agent}
+                response = sec_get(url, headers=headers)
+                response.raise_for_status()
 
-            data = response.json()
+                data = response.json()
+                self._write_mapping_file(response.content)
             self._cache = {}
 
             # Handle both dict and list formats
@@ -57,3 +74,218 @@ class TickerCache:
     def clear(self) -> None:
         """Clear the cache."""
         self._cache = None
+
+    @staticmethod
+    def _mapping_path() -> str:
+        return os.path.join(get_cache_dir(), "company_tickers_exchange.json")
+
+    def _read_mapping_file(self) -> Optional[Any]:
+        """Read the mapping another process (or an earlier run) already downloaded, if still fresh."""
+        path = self._mapping_path()
+        try:
+            if time.time() - os.path.getmtime(path) > TICKER_MAPPING_MAX_AGE:
+                return None
+            with open(path, "rb") as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _write_mapping_file(self, content: bytes) -> None:
+        path = self._mapping_path()
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+class FilingCache:
+    """On-disk cache for per-accession filing artifacts with a small in-memory LRU in front.
+
+    Filed documents never change once accepted by EDGAR, so entries are kept until
+    they are removed explicitly. Writes go through a temporary file and ``os.replace``
+    so concurrent readers never observe a partially written entry.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_memory_entries: int = 32):
+        self._root = os.path.join(cache_dir or get_cache_dir(), "filings")
+        self._max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def path(self, accession_number: str, name: str) -> str:
+        """Get the on-disk path of an entry."""
+        return os.path.join(self._root, normalize_accession_number(accession_number), name)
+
+    def get_text(self, accession_number: str, name: str) -> Optional[str]:
+        """Get a cached text entry."""
+        data = self._get(accession_number, name)
+        return data.decode("utf-8") if data is not None else None
+
+    def put_text(self, accession_number: str, name: str, text: str) -> None:
+        """Store a text entry."""
+        self._put(accession_number, name, text.encode("utf-8"))
+
+    def get_json(self, accession_number: str, name: str) -> Optional[Any]:
+        """Get a cached JSON entry."""
+        data = self._get(accession_number, name)
+        return json.loads(data) if data is not None else None
+
+    def put_json(self, accession_number: str, name: str, value: Any) -> None:
+        """Store a JSON entry."""
+        self._put(accession_number, name, json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+    def get_bytes(self, accession_number: str, name: str) -> Optional[bytes]:
+        """Get a cached binary entry."""
+        return self._get(accession_number, name)
+
+    def put_bytes(self, accession_number: str, name: str, data: bytes) -> None:
+        """Store a binary entry."""
+        self._put(accession_number, name, data)
+
+    def _get(self, accession_number: str, name: str) -> Optional[bytes]:
+        key = (normalize_accession_number(accession_number), name)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+        try:
+            with open(self.path(accession_number, name), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        self._remember(key, data)
+        return data
+
+    def _put(self, accession_number: str, name: str, data: bytes) -> None:
+        key = (normalize_accession_number(accession_number), name)
+        path = self.path(accession_number, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self._remember(key, data)
+
+    def _remember(self, key: Tuple[str, str], data: bytes) -> None:
+        with self._lock:
+            self._memory[key] = data
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._max_memory_entries:
+                self._memory.popitem(last=False)
+
+
+# Background reloads for stale MemoryCache entries; small so revalidation never crowds out requests
+_revalidation_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sec-edgar-revalidate")
+
+
+class MemoryCache:
+    """Thread-safe in-memory LRU cache with an optional time-to-live.
+
+    Entries remember when they were stored, so callers can choose between only fresh
+    values (``get``) and whatever is cached along with its age (``get_entry``).
+    ``get_or_load`` serves stale entries immediately and reloads them in the background.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl: Optional[float] = None):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: "OrderedDict[Any, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._revalidating: Set[Any] = set()
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Get a value if it is cached and has not outlived the TTL."""
+        entry = self.get_entry(key)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        if self._ttl is not None and time.time() - stored_at > self._ttl:
+            return None
+        return value
+
+    def get_entry(self, key: Any) -> Optional[Tuple[Any, float]]:
+        """Get ``(value, stored_at)`` for a cached key regardless of its age."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the least recently used entries beyond capacity."""
+        with self._lock:
+            self._entries[key] = (value, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: Any, loader: Callable[[], Any], max_stale: Optional[float] = None) -> Any:
+        """Get a value, loading it on a miss, with stale-while-revalidate semantics.
+
+        A cached value past the TTL is returned as is while ``loader`` runs in the
+        background to replace it, so callers never wait on a refresh. Values older than
+        ``max_stale`` (if given) are treated as misses and loaded synchronously.
+        """
+        entry = self.get_entry(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = time.time() - stored_at
+            if max_stale is None or age <= max_stale:
+                if self._ttl is not None and age > self._ttl:
+                    self.revalidate(key, loader)
+                return value
+
+        value = loader()
+        if value is not None:
+            self.put(key, value)
+        return value
+
+    def revalidate(self, key: Any, loader: Callable[[], Any]) -> None:
+        """Reload a key in the background; concurrent requests for the same key share one reload."""
+        with self._lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def reload() -> None:
+            try:
+                value = loader()
+                if value is not None:
+                    self.put(key, value)
+            except Exception:
+                # Keep serving the stale value; the next stale read retries
+                pass
+            finally:
+                with self._lock:
+                    self._revalidating.discard(key)
+
+        _revalidation_pool.submit(reload)
+
+    def touch(self, key: Any) -> bool:
+        """Mark an entry as fresh without reloading it (e.g. after a 304 Not Modified)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            self._entries[key] = (entry[0], time.time())
+            return True
+
+    def pop(self, key: Any) -> None:
+        """Remove a key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,199 @@
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    from .exceptions import UpstreamUnavailableError
+except ImportError:
+    from exceptions import UpstreamUnavailableError
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Upstream failures recorded by the call running in this context, set by ``track_upstream_failures``
+_call_failures: ContextVar[Optional[List[int]]] = ContextVar("sec_edgar_call_failures", default=None)
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """Whether an exception means SEC is throttling or failing, rather than e.g. a 404.
+
+    Works for both requests and httpx errors without importing either.
+    """
+    if isinstance(error, UpstreamUnavailableError):
+        return False
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is not None:
+        return status == 429 or status >= 500
+    # Connection failures and timeouts carry no response
+    return any(
+        name in ("ConnectionError", "Timeout", "TimeoutException", "TransportError", "NetworkError")
+        for name in (cls.__name__ for cls in type(error).__mro__)
+    )
+
+
+@contextmanager
+def track_upstream_failures() -> Iterator[List[int]]:
+    """Count the upstream failures recorded while the enclosed code runs, in a one-item list.
+
+    The count is scoped to the current context, so failures of concurrent calls on other
+    threads or tasks, and of background reloads, are not attributed to this one.
+    """
+    failures = [0]
+    token = _call_failures.set(failures)
+    try:
+        yield failures
+    finally:
+        _call_failures.reset(token)
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 20.0) -> float:
+    """Exponential backoff with full jitter: a random delay in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """Circuit breaker for SEC traffic in this process.
+
+    After ``failure_threshold`` consecutive upstream failures the breaker opens and
+    every SEC request fails fast with ``UpstreamUnavailableError``. While open, a probe
+    runs after the recovery timeout; a successful probe closes the breaker, a failed one
+    keeps it open with the timeout doubled (up to ``max_recovery_timeout``).
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 15.0,
+        max_recovery_timeout: float = 300.0,
+        probe: Optional[Callable[[], bool]] = None,
+    ):
+        self.failure_threshold = failure_threshold
+        self.base_recovery_timeout = recovery_timeout
+        self.max_recovery_timeout = max_recovery_timeout
+        self.probe = probe
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self.times_opened = 0
+        self.opened_at: Optional[float] = None
+        self.last_failure_at: Optional[float] = None
+        self._recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._probe_timer: Optional[threading.Timer] = None
+
+    def allows_requests(self) -> bool:
+        """Whether SEC requests are currently let through."""
+        return self.state == CLOSED
+
+    def retry_after(self) -> float:
+        """Seconds until the next probe while open, else 0."""
+        if self.state == CLOSED or self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self._recovery_timeout - time.time())
+
+    def before_request(self) -> None:
+        """Raise ``UpstreamUnavailableError`` if requests are currently short-circuited."""
+        if self.state != CLOSED:
+            # A short-circuited request fails the calling tool because of SEC as much as a 5xx does
+            failures = _call_failures.get()
+            if failures is not None:
+                failures[0] += 1
+            raise UpstreamUnavailableError(
+                f"SEC EDGAR is temporarily unavailable (circuit {self.state}); retry in {self.retry_after():.0f}s"
+            )
+
+    def record_success(self) -> None:
+        """Record an SEC response that was not a throttle or server error."""
+        with self._lock:
+            self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        """Record a throttled, failed or unreachable SEC request; opens the breaker at the threshold."""
+        with self._lock:
+            now = time.time()
+            self.consecutive_failures += 1
+            self.total_failures += 1
+            self.last_failure_at = now
+            failures = _call_failures.get()
+            if failures is not None:
+                failures[0] += 1
+            if self.state == CLOSED and self.consecutive_failures >= self.failure_threshold:
+                self._open(now)
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self.opened_at = now
+        self.times_opened += 1
+        logger.warning(f"SEC circuit breaker opened after {self.consecutive_failures} consecutive failures")
+        self._schedule_probe()
+
+    def _schedule_probe(self) -> None:
+        if self.probe is None:
+            # Without a probe, let live traffic through again once the timeout passes
+            self._probe_timer = threading.Timer(self._recovery_timeout, self._close)
+        else:
+            self._probe_timer = threading.Timer(self._recovery_timeout, self._run_probe)
+        self._probe_timer.daemon = True
+        self._probe_timer.start()
+
+    def _run_probe(self) -> None:
+        with self._lock:
+            self.state = HALF_OPEN
+        try:
+            healthy = self.probe()
+        except Exception:
+            healthy = False
+
+        if healthy:
+            self._close()
+            return
+
+        with self._lock:
+            self.state = OPEN
+            self.opened_at = time.time()
+            self._recovery_timeout = min(self.max_recovery_timeout, self._recovery_timeout * 2)
+            self._schedule_probe()
+
+    def _close(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self._recovery_timeout = self.base_recovery_timeout
+        logger.warning("SEC circuit breaker closed")
+
+    def status(self) -> Dict[str, Any]:
+        """Get the breaker state and failure counters."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "total_failures": self.total_failures,
+            "times_opened": self.times_opened,
+            "retry_after_seconds": round(self.retry_after(), 1),
+        }
+
+
+_circuit_breaker: Optional[CircuitBreaker] = None
+_circuit_breaker_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get the process-wide breaker guarding all SEC requests."""
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        with _circuit_breaker_lock:
+            if _circuit_breaker is None:
+                _circuit_breaker = CircuitBreaker(
+                    failure_threshold=int(os.getenv("SEC_EDGAR_BREAKER_THRESHOLD", 5)),
+                    recovery_timeout=float(os.getenv("SEC_EDGAR_BREAKER_RECOVERY", 15)),
+                )
+    return _circuit_breaker
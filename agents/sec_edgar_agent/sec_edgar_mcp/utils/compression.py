@@ -0,0 +1,205 @@
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Content types that are already compressed or must not be buffered
+_SKIP_CONTENT_TYPES = ("image/", "video/", "audio/", "application/zip", "application/gzip", "application/zstd")
+
+
+class _StreamCompressor:
+    """Incremental gzip or zstd compressor that can flush after every chunk."""
+
+    def __init__(self, encoding: str, gzip_level: int, zstd_level: int):
+        if encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=zstd_level).compressobj()
+            self._flush_mode = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            self._finish_mode = zstandard.COMPRESSOBJ_FLUSH_FINISH
+        else:
+            # wbits=31 selects the gzip container
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+            self._flush_mode = zlib.Z_SYNC_FLUSH
+            self._finish_mode = zlib.Z_FINISH
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        out = self._compressor.compress(data)
+        return out + self._compressor.flush(self._flush_mode) if flush else out
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(self._finish_mode)
+
+
+def compress_bytes(data: bytes, encoding: str, gzip_level: int = 6, zstd_level: int = 3) -> bytes:
+    """Compress a complete body with the given content encoding."""
+    compressor = _StreamCompressor(encoding, gzip_level, zstd_level)
+    return compressor.compress(data) + compressor.finish()
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick zstd or gzip from an Accept-Encoding header, honouring q-values (zstd wins ties)."""
+    preferences: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        preferences[token] = quality
+
+    wildcard = preferences.get("*", 0.0)
+    candidates = ["zstd", "gzip"] if zstandard is not None else ["gzip"]
+    best = None
+    best_quality = 0.0
+    for encoding in candidates:
+        quality = preferences.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """ASGI middleware adding negotiated gzip/zstd compression to HTTP responses.
+
+    Complete responses are compressed when they reach ``minimum_size`` bytes. Streamed
+    responses, including MCP's ``text/event-stream`` responses, are compressed
+    incrementally and flushed after every chunk so each event reaches the client
+    without waiting for the stream to end.
+    """
+
+    def __init__(self, app: Callable, minimum_size: int = 1024, gzip_level: int = 6, zstd_level: int = 3):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.zstd_level = zstd_level
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = ""
+        for name, value in scope.get("headers", []):
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+
+        encoding = negotiate_encoding(accept_encoding)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(send, encoding, self.minimum_size, self.gzip_level, self.zstd_level)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    """Wraps ``send`` for one response and decides between buffered, streamed and passthrough modes."""
+
+    def __init__(self, send: Callable, encoding: str, minimum_size: int, gzip_level: int, zstd_level: int):
+        self._send = send
+        self._encoding = encoding
+        self._minimum_size = minimum_size
+        self._gzip_level = gzip_level
+        self._zstd_level = zstd_level
+        self._start_message: Optional[Dict[str, Any]] = None
+        self._mode: Optional[str] = None
+        self._compressor: Optional[_StreamCompressor] = None
+
+    async def send(self, message: Dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            self._start_message = message
+            headers = _Headers(message.get("headers", []))
+            content_type = headers.get("content-type", "")
+            if headers.get("content-encoding") or content_type.startswith(_SKIP_CONTENT_TYPES):
+                self._mode = "passthrough"
+                await self._send(message)
+            elif content_type.startswith("text/event-stream"):
+                # Event streams are sent incrementally; compress and flush each event
+                await self._start_stream()
+            return
+
+        if message["type"] != "http.response.body" or self._mode == "passthrough":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._mode is None:
+            if not more_body:
+                await self._send_complete(body)
+                return
+            await self._start_stream()
+
+        await self._send(
+            {
+                "type": "http.response.body",
+                "body": self._compressor.compress(body, flush=True) if more_body else self._finish(body),
+                "more_body": more_body,
+            }
+        )
+
+    async def _send_complete(self, body: bytes) -> None:
+        self._mode = "complete"
+        start = self._start_message
+        if len(body) < self._minimum_size:
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        compressed = compress_bytes(body, self._encoding, self._gzip_level, self._zstd_level)
+        headers = _Headers(start.get("headers", []))
+        headers.set("content-encoding", self._encoding)
+        headers.set("content-length", str(len(compressed)))
+        headers.add_vary()
+        await self._send({**start, "headers": headers.raw})
+        await self._send({"type": "http.response.body", "body": compressed})
+
+    async def _start_stream(self) -> None:
+        self._mode = "stream"
+        self._compressor = _StreamCompressor(self._encoding, self._gzip_level, self._zstd_level)
+        start = self._start_message
+        headers = _Headers(start.get("headers", []))
+        headers.set("content-encoding", self._encoding)
+        headers.remove("content-length")
+        headers.add_vary()
+        await self._send({**start, "headers": headers.raw})
+
+    def _finish(self, body: bytes) -> bytes:
+        return self._compressor.compress(body) + self._compressor.finish()
+
+
+class _Headers:
+    """Minimal mutable view over ASGI raw headers."""
+
+    def __init__(self, raw: List[Tuple[bytes, bytes]]):
+        self.raw = list(raw)
+
+    def get(self, name: str, default: str = "") -> str:
+        key = name.encode("latin-1")
+        for header, value in self.raw:
+            if header.lower() == key:
+                return value.decode("latin-1")
+        return default
+
+    def remove(self, name: str) -> None:
+        key = name.encode("latin-1")
+        self.raw = [(header, value) for header, value in self.raw if header.lower() != key]
+
+    def set(self, name: str, value: str) -> None:
+        self.remove(name)
+        self.raw.append((name.encode("latin-1"), value.encode("latin-1")))
+
+    def add_vary(self) -> None:
+        vary = self.get("vary")
+        if "accept-encoding" not in vary.lower():
+            self.set("vary", f"{vary}, Accept-Encoding" if vary else "Accept-Encoding")
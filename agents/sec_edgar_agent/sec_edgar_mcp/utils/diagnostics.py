@@ -0,0 +1,82 @@
+import re
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+# Dependencies that dominate cold start when they are imported before the first request
+HEAVY_MODULES = ("edgar", "pandas", "numpy", "pyarrow", "bs4", "lxml", "requests", "httpx")
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def loaded_heavy_modules() -> List[str]:
+    """List the heavy dependencies already imported in this process."""
+    return [name for name in HEAVY_MODULES if name in sys.modules]
+
+
+def startup_report(import_started: float, import_finished: float) -> Dict[str, Any]:
+    """Summarize startup cost: time to import the server and which heavy modules that pulled in."""
+    return {
+        "server_import_ms": round((import_finished - import_started) * 1000, 1),
+        "process_cpu_ms": round(time.process_time() * 1000, 1),
+        "heavy_modules_loaded": loaded_heavy_modules(),
+    }
+
+
+def import_profile(module: str = "sec_edgar_mcp.server", top: int = 15) -> Dict[str, Any]:
+    """Profile importing a module in a fresh interpreter using ``python -X importtime``.
+
+    Returns the total import time and the ``top`` slowest top-level packages by
+    cumulative time, so regressions in cold start can be traced to a dependency.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    # importtime lists children before their parent, so entries are buffered until the
+    # top-level (indent 1) line they belong to shows up
+    packages: Dict[str, int] = {}
+    loaded = set()
+    pending: List[tuple] = []
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative_us, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        if indent > 1:
+            pending.append((indent, name, cumulative_us))
+            continue
+        if name == module:
+            total_us = cumulative_us
+            for child_indent, child, child_us in pending:
+                package = child.split(".")[0]
+                loaded.add(package)
+                if child_indent == 3:
+                    packages[package] = packages.get(package, 0) + child_us
+        pending = []
+
+    slowest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    return {
+        "module": module,
+        "success": result.returncode == 0,
+        "total_ms": round(total_us / 1000, 1),
+        "slowest_packages": [{"package": name, "cumulative_ms": round(us / 1000, 1)} for name, us in slowest],
+        "heavy_modules": [name for name in HEAVY_MODULES if name in loaded],
+    }
+
+
+def format_import_profile(profile: Dict[str, Any]) -> str:
+    """Render an import profile as a short text report."""
+    lines = [f"Import profile for {profile['module']}: {profile['total_ms']:.1f} ms"]
+    for entry in profile["slowest_packages"]:
+        lines.append(f"  {entry['package']:<24} {entry['cumulative_ms']:8.1f} ms")
+    if profile["heavy_modules"]:
+        lines.append(f"Heavy modules imported at startup: {', '.join(profile['heavy_modules'])}")
+    if not profile["success"]:
+        lines.append("Import failed; see stderr of `python -X importtime` for details")
+    return "\n".join(lines)
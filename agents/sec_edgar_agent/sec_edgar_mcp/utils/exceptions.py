@@ -26,3 +26,9 @@ class ParseError(SECEdgarMCPError):
     """Raised when parsing fails."""
 
     pass
+
+
+class UpstreamUnavailableError(APIError):
+    """Raised when SEC requests are short-circuited because the upstream is failing."""
+
+    pass
@@ -0,0 +1,106 @@
+import asyncio
+import os
+import struct
+import threading
+import time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms fall back to the in-process lock only
+    fcntl = None
+
+try:
+    from ..config import get_cache_dir
+except ImportError:
+    from config import get_cache_dir
+
+# SEC fair-access policy allows 10 requests/second per client; stay just under it by default
+DEFAULT_REQUESTS_PER_SECOND = 9.0
+
+_STATE = struct.Struct("<dd")  # available tokens, wall-clock time of the last refill
+
+
+class SharedRateLimiter:
+    """Token bucket whose state lives in a small file shared by every process using it.
+
+    Each acquisition takes an exclusive ``flock`` on the state file, refills the bucket
+    from the elapsed time, and either takes a token or computes how long to wait. All
+    workers pointing at the same file therefore share one request budget. The file is
+    reopened for every acquisition because ``flock`` locks belong to the open file
+    description, which forked workers would otherwise share.
+    """
+
+    def __init__(self, path: Optional[str] = None, rate: Optional[float] = None, burst: Optional[float] = None):
+        self.path = path or os.path.join(get_cache_dir(), "sec_rate_limit.state")
+        self.rate = rate or float(os.getenv("SEC_EDGAR_MAX_REQUESTS_PER_SECOND", DEFAULT_REQUESTS_PER_SECOND))
+        self.burst = burst or self.rate
+        self._lock = threading.Lock()
+
+    def acquire(self, weight: float = 1.0) -> float:
+        """Block until ``weight`` tokens are available and take them. Returns the time spent waiting."""
+        waited = 0.0
+        while True:
+            delay = self._take(weight)
+            if delay <= 0:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    async def acquire_async(self, weight: float = 1.0) -> float:
+        """Async variant of ``acquire`` that sleeps without blocking the event loop."""
+        waited = 0.0
+        while True:
+            delay = self._take(weight)
+            if delay <= 0:
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
+
+    # pyrate_limiter-compatible entry points, used when installed as edgartools' limiter
+    def try_acquire(self, name: str = "", weight: int = 1) -> bool:
+        self.acquire(weight)
+        return True
+
+    async def try_acquire_async(self, name: str = "", weight: int = 1) -> bool:
+        await self.acquire_async(weight)
+        return True
+
+    def _take(self, weight: float) -> float:
+        """Take tokens if available; otherwise return the seconds until they will be."""
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+
+                now = time.time()
+                data = os.pread(fd, _STATE.size, 0)
+                if len(data) == _STATE.size:
+                    tokens, updated = _STATE.unpack(data)
+                    tokens = min(self.burst, tokens + max(0.0, now - updated) * self.rate)
+                else:
+                    tokens = self.burst
+
+                if tokens >= weight:
+                    os.pwrite(fd, _STATE.pack(tokens - weight, now), 0)
+                    return 0.0
+
+                os.pwrite(fd, _STATE.pack(tokens, now), 0)
+                return (weight - tokens) / self.rate
+            finally:
+                os.close(fd)
+
+
+_rate_limiter: Optional[SharedRateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> SharedRateLimiter:
+    """Get the process-wide SEC request limiter backed by the shared cache directory."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = SharedRateLimiter()
+    return _rate_limiter
@@ -0,0 +1,209 @@
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+try:
+    from .circuit_breaker import backoff_delay, get_circuit_breaker, is_upstream_failure
+    from .rate_limit import get_rate_limiter
+except ImportError:
+    from circuit_breaker import backoff_delay, get_circuit_breaker, is_upstream_failure
+    from rate_limit import get_rate_limiter
+
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+# Retries after the first attempt for throttling (429), 5xx and connection errors
+DEFAULT_MAX_RETRIES = int(os.getenv("SEC_EDGAR_MAX_RETRIES", 3))
+
+# Cheap request used to decide whether an open circuit can close
+PROBE_URL = "https://www.sec.gov/files/company_tickers_exchange.json"
+
+_local = threading.local()
+
+
+def _session() -> "requests.Session":
+    """Get this thread's pooled session (``requests.Session`` is not safe to share across threads)."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        import requests
+
+        session = _local.session = requests.Session()
+    return session
+
+
+def _user_agent_headers(headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    request_headers = {"User-Agent": os.getenv("SEC_EDGAR_USER_AGENT", "SEC EDGAR MCP/1.0")}
+    if headers:
+        request_headers.update(headers)
+    return request_headers
+
+
+def _retry_after(response: "requests.Response") -> float:
+    try:
+        return float(response.headers.get("Retry-After", 0))
+    except ValueError:
+        return 0.0
+
+
+def sec_get(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 30,
+    max_retries: Optional[int] = None,
+    **kwargs: Any,
+) -> "requests.Response":
+    """GET a sec.gov URL within the shared request budget, with retries and the circuit breaker.
+
+    Every direct request to SEC should go through here so that all threads and worker
+    processes stay within the fair-access limit together. Throttling (429), 5xx and
+    connection errors are retried with exponential backoff and jitter (honouring
+    ``Retry-After``) and counted by the circuit breaker; while it is open this raises
+    ``UpstreamUnavailableError`` without contacting SEC. The last failed response is
+    returned as is so callers keep using ``raise_for_status``.
+    """
+    import requests
+
+    breaker = _breaker()
+    request_headers = _user_agent_headers(headers)
+    retries = DEFAULT_MAX_RETRIES if max_retries is None else max_retries
+
+    for attempt in range(retries + 1):
+        breaker.before_request()
+        get_rate_limiter().acquire()
+        delay = backoff_delay(attempt)
+        try:
+            response = _session().get(url, headers=request_headers, timeout=timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            breaker.record_failure()
+            if attempt == retries:
+                raise
+        else:
+            if response.status_code != 429 and response.status_code < 500:
+                breaker.record_success()
+                return response
+            breaker.record_failure()
+            if attempt == retries:
+                return response
+            delay = max(delay, _retry_after(response))
+            # Return the connection to the pool; with ``stream=True`` it stays checked out until closed
+            response.close()
+        time.sleep(delay)
+
+
+def _probe() -> bool:
+    """Check whether SEC is answering normally again."""
+    try:
+        get_rate_limiter().acquire()
+        response = _session().head(PROBE_URL, headers=_user_agent_headers(None), timeout=10)
+        return response.status_code < 400
+    except Exception:
+        return False
+
+
+def _breaker():
+    breaker = get_circuit_breaker()
+    if breaker.probe is None:
+        breaker.probe = _probe
+    return breaker
+
+
+class _EdgarRequestGate:
+    """pyrate_limiter-compatible limiter for edgartools: checks the circuit, then takes a shared token."""
+
+    def try_acquire(self, name: str = "", weight: int = 1) -> bool:
+        _breaker().before_request()
+        return get_rate_limiter().try_acquire(name, weight)
+
+    async def try_acquire_async(self, name: str = "", weight: int = 1) -> bool:
+        _breaker().before_request()
+        return await get_rate_limiter().try_acquire_async(name, weight)
+
+
+def _record_edgar_outcome(response: Any = None, error: Optional[BaseException] = None) -> None:
+    """Count an edgartools request in the circuit breaker, as ``sec_get`` counts its own.
+
+    Responses served from edgartools' HTTP cache say nothing about SEC and are not counted.
+    """
+    breaker = _breaker()
+    if error is not None:
+        if is_upstream_failure(error):
+            breaker.record_failure()
+    elif response.status_code == 429 or response.status_code >= 500:
+        breaker.record_failure()
+    elif not (response.extensions.get("from_cache") or response.extensions.get("hishel_from_cache")):
+        breaker.record_success()
+
+
+def _breaker_transports():
+    """httpx transport wrappers that report each edgartools request's outcome to the circuit breaker."""
+    import httpx
+
+    class BreakerTransport(httpx.BaseTransport):
+        def __init__(self, transport: httpx.BaseTransport):
+            self._transport = transport
+
+        def handle_request(self, request: httpx.Request) -> httpx.Response:
+            try:
+                response = self._transport.handle_request(request)
+            except Exception as e:
+                _record_edgar_outcome(error=e)
+                raise
+            _record_edgar_outcome(response)
+            return response
+
+        def close(self) -> None:
+            self._transport.close()
+
+    class AsyncBreakerTransport(httpx.AsyncBaseTransport):
+        def __init__(self, transport: httpx.AsyncBaseTransport):
+            self._transport = transport
+
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except Exception as e:
+                _record_edgar_outcome(error=e)
+                raise
+            _record_edgar_outcome(response)
+            return response
+
+        async def aclose(self) -> None:
+            await self._transport.aclose()
+
+    return BreakerTransport, AsyncBreakerTransport
+
+
+def install_edgar_rate_limiter() -> bool:
+    """Route edgartools' HTTP requests through the shared SEC request budget and circuit breaker.
+
+    edgartools throttles each process on its own; with several workers that would
+    multiply the request rate. Swapping in the shared limiter keeps the total within
+    budget. Every client edgartools creates afterwards also has its transport wrapped
+    so that throttling, 5xx and connection errors on any of its requests (submissions,
+    filing documents, XBRL, attachments) count towards opening the circuit. Returns
+    False if this edgartools version does not expose its HTTP manager.
+    """
+    try:
+        from edgar import httpclient
+
+        http_mgr = httpclient.HTTP_MGR
+        http_mgr.rate_limiter = _EdgarRequestGate()
+
+        breaker_transport, async_breaker_transport = _breaker_transports()
+        get_transport = http_mgr._get_transport
+        get_async_transport = http_mgr._get_async_transport
+        http_mgr._get_transport = lambda *args, **kwargs: breaker_transport(get_transport(*args, **kwargs))
+        http_mgr._get_async_transport = lambda *args, **kwargs: async_breaker_transport(
+            get_async_transport(*args, **kwargs)
+        )
+
+        # Clients capture the limiter and transport when created; drop any that already exist
+        http_mgr.close()
+        return True
+    except Exception as e:
+        logger.warning(f"Could not install shared rate limiter for edgartools: {str(e)}")
+        return False
@@ -0,0 +1,66 @@
+import functools
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict
+
+try:
+    from .cache import MemoryCache
+    from .circuit_breaker import get_circuit_breaker, track_upstream_failures
+except ImportError:
+    from cache import MemoryCache
+    from circuit_breaker import get_circuit_breaker, track_upstream_failures
+
+# Last successful result per tool call, kept for serving while SEC is unavailable
+_results = MemoryCache(max_entries=int(os.getenv("SEC_EDGAR_STALE_RESULTS", 256)))
+
+
+def _call_key(name: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+    return name + json.dumps([args, kwargs], sort_keys=True, default=str)
+
+
+def _stale_copy(result: Dict[str, Any], stored_at: float, reason: str) -> Dict[str, Any]:
+    stale = dict(result)
+    stale["stale"] = True
+    stale["cached_at"] = datetime.fromtimestamp(stored_at, timezone.utc).isoformat()
+    stale["cache_age_seconds"] = round(time.time() - stored_at, 1)
+    stale["stale_reason"] = reason
+    return stale
+
+
+def serve_stale_on_error(tool: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+    """Serve a tool's last successful result, marked with its age, when SEC is failing.
+
+    While the circuit breaker is open the tool is not called at all. When a call fails
+    and SEC errors were recorded by that call itself, the cached result is returned
+    instead of the failure. Successful results are remembered per tool and arguments.
+    """
+
+    @functools.wraps(tool)
+    def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        breaker = get_circuit_breaker()
+        key = _call_key(tool.__name__, args, kwargs)
+
+        if not breaker.allows_requests():
+            entry = _results.get_entry(key)
+            if entry is not None:
+                return _stale_copy(entry[0], entry[1], "SEC EDGAR is temporarily unavailable")
+            return {
+                "success": False,
+                "error": f"SEC EDGAR is temporarily unavailable; retry in {breaker.retry_after():.0f} seconds",
+                "retry_after_seconds": round(breaker.retry_after(), 1),
+            }
+
+        with track_upstream_failures() as failures:
+            result = tool(*args, **kwargs)
+
+        if isinstance(result, dict) and result.get("success") is False:
+            entry = _results.get_entry(key) if failures[0] else None
+            if entry is not None:
+                return _stale_copy(entry[0], entry[1], result.get("error", "SEC EDGAR request failed"))
+        elif isinstance(result, dict):
+            _results.put(key, result)
+        return result
+
+    return wrapper
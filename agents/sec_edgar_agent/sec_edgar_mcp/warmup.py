@@ -0,0 +1,164 @@
+"""
+Background warmup of the caches for a watchlist of frequently requested companies.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from .core.client import EdgarClient
+
+# Steps run for every watched company, in order
+WARMUP_STEPS = ("ticker_map", "submissions", "company_facts", "latest_10k_xbrl")
+
+DEFAULT_CONCURRENCY = 4
+
+# After this many seconds /health reports ready even if warmup has not finished
+DEFAULT_READY_TIMEOUT = 180.0
+
+MAX_RECORDED_ERRORS = 20
+
+
+def load_watchlist(path: str) -> List[str]:
+    """Read tickers or CIKs from a watchlist file.
+
+    Entries may be separated by newlines, commas or whitespace; ``#`` starts a comment.
+    Duplicates are dropped while keeping the file order.
+    """
+    identifiers: List[str] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0]
+            for entry in line.replace(",", " ").split():
+                entry = entry.strip().upper()
+                if entry and entry not in identifiers:
+                    identifiers.append(entry)
+    return identifiers
+
+
+class Warmup:
+    """Preloads ticker map, submissions, companyfacts and latest 10-K XBRL for a watchlist.
+
+    Runs on a daemon thread so the server keeps accepting traffic; ``is_ready`` backs
+    the readiness gate on ``/health`` and ``progress`` the metrics endpoint.
+    """
+
+    def __init__(
+        self,
+        identifiers: List[str],
+        client: Optional[EdgarClient] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ready_timeout: float = DEFAULT_READY_TIMEOUT,
+    ):
+        self.identifiers = identifiers
+        self.client = client or EdgarClient()
+        self.concurrency = max(1, concurrency)
+        self.ready_timeout = ready_timeout
+        self.status = "pending"
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.completed = 0
+        self.failed = 0
+        self.errors: List[Dict[str, str]] = []
+        self.step_counts: Dict[str, int] = {step: 0 for step in WARMUP_STEPS}
+        self.step_seconds: Dict[str, float] = {step: 0.0 for step in WARMUP_STEPS}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start warming up in the background."""
+        if self._thread is not None:
+            return
+        self.status = "running"
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name="sec-edgar-warmup", daemon=True)
+        self._thread.start()
+
+    def is_ready(self) -> bool:
+        """Whether the server should report ready: warmup finished or ran past the timeout."""
+        if self.status == "complete":
+            return True
+        return self.started_at is not None and time.time() - self.started_at > self.ready_timeout
+
+    def progress(self) -> Dict[str, Any]:
+        """Get warmup progress metrics."""
+        with self._lock:
+            end = self.finished_at or time.time()
+            return {
+                "status": self.status,
+                "ready": self.is_ready(),
+                "companies_total": len(self.identifiers),
+                "companies_completed": self.completed,
+                "companies_failed": self.failed,
+                "elapsed_seconds": round(end - self.started_at, 3) if self.started_at else 0.0,
+                "steps": {
+                    step: {"count": self.step_counts[step], "seconds": round(self.step_seconds[step], 3)}
+                    for step in WARMUP_STEPS
+                },
+                "errors": list(self.errors),
+            }
+
+    def _run(self) -> None:
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="sec-edgar-warmup") as pool:
+                list(pool.map(self._warm_company, self.identifiers))
+        finally:
+            with self._lock:
+                self.status = "complete"
+                self.finished_at = time.time()
+
+    def _warm_company(self, identifier: str) -> None:
+        step = "ticker_map"
+        try:
+            with self._timed(step):
+                cik = self.client.resolve_cik(identifier)
+
+            step = "submissions"
+            with self._timed(step):
+                company = self.client.get_company(cik)
+
+            step = "company_facts"
+            with self._timed(step):
+                self.client.get_company_facts(company)
+
+            step = "latest_10k_xbrl"
+            with self._timed(step):
+                filing = self.client.latest_filing(company, "10-K")
+                if filing is not None:
+                    self.client.get_filing_xbrl(filing)
+
+            with self._lock:
+                self.completed += 1
+        except Exception as e:
+            with self._lock:
+                self.failed += 1
+                if len(self.errors) < MAX_RECORDED_ERRORS:
+                    self.errors.append({"identifier": identifier, "step": step, "error": str(e)})
+
+    @contextmanager
+    def _timed(self, step: str) -> Iterator[None]:
+        """Add the duration of one step to the step totals."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.step_counts[step] += 1
+                self.step_seconds[step] += elapsed
+
+
+def warmup_from_env() -> Optional[Warmup]:
+    """Create a warmup for the watchlist named by SEC_EDGAR_WATCHLIST, if one is configured."""
+    path = os.getenv("SEC_EDGAR_WATCHLIST")
+    if not path:
+        return None
+
+    return Warmup(
+        load_watchlist(path),
+        concurrency=int(os.getenv("SEC_EDGAR_WARMUP_CONCURRENCY", DEFAULT_CONCURRENCY)),
+        ready_timeout=float(os.getenv("SEC_EDGAR_WARMUP_READY_TIMEOUT", DEFAULT_READY_TIMEOUT)),
+    )